@@ -15,11 +15,14 @@ from typing import (
 
 from . import abc, typing
 from ._version import __version__
+from .hedgestats import HedgeStats
 from .internal.utils import alias
 from .notification import Notification
 from .observable import ConnectableObservable, GroupedObservable, Observable
 from .observer import Observer
 from .pipe import compose, pipe
+from .recordbatch import RecordBatch
+from .retrybudget import RetryBudget
 from .subject import Subject
 
 _T = TypeVar("_T")
@@ -1310,6 +1313,7 @@ __all__ = [
     "from_future",
     "from_iterable",
     "GroupedObservable",
+    "HedgeStats",
     "never",
     "Notification",
     "on_error_resume_next",
@@ -1319,7 +1323,9 @@ __all__ = [
     "return_value",
     "pipe",
     "range",
+    "RecordBatch",
     "repeat_value",
+    "RetryBudget",
     "Subject",
     "start",
     "start_async",
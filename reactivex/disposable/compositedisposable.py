@@ -1,18 +1,26 @@
 from threading import RLock
-from typing import Any, List
+from typing import Any, Dict, List
 
 from reactivex import abc
 
 
 class CompositeDisposable(abc.DisposableBase):
     """Represents a group of disposable resources that are disposed
-    together"""
+    together.
+
+    The disposables are kept in an insertion ordered dict, mapping
+    each disposable to the number of times it was added, so that add,
+    remove and contains are O(1) however large the group. Disposables
+    are disposed in the order they were first added."""
 
     def __init__(self, *args: Any):
         if args and isinstance(args[0], list):
-            self.disposable: List[abc.DisposableBase] = args[0]
-        else:
-            self.disposable = list(args)
+            args = tuple(args[0])
+
+        self.disposable: Dict[abc.DisposableBase, int] = {}
+        for item in args:
+            self.disposable[item] = self.disposable.get(item, 0) + 1
+        self.count = len(args)
 
         self.is_disposed = False
         self.lock = RLock()
@@ -30,7 +38,8 @@ class CompositeDisposable(abc.DisposableBase):
             if self.is_disposed:
                 should_dispose = True
             else:
-                self.disposable.append(item)
+                self.disposable[item] = self.disposable.get(item, 0) + 1
+                self.count += 1
 
         if should_dispose:
             item.dispose()
@@ -44,8 +53,13 @@ class CompositeDisposable(abc.DisposableBase):
 
         should_dispose = False
         with self.lock:
-            if item in self.disposable:
-                self.disposable.remove(item)
+            count = self.disposable.get(item)
+            if count:
+                if count == 1:
+                    del self.disposable[item]
+                else:
+                    self.disposable[item] = count - 1
+                self.count -= 1
                 should_dispose = True
 
         if should_dispose:
@@ -62,8 +76,9 @@ class CompositeDisposable(abc.DisposableBase):
 
         with self.lock:
             self.is_disposed = True
-            current_disposable = self.disposable
-            self.disposable = []
+            current_disposable = self.to_list()
+            self.disposable = {}
+            self.count = 0
 
         for disp in current_disposable:
             disp.dispose()
@@ -74,8 +89,9 @@ class CompositeDisposable(abc.DisposableBase):
         CompositeDisposable."""
 
         with self.lock:
-            current_disposable = self.disposable
-            self.disposable = []
+            current_disposable = self.to_list()
+            self.disposable = {}
+            self.count = 0
 
         for disposable in current_disposable:
             disposable.dispose()
@@ -93,11 +109,13 @@ class CompositeDisposable(abc.DisposableBase):
         return item in self.disposable
 
     def to_list(self) -> List[abc.DisposableBase]:
-        return self.disposable[:]
+        return [
+            item for item, count in self.disposable.items() for _ in range(count)
+        ]
 
     def __len__(self) -> int:
-        return len(self.disposable)
+        return self.count
 
     @property
     def length(self) -> int:
-        return len(self.disposable)
+        return self.count
@@ -0,0 +1,43 @@
+from threading import Lock
+
+
+class HedgeStats:
+    """Counters of hedged requests, shared by the subscriptions of the
+    hedge operators it is passed to.
+
+    Examples:
+        >>> stats = HedgeStats()
+        >>> res = source.pipe(ops.hedge(call, 0.05, stats=stats))
+        >>> stats.hedge_win_rate
+        0.02
+    """
+
+    def __init__(self) -> None:
+        self.requests = 0
+        """Number of requests"""
+        self.hedges = 0
+        """Number of extra attempts started"""
+        self.hedge_wins = 0
+        """Number of requests answered first by an extra attempt"""
+        self.lock = Lock()
+
+    def add_request(self) -> None:
+        with self.lock:
+            self.requests += 1
+
+    def add_hedge(self) -> None:
+        with self.lock:
+            self.hedges += 1
+
+    def add_hedge_win(self) -> None:
+        with self.lock:
+            self.hedge_wins += 1
+
+    @property
+    def hedge_win_rate(self) -> float:
+        """Fraction of the requests answered first by an extra attempt"""
+
+        return self.hedge_wins / self.requests if self.requests else 0.0
+
+
+__all__ = ["HedgeStats"]
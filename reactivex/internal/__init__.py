@@ -6,7 +6,9 @@ from .exceptions import (
     DisposedException,
     SequenceContainsNoElementsError,
 )
+from .lrucache import LRUCache
 from .priorityqueue import PriorityQueue
+from .ringbuffer import RingBuffer
 from .utils import NotSet, add_ref, alias, infinite
 
 __all__ = [
@@ -25,5 +27,7 @@ __all__ = [
     "UTC_ZERO",
     "synchronized",
     "default_thread_factory",
+    "LRUCache",
     "PriorityQueue",
+    "RingBuffer",
 ]
@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from typing import Generic, Optional, Tuple, Type, TypeVar, Union
+
+from .utils import NotSet
+
+_TKey = TypeVar("_TKey")
+_TValue = TypeVar("_TValue")
+
+
+class LRUCache(Generic[_TKey, _TValue]):
+    """Least recently used cache with an optional time to live. Times
+    are given by the caller, in seconds, so the cache follows the clock
+    of the scheduler it is used with. Note that methods aren't
+    thread-safe."""
+
+    __slots__ = ("max_size", "ttl", "items")
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.items: "OrderedDict[_TKey, Tuple[float, _TValue]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, key: _TKey, now: float = 0.0) -> Union[_TValue, Type[NotSet]]:
+        """Returns the value for key and marks it as recently used, or
+        NotSet if the key is missing or has expired."""
+
+        try:
+            stored, value = self.items[key]
+        except KeyError:
+            return NotSet
+
+        if self.ttl is not None and now - stored >= self.ttl:
+            del self.items[key]
+            return NotSet
+
+        self.items.move_to_end(key)
+        return value
+
+    def set(self, key: _TKey, value: _TValue, now: float = 0.0) -> None:
+        """Stores value for key, evicting the least recently used item
+        if the cache is full."""
+
+        if self.max_size <= 0:
+            return
+
+        self.items[key] = (now, value)
+        self.items.move_to_end(key)
+        if len(self.items) > self.max_size:
+            self.items.popitem(last=False)
+
+    def clear(self) -> None:
+        self.items.clear()
+
+
+__all__ = ["LRUCache"]
@@ -0,0 +1,71 @@
+from collections import deque
+from typing import Deque, Generic, Iterator, Optional, Tuple, Type, TypeVar, Union
+
+from .utils import NotSet
+
+_T1 = TypeVar("_T1")
+
+
+class RingBuffer(Generic[_T1]):
+    """Fixed capacity FIFO buffer for sliding window operators. Appending
+    to a full buffer evicts the oldest item in O(1). Without a capacity
+    the buffer is unbounded and items are evicted with popleft. Note that
+    methods aren't thread-safe."""
+
+    __slots__ = ("capacity", "items")
+
+    def __init__(self, capacity: Optional[int] = None) -> None:
+        self.capacity = capacity
+        self.items: Deque[_T1] = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        """Returns number of items in the buffer"""
+
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[_T1]:
+        return iter(self.items)
+
+    def __getitem__(self, index: int) -> _T1:
+        return self.items[index]
+
+    @property
+    def is_full(self) -> bool:
+        """True if appending another item will evict the oldest one"""
+
+        return self.capacity is not None and len(self.items) == self.capacity
+
+    def append(self, item: _T1) -> Union[_T1, Type[NotSet]]:
+        """Adds item to the buffer. Returns the evicted oldest item if
+        the buffer was full, else NotSet."""
+
+        if not self.capacity:
+            if self.capacity == 0:
+                return item
+        elif len(self.items) == self.capacity:
+            evicted = self.items[0]
+            self.items.append(item)
+            return evicted
+
+        self.items.append(item)
+        return NotSet
+
+    def peek(self) -> _T1:
+        """Returns oldest item without removing it"""
+
+        return self.items[0]
+
+    def popleft(self) -> _T1:
+        """Returns and removes the oldest item"""
+
+        return self.items.popleft()
+
+    def snapshot(self) -> Tuple[_T1, ...]:
+        """Returns the buffered items, oldest first, as a tuple"""
+
+        return tuple(self.items)
+
+    def clear(self) -> None:
+        """Remove all items from the buffer."""
+
+        self.items.clear()
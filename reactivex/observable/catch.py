@@ -1,3 +1,4 @@
+from threading import Lock
 from typing import Any, Iterable, Optional, TypeVar
 
 from reactivex import Observable, abc
@@ -40,16 +41,22 @@ def catch_with_iterable_(sources: Iterable[Observable[_T]]) -> Observable[_T]:
         cancelable = SerialDisposable()
         last_exception = None
         is_disposed = False
+        lock = Lock()
+        is_subscribing = False
+        has_failed = False
 
-        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
-            def on_error(exn: Exception) -> None:
-                nonlocal last_exception
-                last_exception = exn
-                cancelable.disposable = _scheduler.schedule(action)
+        def on_error(exn: Exception) -> None:
+            nonlocal last_exception, has_failed
+
+            last_exception = exn
+            with lock:
+                if is_subscribing:
+                    has_failed = True
+                    return
 
-            if is_disposed:
-                return
+            cancelable.disposable = _scheduler.schedule(action)
 
+        def step() -> None:
             try:
                 current = next(sources_)
             except StopIteration:
@@ -69,6 +76,22 @@ def catch_with_iterable_(sources: Iterable[Observable[_T]]) -> Observable[_T]:
                     scheduler=scheduler_,
                 )
 
+        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+            # Loops instead of recursing when a source fails while it
+            # is being subscribed to, see concat_with_iterable.
+            nonlocal is_subscribing, has_failed
+
+            while not is_disposed:
+                with lock:
+                    is_subscribing = True
+                    has_failed = False
+
+                step()
+                with lock:
+                    is_subscribing = False
+                    if not has_failed:
+                        return
+
         cancelable.disposable = _scheduler.schedule(action)
 
         def dispose() -> None:
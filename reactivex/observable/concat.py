@@ -1,4 +1,5 @@
-from typing import Any, Iterable, Optional, TypeVar
+from threading import Lock
+from typing import Any, Iterable, Optional, Sequence, TypeVar
 
 from reactivex import Observable, abc
 from reactivex.disposable import (
@@ -7,6 +8,7 @@ from reactivex.disposable import (
     SerialDisposable,
     SingleAssignmentDisposable,
 )
+from reactivex.observable.scalarobservable import inline_items
 from reactivex.scheduler import CurrentThreadScheduler
 
 _T = TypeVar("_T")
@@ -23,14 +25,12 @@ def concat_with_iterable_(sources: Iterable[Observable[_T]]) -> Observable[_T]:
         subscription = SerialDisposable()
         cancelable = SerialDisposable()
         is_disposed = False
+        lock = Lock()
+        is_subscribing = False
+        is_done = False
 
-        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
-            nonlocal is_disposed
-            if is_disposed:
-                return
-
-            def on_completed() -> None:
-                cancelable.disposable = _scheduler.schedule(action)
+        def step() -> None:
+            nonlocal is_done
 
             try:
                 current = next(sources_)
@@ -39,6 +39,15 @@ def concat_with_iterable_(sources: Iterable[Observable[_T]]) -> Observable[_T]:
             except Exception as ex:  # pylint: disable=broad-except
                 observer.on_error(ex)
             else:
+                items: Optional[Sequence[_T]] = inline_items(current, scheduler_)
+                if items is not None:
+                    for item in items:
+                        if is_disposed:
+                            return
+                        observer.on_next(item)
+                    is_done = True
+                    return
+
                 d = SingleAssignmentDisposable()
                 subscription.disposable = d
                 d.disposable = current.subscribe(
@@ -48,6 +57,36 @@ def concat_with_iterable_(sources: Iterable[Observable[_T]]) -> Observable[_T]:
                     scheduler=scheduler_,
                 )
 
+        def on_completed() -> None:
+            nonlocal is_done
+
+            with lock:
+                if is_subscribing:
+                    is_done = True
+                    return
+
+            cancelable.disposable = _scheduler.schedule(action)
+
+        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+            """Subscribes to the next source. When a source completes
+            while it is being subscribed to, the loop below subscribes
+            to the next one instead of recursing or scheduling a new
+            action. Sources that complete later are followed by
+            scheduling this action again."""
+
+            nonlocal is_subscribing, is_done
+
+            while not is_disposed:
+                with lock:
+                    is_subscribing = True
+                    is_done = False
+
+                step()
+                with lock:
+                    is_subscribing = False
+                    if not is_done:
+                        return
+
         cancelable.disposable = _scheduler.schedule(action)
 
         def dispose() -> None:
@@ -1,6 +1,7 @@
 from typing import Any, Optional
 
 from reactivex import Observable, abc
+from reactivex.observable.scalarobservable import ScalarObservable
 from reactivex.scheduler import ImmediateScheduler
 
 
@@ -16,6 +17,8 @@ def empty_(scheduler: Optional[abc.SchedulerBase] = None) -> Observable[Any]:
 
         return _scheduler.schedule(action)
 
+    if scheduler is None:
+        return ScalarObservable(subscribe, ())
     return Observable(subscribe)
 
 
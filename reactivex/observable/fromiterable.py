@@ -2,6 +2,7 @@ from typing import Any, Iterable, Optional, TypeVar
 
 from reactivex import Observable, abc
 from reactivex.disposable import CompositeDisposable, Disposable
+from reactivex.observable.scalarobservable import ScalarObservable
 from reactivex.scheduler import CurrentThreadScheduler
 
 _T = TypeVar("_T")
@@ -50,6 +51,8 @@ def from_iterable_(
         disp = Disposable(dispose)
         return CompositeDisposable(_scheduler.schedule(action), disp)
 
+    if scheduler is None and isinstance(iterable, (list, tuple)):
+        return ScalarObservable(subscribe, iterable)
     return Observable(subscribe)
 
 
@@ -1,6 +1,7 @@
 from typing import Any, Callable, Optional, TypeVar
 
 from reactivex import Observable, abc
+from reactivex.observable.scalarobservable import ScalarObservable
 from reactivex.scheduler import CurrentThreadScheduler
 
 _T = TypeVar("_T")
@@ -36,6 +37,8 @@ def return_value_(
 
         return _scheduler.schedule(action)
 
+    if scheduler is None:
+        return ScalarObservable(subscribe, (value,))
     return Observable(subscribe)
 
 
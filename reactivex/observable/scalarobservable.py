@@ -0,0 +1,51 @@
+from typing import Optional, Sequence, TypeVar
+
+from reactivex import abc
+from reactivex.scheduler import CurrentThreadScheduler
+
+from .observable import Observable
+
+_T = TypeVar("_T")
+
+
+class ScalarObservable(Observable[_T]):
+    """An observable sequence whose elements are known when it is
+    created, as returned by return_value, empty, of and from_iterable
+    of a list or tuple when no scheduler is given.
+
+    Operators merging inner sequences, such as flat_map, concat_map and
+    switch_map, may emit the items of a scalar inner sequence inline
+    instead of subscribing to it, as long as they are themselves
+    subscribed without a scheduler and no other work is waiting on the
+    trampoline, so that the items are emitted in the same order as if
+    they had been subscribed to."""
+
+    def __init__(
+        self, subscribe: abc.Subscription[_T], items: Sequence[_T]
+    ) -> None:
+        super().__init__(subscribe)
+        self.items = items
+
+
+def inline_items(
+    source: object, scheduler: Optional[abc.SchedulerBase]
+) -> Optional[Sequence[_T]]:
+    """Returns the items to emit inline for an inner sequence, or None
+    if the sequence has to be subscribed to.
+
+    Subscribing to a scalar sequence schedules its items on the
+    trampoline of the current thread, behind any work already queued
+    there, such as another inner sequence or a sibling source of merge.
+    Emitting them inline would overtake that work, so the items are
+    only returned when the trampoline has nothing pending."""
+
+    if scheduler is not None or not isinstance(source, ScalarObservable):
+        return None
+
+    trampoline = CurrentThreadScheduler.singleton().get_trampoline()
+    if trampoline.has_pending():
+        return None
+    return source.items
+
+
+__all__ = ["ScalarObservable", "inline_items"]
@@ -2,6 +2,7 @@
 
 
 from asyncio import Future
+from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -55,6 +56,90 @@ _C = TypeVar("_C")
 _D = TypeVar("_D")
 
 
+def adaptive_batch(
+    max_latency: typing.RelativeTime,
+    min_size: int = 1,
+    max_size: int = 1000,
+    size_observer: Optional[abc.ObserverBase[int]] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[List[_T]]]:
+    """Buffers the elements of an observable sequence into batches
+    whose size adapts to the load, so that no element waits longer than
+    max_latency before its batch is processed.
+
+    Unlike :func:`buffer_with_time_or_count`, the thresholds aren't
+    fixed. After every batch, the batch size is set to the number of
+    elements expected to arrive within the latency budget, from moving
+    averages of the arrival rate and of the time the observer took to
+    process the previous batches. Batches grow under high load and
+    shrink under low load, and a batch is flushed early when waiting
+    for it to fill would exceed the budget.
+
+    Examples:
+        >>> res = adaptive_batch(0.05)
+        >>> res = adaptive_batch(0.05, min_size=10, max_size=5000)
+        >>> res = adaptive_batch(0.05, size_observer=batch_size_gauge)
+
+    Args:
+        max_latency: Maximum time between the arrival of an element and
+            the end of the processing of its batch.
+        min_size: Minimum batch size.
+        max_size: Maximum batch size.
+        size_observer: [Optional] Observer receiving the batch size
+            chosen after every batch.
+        scheduler: [Optional] Scheduler to run the timer on and to
+            measure time with.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of batches, as lists of elements.
+    """
+    from ._adaptivebatch import adaptive_batch_
+
+    return adaptive_batch_(max_latency, min_size, max_size, size_observer, scheduler)
+
+
+def aggregate_by_key(
+    key_mapper: Mapper[_T, _TKey],
+    window: typing.RelativeTime,
+    agg: str = "count",
+    value_mapper: Optional[Mapper[_T, Any]] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[Tuple[_TKey, datetime, Any]]]:
+    """Aggregates the elements of an observable sequence per key over
+    tumbling time windows.
+
+    This is equivalent to grouping by key, windowing every group by
+    time and reducing every window, but keeps a single accumulator per
+    key and flushes all keys on one shared timer, without creating a
+    subject or a timer per group or per window.
+
+    Examples:
+        >>> res = aggregate_by_key(lambda e: e["user"], 60.0)
+        >>> res = aggregate_by_key(
+        ...     lambda e: e["user"], 60.0, "sum", lambda e: e["bytes"]
+        ... )
+
+    Args:
+        key_mapper: A function to extract the key for each element.
+        window: Duration of the windows.
+        agg: [Optional] The aggregate to compute, one of ``"count"``
+            (default), ``"sum"``, ``"mean"``, ``"min"`` or ``"max"``.
+        value_mapper: [Optional] A function to extract the value to
+            aggregate from each element.
+        scheduler: [Optional] Scheduler to run the window timer on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of ``(key, window_start,
+        value)`` tuples, emitted at the end of each window for every
+        key seen during that window.
+    """
+    from ._aggregatebykey import aggregate_by_key_
+
+    return aggregate_by_key_(key_mapper, window, agg, value_mapper, scheduler)
+
+
 def all(predicate: Predicate[_T]) -> Callable[[Observable[_T]], Observable[bool]]:
     """Determines whether all elements of an observable sequence satisfy
     a condition.
@@ -108,6 +193,39 @@ def amb(right_source: Observable[_T]) -> Callable[[Observable[_T]], Observable[_
     return amb_(right_source)
 
 
+def approx_distinct_count(
+    precision: int = 14,
+    interval: Optional[typing.RelativeTime] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[Any]], Observable[int]]:
+    """Estimates the number of distinct elements in an observable
+    sequence using a HyperLogLog sketch.
+
+    Memory is fixed at ``2 ** precision`` bytes whatever the number of
+    elements, and the standard error is about
+    ``1.04 / sqrt(2 ** precision)`` (0.8% for the default).
+
+    Examples:
+        >>> res = approx_distinct_count()
+        >>> res = approx_distinct_count(precision=10, interval=60.0)
+
+    Args:
+        precision: [Optional] Base 2 logarithm of the number of
+            registers, between 4 and 18.
+        interval: [Optional] If given, the estimate for every interval
+            is emitted at its end and the sketch is reset. Otherwise a
+            single estimate is emitted when the source completes.
+        scheduler: [Optional] Scheduler to run the interval timer on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of distinct count estimates.
+    """
+    from ._sketches import approx_distinct_count_
+
+    return approx_distinct_count_(precision, interval, scheduler)
+
+
 def as_observable() -> Callable[[Observable[_T]], Observable[_T]]:
     """Hides the identity of an observable sequence.
 
@@ -123,6 +241,7 @@ def as_observable() -> Callable[[Observable[_T]], Observable[_T]]:
 
 def average(
     key_mapper: Optional[Mapper[_T, float]] = None,
+    batched: bool = False,
 ) -> Callable[[Observable[_T]], Observable[float]]:
     """The average operator.
 
@@ -140,9 +259,16 @@ def average(
     Examples:
         >>> op = average()
         >>> op = average(lambda x: x.value)
+        >>> op = average(batched=True)
 
     Args:
         key_mapper: [Optional] A transform function to apply to each element.
+        batched: [Optional] If True, each element is a batch of values,
+            such as a list or a NumPy array from
+            ``buffer_with_count(n, as_array=True)``, and the average is
+            taken over all values of all batches. NumPy arrays are
+            reduced with vectorized operations. The key mapper, if
+            given, is applied to each batch.
 
     Returns:
         An operator function that takes an observable source and
@@ -151,7 +277,7 @@ def average(
     """
     from ._average import average_
 
-    return average_(key_mapper)
+    return average_(key_mapper, batched)
 
 
 def buffer(
@@ -255,7 +381,7 @@ def buffer_toggle(
 
 
 def buffer_with_count(
-    count: int, skip: Optional[int] = None
+    count: int, skip: Optional[int] = None, as_array: bool = False
 ) -> Callable[[Observable[_T]], Observable[List[_T]]]:
     """Projects each element of an observable sequence into zero or more
     buffers which are produced based on element count information.
@@ -270,12 +396,15 @@ def buffer_with_count(
     Examples:
         >>> res = buffer_with_count(10)(xs)
         >>> res = buffer_with_count(10, 1)(xs)
+        >>> res = buffer_with_count(1000, as_array=True)(xs)
 
     Args:
         count: Length of each buffer.
         skip: [Optional] Number of elements to skip between
             creation of consecutive buffers. If not provided, defaults to
             the count.
+        as_array: [Optional] If True, buffers are emitted as NumPy
+            arrays instead of lists. Requires NumPy to be installed.
 
     Returns:
         A function that takes an observable source and returns an
@@ -283,13 +412,14 @@ def buffer_with_count(
     """
     from ._buffer import buffer_with_count_
 
-    return buffer_with_count_(count, skip)
+    return buffer_with_count_(count, skip, as_array)
 
 
 def buffer_with_time(
     timespan: typing.RelativeTime,
     timeshift: Optional[typing.RelativeTime] = None,
     scheduler: Optional[abc.SchedulerBase] = None,
+    as_array: bool = False,
 ) -> Callable[[Observable[_T]], Observable[List[_T]]]:
     """Projects each element of an observable sequence into zero or more
     buffers which are produced based on timing information.
@@ -316,6 +446,8 @@ def buffer_with_time(
             argument, resulting in non-overlapping adjacent buffers.
         scheduler:  [Optional] Scheduler to run the timer on. If not specified,
              the timeout scheduler is used
+        as_array: [Optional] If True, buffers are emitted as NumPy
+            arrays instead of lists. Requires NumPy to be installed.
 
     Returns:
         An operator function that takes an observable source and
@@ -323,7 +455,7 @@ def buffer_with_time(
     """
     from ._bufferwithtime import buffer_with_time_
 
-    return buffer_with_time_(timespan, timeshift, scheduler)
+    return buffer_with_time_(timespan, timeshift, scheduler, as_array)
 
 
 def buffer_with_time_or_count(
@@ -525,6 +657,7 @@ def contains(
 
 def count(
     predicate: Optional[typing.Predicate[_T]] = None,
+    batched: bool = False,
 ) -> Callable[[Observable[_T]], Observable[int]]:
     """Returns an observable sequence containing a value that
     represents how many elements in the specified observable sequence
@@ -540,9 +673,13 @@ def count(
     Examples:
         >>> op = count()
         >>> op = count(lambda x: x > 3)
+        >>> op = count(batched=True)
 
     Args:
         predicate: A function to test each element for a condition.
+        batched: [Optional] If True, each element is a batch of values
+            and the total number of values is counted. Cannot be
+            combined with a predicate.
 
     Returns:
         An operator function that takes an observable source and
@@ -554,7 +691,7 @@ def count(
 
     from ._count import count_
 
-    return count_(predicate)
+    return count_(predicate, batched)
 
 
 def debounce(
@@ -985,6 +1122,169 @@ def element_at_or_default(
     return element_at_or_default_(index, True, default_value)
 
 
+def enrich(
+    key_mapper: Mapper[_T, _TKey],
+    fetch: Callable[[List[_TKey]], Any],
+    max_batch: int = 100,
+    max_wait: typing.RelativeTime = 0.01,
+    cache_size: int = 0,
+    cache_ttl: Optional[typing.RelativeTime] = None,
+    ordered: bool = True,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[Tuple[_T, Any]]]:
+    """Enriches the elements of an observable sequence with values
+    looked up by key in batches.
+
+    Instead of one call per element, keys are collected and passed to
+    ``fetch`` as a list when ``max_batch`` keys are queued or
+    ``max_wait`` after the first one. Elements with the same key share
+    a lookup while it is in flight, and results may be kept in an LRU
+    cache.
+
+    ``fetch`` returns a mapping from keys to values, either directly,
+    or as an asyncio or ``concurrent.futures`` future or an observable
+    emitting it, so lookups can run on an event loop or a thread pool.
+    Keys missing from the mapping get None.
+
+    Examples:
+        >>> res = enrich(lambda e: e.user_id, fetch_users)
+        >>> res = enrich(
+        ...     lambda e: e.user_id,
+        ...     lambda ids: executor.submit(fetch_users, ids),
+        ...     max_batch=500,
+        ...     cache_size=10000,
+        ...     cache_ttl=60.0,
+        ... )
+
+    Args:
+        key_mapper: A function to extract the lookup key for each
+            element.
+        fetch: A function looking up a list of keys.
+        max_batch: [Optional] Maximum number of keys per fetch.
+        max_wait: [Optional] Maximum time a key waits for its batch to
+            fill up.
+        cache_size: [Optional] Number of results to cache. Defaults to
+            0, i.e. no caching.
+        cache_ttl: [Optional] How long cached results stay valid.
+        ordered: [Optional] If True (default), elements are emitted in
+            source order, else as soon as their value is available.
+        scheduler: [Optional] Scheduler to run the batch timer on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of ``(element, value)`` tuples.
+    """
+    from ._enrich import enrich_
+
+    return enrich_(
+        key_mapper,
+        fetch,
+        max_batch,
+        max_wait,
+        cache_size,
+        cache_ttl,
+        ordered,
+        scheduler,
+    )
+
+
+if TYPE_CHECKING:
+    from ._eventtime import EventTimeWindow
+
+
+def event_time_session_window(
+    timestamp_mapper: Callable[[_T], typing.AbsoluteTime],
+    gap: typing.RelativeTime,
+    max_delay: typing.RelativeTime = 0.0,
+    allowed_lateness: typing.RelativeTime = 0.0,
+    late_observer: Optional[abc.ObserverBase[_T]] = None,
+) -> Callable[[Observable[_T]], Observable["EventTimeWindow"]]:
+    """Groups the elements of an observable sequence into sessions of
+    activity by event time, i.e. by a timestamp carried by each
+    element.
+
+    A session ends ``gap`` after its last element, and sessions that
+    come within ``gap`` of each other are merged, also when elements
+    arrive out of order. Sessions are emitted by the watermark, with
+    the same rules as :func:`event_time_window`.
+
+    Examples:
+        >>> res = event_time_session_window(lambda e: e["ts"], 30.0)
+
+    Args:
+        timestamp_mapper: A function returning the event time of each
+            element, in seconds or as a datetime.
+        gap: The inactivity that ends a session.
+        max_delay: [Optional] How far out of order elements may
+            arrive. The watermark trails the largest timestamp seen so
+            far by this amount.
+        allowed_lateness: [Optional] How long a session is kept after
+            it is emitted. Late elements within this time update the
+            session and it is emitted again.
+        late_observer: [Optional] Observer receiving the elements that
+            arrive too late, which are otherwise dropped.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of :class:`EventTimeWindow`
+        sessions, with their elements in timestamp order.
+    """
+    from ._eventtime import event_time_session_window_
+
+    return event_time_session_window_(
+        timestamp_mapper, gap, max_delay, allowed_lateness, late_observer
+    )
+
+
+def event_time_window(
+    timestamp_mapper: Callable[[_T], typing.AbsoluteTime],
+    size: typing.RelativeTime,
+    slide: Optional[typing.RelativeTime] = None,
+    max_delay: typing.RelativeTime = 0.0,
+    allowed_lateness: typing.RelativeTime = 0.0,
+    late_observer: Optional[abc.ObserverBase[_T]] = None,
+) -> Callable[[Observable[_T]], Observable["EventTimeWindow"]]:
+    """Groups the elements of an observable sequence into tumbling or
+    sliding windows by event time, i.e. by a timestamp carried by each
+    element, rather than by the time they arrive.
+
+    A watermark trails the largest timestamp seen by ``max_delay``,
+    and a window is emitted once the watermark passes its end. As the
+    watermark only moves with the data, and to the end of time when
+    the source completes, the result does not depend on the scheduler
+    and replays are deterministic.
+
+    Examples:
+        >>> res = event_time_window(lambda e: e["ts"], 60.0)
+        >>> res = event_time_window(lambda e: e["ts"], 60.0, 10.0, max_delay=5.0)
+
+    Args:
+        timestamp_mapper: A function returning the event time of each
+            element, in seconds or as a datetime.
+        size: Length of each window.
+        slide: [Optional] Interval between the start of consecutive
+            windows. If not specified, it equals size and the windows
+            are tumbling.
+        max_delay: [Optional] How far out of order elements may
+            arrive.
+        allowed_lateness: [Optional] How long a window is kept after it
+            is emitted. Late elements within this time are added and
+            the window is emitted again.
+        late_observer: [Optional] Observer receiving the elements that
+            arrive too late, which are otherwise dropped.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of :class:`EventTimeWindow`
+        objects with ``start``, ``end`` (in seconds) and ``items``.
+    """
+    from ._eventtime import event_time_window_
+
+    return event_time_window_(
+        timestamp_mapper, size, slide, max_delay, allowed_lateness, late_observer
+    )
+
+
 def exclusive() -> Callable[[Observable[Observable[_T]]], Observable[_T]]:
     """Performs a exclusive waiting for the first to finish before
     subscribing to another observable. Observables that come in between
@@ -1010,6 +1310,42 @@ def exclusive() -> Callable[[Observable[Observable[_T]]], Observable[_T]]:
     return exclusive_()
 
 
+def exhaust_map(
+    project: Optional[Mapper[_T1, Observable[_T2]]] = None,
+) -> Callable[[Observable[_T1]], Observable[_T2]]:
+    """Projects each source value to an Observable which is merged in
+    the output Observable, ignoring the source values that arrive while
+    the previously projected Observable has not completed.
+
+    This is the counterpart of :func:`switch_map` that sheds load:
+    instead of cancelling the current inner Observable for a new one,
+    new source values are dropped until it completes, as with
+    :func:`exclusive`.
+
+    .. marble::
+        :alt: exhaust_map
+
+        ---a----b-----------c---------|
+        [  exhaust_map(x: x---x---x|) ]
+        ---a---a---a--------c---c---c-|
+
+    Examples:
+        >>> op = exhaust_map(lambda query: search(query))
+
+    Args:
+        project: Projecting function which takes the outer observable
+            value and emits the inner observable; defaults to `identity`
+
+    Returns:
+        An operator function that maps each value to the inner
+        observable, unless the previous one is still active, and emits
+        the values of the inner observables.
+    """
+    from ._switchlatest import exhaust_map_
+
+    return exhaust_map_(project)
+
+
 def expand(
     mapper: typing.Mapper[_T, Observable[_T]],
 ) -> Callable[[Observable[_T]], Observable[_T]]:
@@ -1057,6 +1393,37 @@ def filter(predicate: Predicate[_T]) -> Callable[[Observable[_T]], Observable[_T
     return filter_(predicate)
 
 
+if TYPE_CHECKING:
+    from reactivex.recordbatch import RecordBatch
+
+
+def filter_batch(
+    predicate: Callable[["RecordBatch"], Any]
+) -> Callable[[Observable["RecordBatch"]], Observable["RecordBatch"]]:
+    """Filters the records of each :class:`RecordBatch
+    <reactivex.recordbatch.RecordBatch>` with a single call per batch.
+
+    The predicate receives the whole batch and returns a boolean mask
+    with one entry per record, typically computed on whole columns.
+    Batches where no record passes are dropped.
+
+    Example:
+        >>> op = filter_batch(lambda batch: batch["px"] > 100)
+
+    Args:
+        predicate: A function returning the mask of records to keep
+            for a batch.
+
+    Returns:
+        An operator function that takes an observable source of
+        batches and returns an observable sequence of the filtered,
+        non-empty batches.
+    """
+    from ._recordbatch import filter_batch_
+
+    return filter_batch_(predicate)
+
+
 def filter_indexed(
     predicate_indexed: Optional[PredicateIndexed[_T]] = None,
 ) -> Callable[[Observable[_T]], Observable[_T]]:
@@ -1488,6 +1855,33 @@ def group_by(
     return group_by_(key_mapper, element_mapper, subject_mapper)
 
 
+def group_by_column(
+    name: str,
+) -> Callable[
+    [Observable["RecordBatch"]], Observable[GroupedObservable[Any, "RecordBatch"]]
+]:
+    """Groups the records of a sequence of :class:`RecordBatch
+    <reactivex.recordbatch.RecordBatch>` by the values of a column.
+
+    Each batch is partitioned once and every group receives a single
+    sub-batch per source batch, instead of one element per record.
+
+    Example:
+        >>> op = group_by_column("sym")
+
+    Args:
+        name: The name of the column holding the keys.
+
+    Returns:
+        An operator function that takes an observable source of
+        batches and returns a sequence of observable groups of batches,
+        one group per distinct key.
+    """
+    from ._recordbatch import group_by_column_
+
+    return group_by_column_(name)
+
+
 def group_by_until(
     key_mapper: Mapper[_T, _TKey],
     element_mapper: Optional[Mapper[_T, _TValue]],
@@ -1580,6 +1974,133 @@ def group_join(
     return group_join_(right, left_duration_mapper, right_duration_mapper)
 
 
+def hash_join(
+    right: Observable[_T2],
+    left_key_mapper: Mapper[_T1, Any],
+    right_key_mapper: Mapper[_T2, Any],
+    window: typing.RelativeTime,
+    max_items: Optional[int] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T1]], Observable[Tuple[_T1, _T2]]]:
+    """Correlates the elements of two sequences that have equal keys
+    and arrive within a time window of each other.
+
+    Unlike :func:`join`, the live elements of each side are indexed by
+    key, so an element is only compared with the elements sharing its
+    key, and expiry uses a single timer per side instead of a duration
+    observable per element.
+
+    Examples:
+        >>> res = hash_join(payments, lambda o: o.id, lambda p: p.order_id, 10.0)
+
+    Args:
+        right: The right observable sequence to join elements for.
+        left_key_mapper: A function to extract the key for each element
+            of the source sequence.
+        right_key_mapper: A function to extract the key for each
+            element of the right sequence.
+        window: How long an element stays live and can be matched.
+        max_items: [Optional] Maximum number of live elements per side.
+            The oldest elements are dropped first when it is exceeded.
+        scheduler: [Optional] Scheduler to run the expiry timers on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of ``(left, right)`` tuples.
+    """
+    from ._hashjoin import hash_join_
+
+    return hash_join_(
+        right, left_key_mapper, right_key_mapper, window, max_items, scheduler
+    )
+
+
+def heavy_hitters(
+    k: int = 10,
+    width: int = 2048,
+    depth: int = 4,
+    interval: Optional[typing.RelativeTime] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[List[Tuple[_T, int]]]]:
+    """Finds the most frequent elements of an observable sequence using
+    a Count-Min sketch.
+
+    Counts are estimated with ``width * depth`` counters and only the
+    ``k`` elements with the highest estimates are remembered. Estimates
+    may overcount by about ``2 * n / width`` but never undercount.
+
+    Examples:
+        >>> res = heavy_hitters(5)
+        >>> res = heavy_hitters(5, interval=60.0)
+
+    Args:
+        k: [Optional] The number of elements to report.
+        width: [Optional] The number of counters per row.
+        depth: [Optional] The number of rows, i.e. hash functions.
+        interval: [Optional] If given, the heavy hitters of every
+            interval are emitted at its end and the sketch is reset.
+            Otherwise they are emitted once when the source completes.
+        scheduler: [Optional] Scheduler to run the interval timer on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of lists of ``(element, count)``
+        pairs, most frequent first.
+    """
+    from ._sketches import heavy_hitters_
+
+    return heavy_hitters_(k, width, depth, interval, scheduler)
+
+
+if TYPE_CHECKING:
+    from reactivex.hedgestats import HedgeStats
+
+
+def hedge(
+    factory: Callable[[_T], Union[Observable[_TValue], "Future[_TValue]"]],
+    delay: typing.RelativeTime,
+    max_hedges: int = 1,
+    stats: Optional["HedgeStats"] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[_TValue]]:
+    """Projects each element of an observable sequence to a request
+    and sends the request again if it is not answered within delay,
+    taking the answer of whichever attempt answers first.
+
+    Each element is passed to factory, which starts a request and
+    returns an observable sequence or a future of its answer. While no
+    attempt has answered, another one is started every delay, up to
+    max_hedges extra attempts. The first attempt to emit an element or
+    complete wins and the other attempts are disposed. A failed attempt
+    starts the next one right away, and the request fails with the last
+    error once every attempt has failed. Answers of the requests are
+    merged, as with :func:`flat_map`.
+
+    Examples:
+        >>> res = hedge(lambda x: reactivex.from_future(call(x)), 0.05)
+        >>> stats = reactivex.HedgeStats()
+        >>> res = hedge(call, 0.05, max_hedges=2, stats=stats)
+
+    Args:
+        factory: Function starting the request for an element.
+        delay: Time to wait for an answer before starting another
+            attempt.
+        max_hedges: Maximum number of extra attempts per request.
+        stats: [Optional] :class:`reactivex.HedgeStats` counting the
+            requests, the extra attempts and the requests answered
+            first by an extra attempt.
+        scheduler: [Optional] Scheduler to run the hedge timers on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence merging the answers to the
+        requests.
+    """
+    from ._hedge import hedge_
+
+    return hedge_(factory, delay, max_hedges, stats, scheduler)
+
+
 def ignore_elements() -> Callable[[Observable[_T]], Observable[_T]]:
     """Ignores all elements in an observable sequence leaving only the
     termination messages.
@@ -1782,6 +2303,76 @@ def map(
     return map_(mapper)
 
 
+def map_batch(
+    mapper: Callable[["RecordBatch"], Any]
+) -> Callable[[Observable["RecordBatch"]], Observable["RecordBatch"]]:
+    """Projects each :class:`RecordBatch
+    <reactivex.recordbatch.RecordBatch>` with a single call per batch.
+
+    The mapper either returns a new batch, or a mapping of columns that
+    are added to, or replace columns of, the source batch.
+
+    Example:
+        >>> op = map_batch(lambda batch: {"value": batch["px"] * batch["qty"]})
+
+    Args:
+        mapper: A transform function to apply to each source batch.
+
+    Returns:
+        An operator function that takes an observable source of
+        batches and returns an observable sequence of the transformed
+        batches.
+    """
+    from ._recordbatch import map_batch_
+
+    return map_batch_(mapper)
+
+
+def map_concurrent(
+    mapper: Mapper[_T1, _T2],
+    max_concurrency: int,
+    ordered: bool = True,
+    capacity: Optional[int] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T1]], Observable[_T2]]:
+    """Projects each element of an observable sequence into a new form,
+    invoking the mapper on a scheduler with bounded concurrency.
+
+    Unlike ``flat_map(lambda x: reactivex.start(...))``, at most
+    max_concurrency invocations run at once, the other elements waiting
+    for a slot, and the results are emitted in the order of the source
+    elements by default. Results that are ready before their turn are
+    held in a reorder buffer, and no invocation is started more than
+    capacity elements ahead of the next result to emit, which bounds
+    the buffer when an invocation is slow. If the mapper raises, the
+    error is emitted in place of its result.
+
+    Examples:
+        >>> pool = ThreadPoolScheduler(8)
+        >>> res = map_concurrent(fetch, 8, scheduler=pool)
+        >>> res = map_concurrent(fetch, 8, ordered=False, scheduler=pool)
+
+    Args:
+        mapper: A transform function to apply to each source element.
+        max_concurrency: Maximum number of invocations of the mapper
+            running at once.
+        ordered: If True, emit the results in the order of the source
+            elements; otherwise, as soon as they are ready.
+        capacity: [Optional] Maximum distance, in elements, between the
+            next result to emit and the invocations started, at least
+            max_concurrency. Defaults to twice max_concurrency.
+        scheduler: [Optional] Scheduler to invoke the mapper on,
+            typically a :class:`ThreadPoolScheduler`.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of the results of the mapper.
+    """
+    from ._mapconcurrent import map_concurrent_
+
+    return map_concurrent_(mapper, max_concurrency, ordered, capacity, scheduler)
+
+
 def map_indexed(
     mapper_indexed: Optional[MapperIndexed[_T1, _T2]] = None,
 ) -> Callable[[Observable[_T1]], Observable[_T2]]:
@@ -1830,6 +2421,7 @@ def materialize() -> Callable[[Observable[_T]], Observable[Notification[_T]]]:
 
 def max(
     comparer: Optional[Comparer[_T]] = None,
+    batched: bool = False,
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     """Returns the maximum value in an observable sequence according to
     the specified comparer.
@@ -1844,9 +2436,13 @@ def max(
     Examples:
         >>> op = max()
         >>> op = max(lambda x, y:  x.value - y.value)
+        >>> op = max(batched=True)
 
     Args:
         comparer: [Optional] Comparer used to compare elements.
+        batched: [Optional] If True, each element is a batch of values
+            and the maximum of all values is computed, vectorized for
+            NumPy arrays. Cannot be combined with a comparer.
 
     Returns:
         A partially applied operator function that takes an observable
@@ -1855,7 +2451,7 @@ def max(
     """
     from ._max import max_
 
-    return max_(comparer)
+    return max_(comparer, batched)
 
 
 def max_by(
@@ -1952,6 +2548,7 @@ def merge_all() -> Callable[[Observable[Observable[_T]]], Observable[_T]]:
 
 def min(
     comparer: Optional[Comparer[_T]] = None,
+    batched: bool = False,
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     """The `min` operator.
 
@@ -1968,9 +2565,13 @@ def min(
     Examples:
         >>> res = source.min()
         >>> res = source.min(lambda x, y: x.value - y.value)
+        >>> res = source.min(batched=True)
 
     Args:
         comparer: [Optional] Comparer used to compare elements.
+        batched: [Optional] If True, each element is a batch of values
+            and the minimum of all values is computed, vectorized for
+            NumPy arrays. Cannot be combined with a comparer.
 
     Returns:
         An operator function that takes an observable source and
@@ -1979,7 +2580,7 @@ def min(
     """
     from ._min import min_
 
-    return min_(comparer)
+    return min_(comparer, batched)
 
 
 def min_by(
@@ -2255,6 +2856,27 @@ def pluck_attr(prop: str) -> Callable[[Observable[Any]], Observable[Any]]:
     return pluck_attr_(prop)
 
 
+def pluck_column(
+    name: str,
+) -> Callable[[Observable["RecordBatch"]], Observable[Any]]:
+    """Retrieves a column from each :class:`RecordBatch
+    <reactivex.recordbatch.RecordBatch>` of the sequence.
+
+    Example:
+        >>> op = pluck_column("px")
+
+    Args:
+        name: The name of the column to pluck.
+
+    Returns:
+        An operator function that takes an observable source of
+        batches and returns a new observable sequence of columns.
+    """
+    from ._recordbatch import pluck_column_
+
+    return pluck_column_(name)
+
+
 @overload
 def publish() -> Callable[[Observable[_T1]], ConnectableObservable[_T1]]: ...
 
@@ -2352,6 +2974,87 @@ def publish_value(
     return publish_value_(initial_value, mapper)
 
 
+def quantiles(
+    qs: List[float],
+    k: int = 200,
+    interval: Optional[typing.RelativeTime] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[Any]], Observable[List[Any]]]:
+    """Estimates quantiles of an observable sequence using a KLL
+    sketch.
+
+    Memory is O(k) whatever the number of elements, and the rank
+    error is about ``1.7 / k``. Quantiles are exact as long as fewer
+    than ``k`` elements were seen.
+
+    Examples:
+        >>> res = quantiles([0.5, 0.9, 0.99])
+        >>> res = quantiles([0.5], interval=60.0)
+
+    Args:
+        qs: The quantiles to estimate, each between 0 and 1.
+        k: [Optional] Accuracy parameter of the sketch.
+        interval: [Optional] If given, the quantiles of every interval
+            are emitted at its end and the sketch is reset. Otherwise
+            they are emitted once when the source completes.
+        scheduler: [Optional] Scheduler to run the interval timer on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of lists with one estimate per
+        quantile, or None for an empty sequence.
+    """
+    from ._sketches import quantiles_
+
+    return quantiles_(qs, k, interval, scheduler)
+
+
+def rate_limit(
+    rate: float,
+    burst: int = 1,
+    key_mapper: Optional[Mapper[_T, Any]] = None,
+    max_queue: int = 1000,
+    overflow: str = "queue",
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[_T]]:
+    """Limits the rate of an observable sequence to ``rate`` elements
+    per second, with bursts of up to ``burst`` elements.
+
+    Unlike :func:`throttle_first`, :func:`sample` or :func:`debounce`,
+    elements over the limit are delayed rather than dropped: they are
+    queued and emitted as soon as the token bucket allows. With a key
+    mapper, every key gets its own bucket and its own queue, and keys
+    don't delay each other. The sequence completes once the queues are
+    drained.
+
+    Examples:
+        >>> res = rate_limit(10.0)
+        >>> res = rate_limit(10.0, burst=5, max_queue=100)
+        >>> res = rate_limit(1.0, key_mapper=lambda req: req.host)
+        >>> res = rate_limit(10.0, overflow="drop")
+
+    Args:
+        rate: Number of elements allowed per second.
+        burst: Number of elements that can be emitted at once after
+            the sequence was idle.
+        key_mapper: [Optional] Function returning the key to rate
+            limit an element by.
+        max_queue: [Optional] Maximum number of elements queued per
+            key, 1000 by default. Elements arriving when the queue is
+            full are dropped.
+        overflow: What to do with elements over the limit, either
+            ``"queue"`` to delay them or ``"drop"`` to drop them.
+        scheduler: [Optional] Scheduler to run the timer on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns the rate limited observable sequence.
+    """
+    from ._ratelimit import rate_limit_
+
+    return rate_limit_(rate, burst, key_mapper, max_queue, overflow, scheduler)
+
+
 @overload
 def reduce(
     accumulator: Accumulator[_TState, _T],
@@ -2534,9 +3237,128 @@ def retry(
     return retry_(retry_count)
 
 
+if TYPE_CHECKING:
+    from reactivex.retrybudget import RetryBudget
+
+
+def retry_with_backoff(
+    max_attempts: Optional[int] = None,
+    base: typing.RelativeTime = 0.1,
+    max_delay: typing.RelativeTime = 30.0,
+    jitter: float = 0.0,
+    retry_on: Optional[
+        Union[
+            Type[Exception],
+            Tuple[Type[Exception], ...],
+            Callable[[Exception], bool],
+        ]
+    ] = None,
+    budget: Optional["RetryBudget"] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[_T]]:
+    """Resubscribes to the source observable sequence after a delay
+    each time it terminates with an error, until it successfully
+    terminates.
+
+    The delay starts at ``base`` and doubles after every retry, up to
+    ``max_delay``. With ``jitter`` set, each delay is reduced by a
+    random fraction of up to ``jitter`` of itself, so that subscriptions
+    failing together do not retry together; ``jitter=1.0`` gives full
+    jitter.
+
+    Examples:
+        >>> retried = retry_with_backoff(5)
+        >>> retried = retry_with_backoff(5, 0.5, 10.0, jitter=1.0)
+        >>> retried = retry_with_backoff(retry_on=ConnectionError)
+        >>> budget = reactivex.RetryBudget(10, 1.0)
+        >>> retried = retry_with_backoff(5, budget=budget)
+
+    Args:
+        max_attempts: [Optional] Maximum number of subscriptions to
+            the source, the first one included. If not provided, retry
+            indefinitely.
+        base: Delay before the first retry.
+        max_delay: Maximum delay between retries.
+        jitter: Fraction, between 0 and 1, of each delay that is
+            randomized.
+        retry_on: [Optional] Exception type, tuple of exception types
+            or predicate selecting the errors to retry on. Other errors
+            are propagated immediately.
+        budget: [Optional] :class:`reactivex.RetryBudget` shared with
+            other subscriptions. Each retry takes a token from it, and
+            errors are propagated when it is empty.
+        scheduler: [Optional] Scheduler to run the retry timers on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence producing the elements of the
+        given sequence repeatedly until it terminates successfully.
+    """
+    from ._retry import retry_with_backoff_
+
+    return retry_with_backoff_(
+        max_attempts, base, max_delay, jitter, retry_on, budget, scheduler
+    )
+
+
+def rolling(
+    window: Union[int, typing.RelativeTime],
+    agg: str = "mean",
+    key_mapper: Optional[Mapper[_T, Any]] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[Any]]:
+    """Computes a rolling aggregate over a sliding window.
+
+    After each element, emits the aggregate of the elements currently
+    in the window. The window either holds the last ``window`` elements
+    (when given an int) or the elements received during the last
+    ``window`` seconds (when given a float or timedelta). Windows are
+    partial until filled.
+
+    The aggregates are updated incrementally as elements enter and leave
+    the window, so each element costs O(1) amortized regardless of the
+    window size: running sums for ``"sum"`` and ``"mean"``, Welford's
+    algorithm for ``"var"`` and ``"std"`` (population variance) and a
+    monotonic deque for ``"min"`` and ``"max"``. As sums are maintained
+    by subtraction, floating point rounding may accumulate over very
+    long streams.
+
+    .. marble::
+        :alt: rolling
+
+        ---1---2---3---4---|
+        [    rolling(2)    ]
+        ---a---b---c---d---|
+
+    Examples:
+        >>> res = rolling(100)
+        >>> res = rolling(100, "max")
+        >>> res = rolling(60.0, "std", lambda x: x.price)
+
+    Args:
+        window: Number of elements (int), or duration (float in seconds
+            or timedelta) of the window.
+        agg: [Optional] One of ``"mean"`` (default), ``"sum"``,
+            ``"min"``, ``"max"``, ``"var"`` or ``"std"``.
+        key_mapper: [Optional] A transform function to apply to each
+            element.
+        scheduler: [Optional] Scheduler providing the time for time
+            based windows. If not specified, the timeout scheduler is
+            used.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of rolling aggregates.
+    """
+    from ._rolling import rolling_
+
+    return rolling_(window, agg, key_mapper, scheduler)
+
+
 def sample(
     sampler: Union[typing.RelativeTime, Observable[Any]],
     scheduler: Optional[abc.SchedulerBase] = None,
+    shared: bool = False,
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     """Samples the observable sequence at each interval.
 
@@ -2550,12 +3372,18 @@ def sample(
     Examples:
         >>> res = sample(sample_observable) # Sampler tick sequence
         >>> res = sample(5.0) # 5 seconds
+        >>> res = sample(0.1, shared=True) # One timer for all subscriptions
 
     Args:
         sampler: Observable used to sample the source observable **or** time
             interval at which to sample (specified as a float denoting
             seconds or an instance of timedelta).
         scheduler: Scheduler to use only when a time interval is given.
+        shared: [Optional] Only used when a time interval is given. If
+            True, all subscriptions sampling with the same interval on
+            the same scheduler share a single tick, started by the first
+            subscription. Ticks are then aligned across subscriptions
+            rather than to each subscription time.
 
     Returns:
         An operator function that takes an observable source and
@@ -2563,7 +3391,7 @@ def sample(
     """
     from ._sample import sample_
 
-    return sample_(sampler, scheduler)
+    return sample_(sampler, scheduler, shared)
 
 
 @overload
@@ -2652,6 +3480,45 @@ def sequence_equal(
     return sequence_equal_(second, comparer)
 
 
+def session_window(
+    gap: typing.RelativeTime,
+    key_mapper: Optional[Mapper[_T, Any]] = None,
+    resolution: Optional[typing.RelativeTime] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[List[_T]]]:
+    """Buffers the elements of an observable sequence into sessions of
+    activity that end after a given time without elements.
+
+    With a key mapper, a separate session is tracked for each key. All
+    sessions share a single timer armed for the earliest deadline, so
+    the cost does not grow with the number of elements and scales to
+    many concurrent keys.
+
+    Examples:
+        >>> res = session_window(30.0)
+        >>> res = session_window(30.0, lambda e: e["user"], resolution=1.0)
+
+    Args:
+        gap: The inactivity that ends a session.
+        key_mapper: [Optional] A function to extract the key for each
+            element.
+        resolution: [Optional] If given, deadlines are rounded up to a
+            multiple of it, so that sessions ending at about the same
+            time are closed together by one timer. A session may then
+            stay open up to resolution longer than gap.
+        scheduler: [Optional] Scheduler to run the timer on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of sessions, each a list of the
+        elements of one key. Open sessions are emitted when the source
+        completes.
+    """
+    from ._sessionwindow import session_window_
+
+    return session_window_(gap, key_mapper, resolution, scheduler)
+
+
 def share() -> Callable[[Observable[_T]], Observable[_T]]:
     """Share a single subscription among multiple observers.
 
@@ -3052,6 +3919,44 @@ def slice(
     return slice_(start, stop, step)
 
 
+def sliding_window(
+    count: int, step: int = 1
+) -> Callable[[Observable[_T]], Observable[Tuple[_T, ...]]]:
+    """Emits overlapping windows of the most recent elements as tuples.
+
+    Once count elements have been received, a tuple of the last count
+    elements is emitted, and then again after every step further
+    elements. Elements are kept in a ring buffer, so unlike
+    :func:`window_with_count <reactivex.operators.window_with_count>`
+    no subject is created per window. Incomplete windows are not
+    emitted. Every window is copied into a new tuple, which costs
+    O(count), so a larger step makes long windows cheaper.
+
+    .. marble::
+        :alt: sliding_window
+
+        ---1---2---3---4---5---|
+        [   sliding_window(3)  ]
+        -----------a---b---c---|
+
+    Examples:
+        >>> res = sliding_window(3)
+        >>> res = sliding_window(1000, 10)
+
+    Args:
+        count: Length of each window.
+        step: [Optional] Number of elements between the end of
+            consecutive windows. Defaults to 1.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of tuples.
+    """
+    from ._slidingwindow import sliding_window_
+
+    return sliding_window_(count, step)
+
+
 def some(
     predicate: Optional[Predicate[_T]] = None,
 ) -> Callable[[Observable[_T]], Observable[bool]]:
@@ -3261,17 +4166,20 @@ def subscribe_on(
 
 
 @overload
-def sum() -> Callable[[Observable[float]], Observable[float]]: ...
+def sum(
+    *, batched: bool = False
+) -> Callable[[Observable[float]], Observable[float]]: ...
 
 
 @overload
 def sum(
-    key_mapper: Mapper[_T, float],
+    key_mapper: Mapper[_T, float], batched: bool = False
 ) -> Callable[[Observable[_T]], Observable[float]]: ...
 
 
 def sum(
     key_mapper: Optional[Mapper[Any, float]] = None,
+    batched: bool = False,
 ) -> Callable[[Observable[Any]], Observable[float]]:
     """Computes the sum of a sequence of values that are obtained by
     invoking an optional transform function on each element of the
@@ -3288,10 +4196,17 @@ def sum(
     Examples:
         >>> res = sum()
         >>> res = sum(lambda x: x.value)
+        >>> res = sum(batched=True)
 
     Args:
         key_mapper: [Optional] A transform function to apply to each
             element.
+        batched: [Optional] If True, each element is a batch of values,
+            such as a list or a NumPy array from
+            ``buffer_with_count(n, as_array=True)``, and all values of
+            all batches are summed. NumPy arrays are reduced with
+            vectorized operations. The key mapper, if given, is applied
+            to each batch.
 
     Returns:
         An operator function that takes a source observable and returns
@@ -3300,7 +4215,7 @@ def sum(
     """
     from ._sum import sum_
 
-    return sum_(key_mapper)
+    return sum_(key_mapper, batched)
 
 
 def switch_latest() -> (
@@ -3368,8 +4283,9 @@ def switch_map(
         completes/errors.
 
     """
+    from ._switchlatest import switch_map_
 
-    return compose(map(project), switch_latest())
+    return switch_map_(project)
 
 
 def switch_map_indexed(
@@ -3982,6 +4898,40 @@ def to_set() -> Callable[[Observable[_T]], Observable[Set[_T]]]:
     return to_set_()
 
 
+def top_k(
+    k: int,
+    key_mapper: Optional[Mapper[_T, Any]] = None,
+    interval: Optional[typing.RelativeTime] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[List[_T]]]:
+    """Returns the k largest elements of an observable sequence.
+
+    Unlike :func:`max_by`, only ``k`` elements are kept in a heap, so
+    memory stays bounded for unbounded sequences. On equal keys the
+    earliest elements are kept.
+
+    Examples:
+        >>> res = top_k(3)
+        >>> res = top_k(3, lambda x: x["score"], interval=60.0)
+
+    Args:
+        k: The number of elements to keep.
+        key_mapper: [Optional] Key selector function.
+        interval: [Optional] If given, the top elements of every
+            interval are emitted at its end and the heap is reset.
+            Otherwise they are emitted once when the source completes.
+        scheduler: [Optional] Scheduler to run the interval timer on.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of lists of at most ``k``
+        elements, largest first.
+    """
+    from ._sketches import top_k_
+
+    return top_k_(k, key_mapper, interval, scheduler)
+
+
 def while_do(
     condition: Predicate[Observable[_T]],
 ) -> Callable[[Observable[_T]], Observable[_T]]:
@@ -4261,8 +5211,11 @@ def zip_with_iterable(
 zip_with_list = zip_with_iterable
 
 __all__ = [
+    "adaptive_batch",
+    "aggregate_by_key",
     "all",
     "amb",
+    "approx_distinct_count",
     "as_observable",
     "average",
     "buffer",
@@ -4290,9 +5243,14 @@ __all__ = [
     "do_while",
     "element_at",
     "element_at_or_default",
+    "enrich",
+    "event_time_session_window",
+    "event_time_window",
     "exclusive",
+    "exhaust_map",
     "expand",
     "filter",
+    "filter_batch",
     "filter_indexed",
     "finally_action",
     "find",
@@ -4304,14 +5262,20 @@ __all__ = [
     "flat_map_latest",
     "fork_join",
     "group_by",
+    "group_by_column",
     "group_by_until",
     "group_join",
+    "hash_join",
+    "heavy_hitters",
+    "hedge",
     "ignore_elements",
     "is_empty",
     "join",
     "last",
     "last_or_default",
     "map",
+    "map_batch",
+    "map_concurrent",
     "map_indexed",
     "materialize",
     "max",
@@ -4328,16 +5292,22 @@ __all__ = [
     "partition_indexed",
     "pluck",
     "pluck_attr",
+    "pluck_column",
     "publish",
     "publish_value",
+    "quantiles",
+    "rate_limit",
     "reduce",
     "ref_count",
     "repeat",
     "replay",
     "retry",
+    "retry_with_backoff",
+    "rolling",
     "sample",
     "scan",
     "sequence_equal",
+    "session_window",
     "share",
     "single",
     "single_or_default",
@@ -4351,6 +5321,7 @@ __all__ = [
     "skip_while_indexed",
     "skip_with_time",
     "slice",
+    "sliding_window",
     "some",
     "starmap",
     "starmap_indexed",
@@ -4379,6 +5350,7 @@ __all__ = [
     "to_list",
     "to_marbles",
     "to_set",
+    "top_k",
     "while_do",
     "window",
     "window_when",
@@ -0,0 +1,127 @@
+from typing import Any, Callable, List, Optional, TypeVar
+
+from reactivex import Observable, abc, typing
+from reactivex.disposable import CompositeDisposable, SerialDisposable
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.scheduler import TimeoutScheduler
+from reactivex.scheduler.scheduler import Scheduler
+
+_T = TypeVar("_T")
+
+# Weight of the latest measurement in the moving averages
+_SMOOTHING = 0.3
+
+
+def adaptive_batch_(
+    max_latency: typing.RelativeTime,
+    min_size: int = 1,
+    max_size: int = 1000,
+    size_observer: Optional[abc.ObserverBase[int]] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[List[_T]]]:
+    max_latency_ = Scheduler.to_seconds(max_latency)
+    if max_latency_ <= 0 or min_size < 1 or max_size < min_size:
+        raise ArgumentOutOfRangeException()
+
+    def adaptive_batch(source: Observable[_T]) -> Observable[List[_T]]:
+        """Buffers the elements of the source into batches sized to the
+        number of elements that arrive within the latency budget.
+
+        Moving averages of the arrival rate and of the time the
+        observer takes to process a batch are updated at every flush.
+        The next batch size is the rate times the budget left after
+        processing, and a timer flushes a batch early, at its first
+        element plus that remaining budget.
+
+        Args:
+            source: Source observable to batch.
+
+        Returns:
+            An observable sequence of batches, as lists of elements.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[List[_T]],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+            def now() -> float:
+                return _scheduler.to_seconds(_scheduler.now)
+
+            buffer: List[_T] = []
+            batch_id = 0
+            size = min_size
+            rate: Optional[float] = None
+            cost = 0.0
+            last_flush = now()
+            timer = SerialDisposable()
+
+            def average(mean: float, value: float) -> float:
+                return mean + _SMOOTHING * (value - mean)
+
+            def flush() -> None:
+                nonlocal buffer, batch_id, size, rate, cost, last_flush
+
+                batch, buffer = buffer, []
+                batch_id += 1
+                timer.disposable = None
+
+                start = now()
+                observer.on_next(batch)
+                end = now()
+
+                cost = average(cost, end - start)
+                elapsed = start - last_flush
+                last_flush = end
+                if elapsed > 0:
+                    measured = len(batch) / elapsed
+                    rate = measured if rate is None else average(rate, measured)
+                    target = int(rate * max(0.0, max_latency_ - cost))
+                else:
+                    # A burst, the rate is too high to measure
+                    target = size * 2
+                size = max(min_size, min(max_size, target))
+
+                if size_observer is not None:
+                    size_observer.on_next(size)
+
+            def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+                with source.lock:
+                    if state == batch_id and buffer:
+                        flush()
+
+            def on_next(x: _T) -> None:
+                with source.lock:
+                    buffer.append(x)
+                    if len(buffer) >= size:
+                        flush()
+                    elif len(buffer) == 1:
+                        timer.disposable = _scheduler.schedule_relative(
+                            max(0.0, max_latency_ - cost), action, batch_id
+                        )
+
+            def on_error(error: Exception) -> None:
+                with source.lock:
+                    buffer.clear()
+                    timer.dispose()
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                with source.lock:
+                    if buffer:
+                        flush()
+                    timer.dispose()
+                    observer.on_completed()
+
+            subscription = source.subscribe(
+                on_next, on_error, on_completed, scheduler=scheduler_
+            )
+            return CompositeDisposable(subscription, timer)
+
+        return Observable(subscribe)
+
+    return adaptive_batch
+
+
+__all__ = ["adaptive_batch_"]
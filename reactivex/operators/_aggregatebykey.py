@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from reactivex import Observable, abc, typing
+from reactivex.internal.basic import identity
+from reactivex.scheduler import TimeoutScheduler
+
+from ._flush import subscribe_flushing
+
+_T = TypeVar("_T")
+_TKey = TypeVar("_TKey")
+
+
+def _count(state: Any, value: Any) -> int:
+    return state + 1
+
+
+def _sum(state: Any, value: Any) -> Any:
+    return state + value
+
+
+def _min(state: Any, value: Any) -> Any:
+    return value if value < state else state
+
+
+def _max(state: Any, value: Any) -> Any:
+    return value if value > state else state
+
+
+def _mean(state: List[Any], value: Any) -> List[Any]:
+    state[0] += value
+    state[1] += 1
+    return state
+
+
+# name: (initial state from the first value, accumulator, result)
+_AGGREGATES: Dict[
+    str, Tuple[Callable[[Any], Any], Callable[[Any, Any], Any], Callable[[Any], Any]]
+] = {
+    "count": (lambda value: 1, _count, identity),
+    "sum": (identity, _sum, identity),
+    "min": (identity, _min, identity),
+    "max": (identity, _max, identity),
+    "mean": (lambda value: [value, 1], _mean, lambda state: state[0] / state[1]),
+}
+
+
+def aggregate_by_key_(
+    key_mapper: typing.Mapper[_T, _TKey],
+    window: typing.RelativeTime,
+    agg: str = "count",
+    value_mapper: Optional[typing.Mapper[_T, Any]] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[Tuple[_TKey, datetime, Any]]]:
+    if agg not in _AGGREGATES:
+        raise ValueError("Unknown aggregate: %r" % agg)
+
+    seed, accumulator, result = _AGGREGATES[agg]
+    value_mapper_: typing.Mapper[_T, Any] = value_mapper or identity
+
+    def aggregate_by_key(
+        source: Observable[_T],
+    ) -> Observable[Tuple[_TKey, datetime, Any]]:
+        """Aggregates the elements of each key over tumbling time
+        windows in a single pass.
+
+        The state is one accumulator per key in a dict, and all keys
+        are flushed together by a single periodic timer, so no subject
+        or timer is created per group or per window.
+
+        Args:
+            source: Source observable to aggregate.
+
+        Returns:
+            An observable sequence of ``(key, window_start, value)``
+            tuples, emitted at the end of every window for each key
+            seen during the window.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[Tuple[_TKey, datetime, Any]],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+            states: Dict[_TKey, Any] = {}
+            window_start = _scheduler.now
+
+            def flush() -> List[Tuple[_TKey, datetime, Any]]:
+                nonlocal states, window_start
+
+                items, states = states, {}
+                start, window_start = window_start, _scheduler.now
+                return [(key, start, result(state)) for key, state in items.items()]
+
+            def on_next(x: _T) -> None:
+                key = key_mapper(x)
+                value = value_mapper_(x)
+                with source.lock:
+                    if key in states:
+                        states[key] = accumulator(states[key], value)
+                    else:
+                        states[key] = seed(value)
+
+            return subscribe_flushing(
+                source, observer, on_next, flush, window, _scheduler, scheduler_
+            )
+
+        return Observable(subscribe)
+
+    return aggregate_by_key
+
+
+__all__ = ["aggregate_by_key_"]
@@ -2,6 +2,9 @@ from dataclasses import dataclass
 from typing import Any, Callable, Optional, TypeVar, cast
 
 from reactivex import Observable, operators, typing
+from reactivex.internal.basic import identity
+
+from ._vectorized import batch_sum
 
 _T = TypeVar("_T")
 
@@ -14,6 +17,7 @@ class AverageValue:
 
 def average_(
     key_mapper: Optional[typing.Mapper[_T, float]] = None,
+    batched: bool = False,
 ) -> Callable[[Observable[_T]], Observable[float]]:
     def average(source: Observable[Any]) -> Observable[float]:
         """Partially applied average operator.
@@ -33,12 +37,19 @@ def average_(
             average of the sequence of values.
         """
 
-        key_mapper_: typing.Mapper[_T, float] = key_mapper or (
-            lambda x: float(cast(Any, x))
-        )
+        if batched:
+            key_mapper_: typing.Mapper[_T, Any] = key_mapper or identity
+
+            def accumulator(prev: AverageValue, cur: Any) -> AverageValue:
+                return AverageValue(
+                    sum=prev.sum + batch_sum(cur), count=prev.count + len(cur)
+                )
+
+        else:
+            key_mapper_ = key_mapper or (lambda x: float(cast(Any, x)))
 
-        def accumulator(prev: AverageValue, cur: float) -> AverageValue:
-            return AverageValue(sum=prev.sum + cur, count=prev.count + 1)
+            def accumulator(prev: AverageValue, cur: Any) -> AverageValue:
+                return AverageValue(sum=prev.sum + cur, count=prev.count + 1)
 
         def mapper(s: AverageValue) -> float:
             if s.count == 0:
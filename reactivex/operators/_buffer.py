@@ -1,7 +1,12 @@
-from typing import Any, Callable, List, Optional, TypeVar
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, TypeVar
 
-from reactivex import Observable, compose
+from reactivex import Observable, abc, compose
 from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.internal.basic import identity
+
+from ._vectorized import to_array
 
 _T = TypeVar("_T")
 
@@ -34,7 +39,7 @@ def buffer_toggle_(
 
 
 def buffer_with_count_(
-    count: int, skip: Optional[int] = None
+    count: int, skip: Optional[int] = None, as_array: bool = False
 ) -> Callable[[Observable[_T]], Observable[List[_T]]]:
     """Projects each element of an observable sequence into zero or more
     buffers which are produced based on element count information.
@@ -48,6 +53,7 @@ def buffer_with_count_(
         skip: [Optional] Number of elements to skip between
             creation of consecutive buffers. If not provided, defaults to
             the count.
+        as_array: [Optional] Emit NumPy arrays instead of lists.
 
     Returns:
         A function that takes an observable source and returns an
@@ -55,24 +61,43 @@ def buffer_with_count_(
     """
 
     def buffer_with_count(source: Observable[_T]) -> Observable[List[_T]]:
-        nonlocal skip
+        skip_ = count if skip is None else skip
 
-        if skip is None:
-            skip = count
+        if count <= 0 or skip_ <= 0:
+            raise ArgumentOutOfRangeException()
 
-        def mapper(value: Observable[_T]) -> Observable[List[_T]]:
-            return value.pipe(
-                ops.to_list(),
-            )
+        emit: Callable[[List[_T]], Any] = to_array if as_array else identity
+
+        def subscribe(
+            observer: abc.ObserverBase[List[_T]],
+            scheduler: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            buffers: Deque[List[_T]] = deque()
+            n = 0
+
+            def on_next(x: _T) -> None:
+                nonlocal n
+
+                if not n % skip_:
+                    buffers.append([])
+                n += 1
 
-        def predicate(value: List[_T]) -> bool:
-            return len(value) > 0
+                for buffer in buffers:
+                    buffer.append(x)
+
+                if buffers and len(buffers[0]) == count:
+                    observer.on_next(emit(buffers.popleft()))
+
+            def on_completed() -> None:
+                while buffers:
+                    observer.on_next(emit(buffers.popleft()))
+                observer.on_completed()
+
+            return source.subscribe(
+                on_next, observer.on_error, on_completed, scheduler=scheduler
+            )
 
-        return source.pipe(
-            ops.window_with_count(count, skip),
-            ops.flat_map(mapper),
-            ops.filter(predicate),
-        )
+        return Observable(subscribe)
 
     return buffer_with_count
 
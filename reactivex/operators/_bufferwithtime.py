@@ -4,6 +4,8 @@ from reactivex import Observable, abc, compose
 from reactivex import operators as ops
 from reactivex import typing
 
+from ._vectorized import to_array
+
 _T = TypeVar("_T")
 
 
@@ -11,14 +13,18 @@ def buffer_with_time_(
     timespan: typing.RelativeTime,
     timeshift: Optional[typing.RelativeTime] = None,
     scheduler: Optional[abc.SchedulerBase] = None,
+    as_array: bool = False,
 ) -> Callable[[Observable[_T]], Observable[List[_T]]]:
     if not timeshift:
         timeshift = timespan
 
-    return compose(
+    buffer_with_time = compose(
         ops.window_with_time(timespan, timeshift, scheduler),
         ops.flat_map(ops.to_list()),
     )
+    if as_array:
+        return compose(buffer_with_time, ops.map(to_array))
+    return buffer_with_time
 
 
 __all__ = ["buffer_with_time_"]
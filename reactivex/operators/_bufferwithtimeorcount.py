@@ -1,8 +1,8 @@
-from typing import Callable, List, Optional, TypeVar
+from typing import Any, Callable, List, Optional, TypeVar
 
-from reactivex import Observable, abc, compose
-from reactivex import operators as ops
-from reactivex import typing
+from reactivex import Observable, abc, typing
+from reactivex.disposable import CompositeDisposable, SerialDisposable
+from reactivex.scheduler import TimeoutScheduler
 
 _T = TypeVar("_T")
 
@@ -12,10 +12,81 @@ def buffer_with_time_or_count_(
     count: int,
     scheduler: Optional[abc.SchedulerBase] = None,
 ) -> Callable[[Observable[_T]], Observable[List[_T]]]:
-    return compose(
-        ops.window_with_time_or_count(timespan, count, scheduler),
-        ops.flat_map(ops.to_iterable()),
-    )
+    def buffer_with_time_or_count(source: Observable[_T]) -> Observable[List[_T]]:
+        """Buffers elements directly into a list that is flushed when
+        either it's full or the timer fires.
+
+        Unlike composing ``window_with_time_or_count`` with
+        ``flat_map(to_iterable())``, no subject or inner subscription is
+        created per buffer. A single serial timer is re-armed each time
+        a buffer is flushed.
+
+        Args:
+            source: Source observable to buffer.
+
+        Returns:
+            An observable sequence of buffers.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[List[_T]],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+            buffer: List[_T] = []
+            buffer_id = 0
+            timer_d = SerialDisposable()
+
+            def create_timer(_id: int) -> None:
+                def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+                    with source.lock:
+                        if _id != buffer_id:
+                            return
+                        flush()
+
+                timer_d.disposable = _scheduler.schedule_relative(timespan, action)
+
+            def flush() -> None:
+                nonlocal buffer, buffer_id
+
+                items, buffer = buffer, []
+                buffer_id += 1
+                observer.on_next(items)
+                create_timer(buffer_id)
+
+            def on_next(x: _T) -> None:
+                with source.lock:
+                    buffer.append(x)
+                    if len(buffer) == count:
+                        flush()
+
+            def on_error(error: Exception) -> None:
+                nonlocal buffer_id
+
+                with source.lock:
+                    buffer_id += 1
+                    timer_d.dispose()
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                nonlocal buffer_id
+
+                with source.lock:
+                    buffer_id += 1
+                    timer_d.dispose()
+                    observer.on_next(buffer)
+                    observer.on_completed()
+
+            create_timer(buffer_id)
+            subscription = source.subscribe(
+                on_next, on_error, on_completed, scheduler=scheduler_
+            )
+            return CompositeDisposable(subscription, timer_d)
+
+        return Observable(subscribe)
+
+    return buffer_with_time_or_count
 
 
 __all__ = ["buffer_with_time_or_count_"]
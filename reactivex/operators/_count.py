@@ -8,8 +8,13 @@ _T = TypeVar("_T")
 
 
 def count_(
-    predicate: Optional[Predicate[_T]] = None,
+    predicate: Optional[Predicate[_T]] = None, batched: bool = False
 ) -> Callable[[Observable[_T]], Observable[int]]:
+    if batched:
+        if predicate:
+            raise ValueError("A predicate cannot be used with batched=True")
+
+        return compose(ops.map(len), ops.sum())
 
     if predicate:
         return compose(
@@ -1,4 +1,5 @@
-from typing import Any, Callable, List, Optional, TypeVar, cast
+from datetime import datetime
+from typing import Any, Callable, Optional, TypeVar, cast
 
 from reactivex import Observable, abc, typing
 from reactivex.disposable import (
@@ -6,6 +7,7 @@ from reactivex.disposable import (
     SerialDisposable,
     SingleAssignmentDisposable,
 )
+from reactivex.internal.constants import DELTA_ZERO
 from reactivex.scheduler import TimeoutScheduler
 
 _T = TypeVar("_T")
@@ -34,40 +36,69 @@ def debounce_(
             scheduler_: Optional[abc.SchedulerBase] = None,
         ) -> abc.DisposableBase:
             _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+            duetime_ = _scheduler.to_timedelta(duetime)
             cancelable = SerialDisposable()
-            has_value = [False]
-            value: List[_T] = [cast(_T, None)]
-            _id: List[int] = [0]
+            has_value = False
+            value: _T = cast(_T, None)
+            deadline: Optional[datetime] = None
+            armed = False
+
+            # A single timer is kept armed per subscription. New values only
+            # push the deadline forward; when the timer fires early it is
+            # re-armed for the remaining time instead of being replaced on
+            # every element.
+            def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+                nonlocal has_value, armed
+
+                with source.lock:
+                    if not has_value or deadline is None:
+                        armed = False
+                        return
+
+                    remaining = deadline - scheduler.now
+                    if remaining > DELTA_ZERO:
+                        cancelable.disposable = scheduler.schedule_relative(
+                            remaining, action
+                        )
+                        return
+
+                    armed = False
+                    has_value = False
+                    x = value
+
+                observer.on_next(x)
 
             def on_next(x: _T) -> None:
-                has_value[0] = True
-                value[0] = x
-                _id[0] += 1
-                current_id = _id[0]
-                d = SingleAssignmentDisposable()
-                cancelable.disposable = d
+                nonlocal has_value, value, deadline, armed
 
-                def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
-                    if has_value[0] and _id[0] == current_id:
-                        observer.on_next(value[0])
-                    has_value[0] = False
+                with source.lock:
+                    has_value = True
+                    value = x
+                    deadline = _scheduler.now + duetime_
+                    if armed:
+                        return
+                    armed = True
 
-                d.disposable = _scheduler.schedule_relative(duetime, action)
+                cancelable.disposable = _scheduler.schedule_relative(duetime_, action)
 
             def on_error(exception: Exception) -> None:
+                nonlocal has_value
+
                 cancelable.dispose()
+                with source.lock:
+                    has_value = False
                 observer.on_error(exception)
-                has_value[0] = False
-                _id[0] += 1
 
             def on_completed() -> None:
+                nonlocal has_value
+
                 cancelable.dispose()
-                if has_value[0]:
-                    observer.on_next(value[0])
+                with source.lock:
+                    should_emit, has_value = has_value, False
+                if should_emit:
+                    observer.on_next(value)
 
                 observer.on_completed()
-                has_value[0] = False
-                _id[0] += 1
 
             subscription = source.subscribe(
                 on_next, on_error, on_completed, scheduler=scheduler_
@@ -1,22 +1,16 @@
+from collections import deque
 from datetime import datetime
-from typing import Any, Callable, List, Optional, TypeVar
-
-from reactivex import Notification, Observable, abc
-from reactivex import operators as ops
-from reactivex import typing
-from reactivex.disposable import (
-    CompositeDisposable,
-    MultipleAssignmentDisposable,
-    SerialDisposable,
-)
-from reactivex.internal.constants import DELTA_ZERO
-from reactivex.notification import OnError
-from reactivex.scheduler import TimeoutScheduler
+from typing import Any, Callable, Deque, List, Optional, Tuple, TypeVar
 
-from ._timestamp import Timestamp
+from reactivex import Observable, abc, typing
+from reactivex.disposable import CompositeDisposable, MultipleAssignmentDisposable
+from reactivex.scheduler import TimeoutScheduler
 
 _T = TypeVar("_T")
 
+# Queued in place of a value to mark completion of the source.
+_COMPLETED: Any = object()
+
 
 def observable_delay_timespan(
     source: Observable[_T],
@@ -26,90 +20,92 @@ def observable_delay_timespan(
     def subscribe(
         observer: abc.ObserverBase[_T], scheduler_: Optional[abc.SchedulerBase] = None
     ):
-        nonlocal duetime
-
         _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+        to_seconds = _scheduler.to_seconds
 
         if isinstance(duetime, datetime):
-            duetime_ = _scheduler.to_datetime(duetime) - _scheduler.now
+            duetime_ = to_seconds(_scheduler.to_datetime(duetime) - _scheduler.now)
         else:
-            duetime_ = _scheduler.to_timedelta(duetime)
+            duetime_ = to_seconds(duetime)
 
-        cancelable = SerialDisposable()
+        cancelable = MultipleAssignmentDisposable()
         exception: Optional[Exception] = None
-        active = [False]
-        running = [False]
-        queue: List[Timestamp[Notification[_T]]] = []
+        active = False
+        running = False
+        queue: Deque[Tuple[float, Any]] = deque()
+
+        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+            nonlocal active, running
+
+            ex: Optional[Exception] = None
+            while True:
+                batch: List[Any] = []
+                with source.lock:
+                    if exception:
+                        # An error that arrived while we were emitting was
+                        # left for us to forward, see on_error.
+                        if running:
+                            ex = exception
+                        running = active = False
+                        break
+
+                    running = True
+                    now = to_seconds(scheduler.now)
+                    while queue and queue[0][0] <= now:
+                        batch.append(queue.popleft()[1])
+
+                    if not batch:
+                        if queue:
+                            recurse_duetime = max(0.0, queue[0][0] - now)
+                        else:
+                            active = False
+                        running = False
+                        break
+
+                for value in batch:
+                    if value is _COMPLETED:
+                        observer.on_completed()
+                    else:
+                        observer.on_next(value)
+
+            if ex:
+                observer.on_error(ex)
+            elif active:
+                cancelable.disposable = scheduler.schedule_relative(
+                    recurse_duetime, action
+                )
+
+        def enqueue(value: Any) -> None:
+            nonlocal active
+
+            with source.lock:
+                queue.append((to_seconds(_scheduler.now) + duetime_, value))
+                if active:
+                    return
+                active = True
+
+            cancelable.disposable = _scheduler.schedule_relative(duetime_, action)
+
+        def on_next(value: _T) -> None:
+            enqueue(value)
 
-        def on_next(notification: Timestamp[Notification[_T]]) -> None:
+        def on_error(error: Exception) -> None:
             nonlocal exception
-            should_run = False
 
             with source.lock:
-                if isinstance(notification.value, OnError):
-                    del queue[:]
-                    queue.append(notification)
-                    exception = notification.value.exception
-                    should_run = not running[0]
-                else:
-                    queue.append(
-                        Timestamp(
-                            value=notification.value,
-                            timestamp=notification.timestamp + duetime_,
-                        )
-                    )
-                    should_run = not active[0]
-                    active[0] = True
+                queue.clear()
+                exception = error
+                should_run = not running
 
             if should_run:
-                if exception:
-                    observer.on_error(exception)
-                else:
-                    mad = MultipleAssignmentDisposable()
-                    cancelable.disposable = mad
-
-                    def action(scheduler: abc.SchedulerBase, state: Any = None):
-                        if exception:
-                            return
-
-                        with source.lock:
-                            running[0] = True
-                            while True:
-                                result = None
-                                if queue and queue[0].timestamp <= scheduler.now:
-                                    result = queue.pop(0).value
-
-                                if result:
-                                    result.accept(observer)
-
-                                if not result:
-                                    break
-
-                            should_continue = False
-                            recurse_duetime: typing.RelativeTime = 0
-                            if queue:
-                                should_continue = True
-                                diff = queue[0].timestamp - scheduler.now
-                                recurse_duetime = max(DELTA_ZERO, diff)
-                            else:
-                                active[0] = False
-
-                            ex = exception
-                            running[0] = False
-
-                        if ex:
-                            observer.on_error(ex)
-                        elif should_continue:
-                            mad.disposable = scheduler.schedule_relative(
-                                recurse_duetime, action
-                            )
+                observer.on_error(error)
 
-                    mad.disposable = _scheduler.schedule_relative(duetime_, action)
+        def on_completed() -> None:
+            enqueue(_COMPLETED)
 
-        subscription = source.pipe(
-            ops.materialize(),
-            ops.timestamp(),
-        ).subscribe(on_next, scheduler=_scheduler)
+        subscription = source.subscribe(
+            on_next, on_error, on_completed, scheduler=_scheduler
+        )
 
         return CompositeDisposable(subscription, cancelable)
 
@@ -0,0 +1,247 @@
+import concurrent.futures
+from asyncio import Future
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import reactivex
+from reactivex import Observable, abc, typing
+from reactivex.disposable import (
+    CompositeDisposable,
+    SerialDisposable,
+    SingleAssignmentDisposable,
+)
+from reactivex.internal import ArgumentOutOfRangeException, LRUCache, NotSet
+from reactivex.notification import Notification, OnCompleted, OnError, OnNext
+from reactivex.operators import default_if_empty, take
+from reactivex.scheduler import TimeoutScheduler
+from reactivex.scheduler.scheduler import Scheduler
+
+_T = TypeVar("_T")
+_TKey = TypeVar("_TKey")
+_TValue = TypeVar("_TValue")
+
+BatchFetch = Callable[
+    [List[_TKey]],
+    Union[
+        Mapping[_TKey, _TValue],
+        "Future[Mapping[_TKey, _TValue]]",
+        "concurrent.futures.Future[Mapping[_TKey, _TValue]]",
+        Observable[Mapping[_TKey, _TValue]],
+    ],
+]
+
+
+def enrich_(
+    key_mapper: typing.Mapper[_T, _TKey],
+    fetch: BatchFetch[_TKey, _TValue],
+    max_batch: int = 100,
+    max_wait: typing.RelativeTime = 0.01,
+    cache_size: int = 0,
+    cache_ttl: Optional[typing.RelativeTime] = None,
+    ordered: bool = True,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[Tuple[_T, Optional[_TValue]]]]:
+    ttl = Scheduler.to_seconds(cache_ttl) if cache_ttl is not None else None
+    if max_batch <= 0 or cache_size < 0:
+        raise ArgumentOutOfRangeException()
+
+    def enrich(source: Observable[_T]) -> Observable[Tuple[_T, Optional[_TValue]]]:
+        """Looks up a value for each element by key, with lookups
+        coalesced, batched and cached.
+
+        Keys that are neither cached nor already being fetched are
+        queued, and the queue is passed to fetch when it holds
+        max_batch keys or max_wait after its first key. Elements
+        waiting for the same key share a single lookup. Notifications
+        are queued under the lock and sent to the observer after it is
+        released, in the order they were queued.
+
+        Args:
+            source: Source observable to enrich.
+
+        Returns:
+            An observable sequence of (element, value) tuples.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[Tuple[_T, Optional[_TValue]]],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+            cache: LRUCache[_TKey, Optional[_TValue]] = LRUCache(cache_size, ttl)
+            # Elements waiting for a value, as [element, value, resolved]
+            pending: Deque[List[Any]] = deque()
+            waiters: Dict[_TKey, List[List[Any]]] = {}
+            batch: List[_TKey] = []
+            batch_id = 0
+            timer = SerialDisposable()
+            fetches = CompositeDisposable()
+            requests: Deque[Tuple[List[_TKey], Observable[Any]]] = deque()
+            outbox: Deque[Notification[Tuple[_T, Optional[_TValue]]]] = deque()
+            is_sending = False
+            is_stopped = False
+
+            def now() -> float:
+                return _scheduler.to_seconds(_scheduler.now)
+
+            def send() -> None:
+                nonlocal is_sending
+
+                # Fetches are subscribed to outside the lock too, as they
+                # may resolve synchronously.
+                while True:
+                    with source.lock:
+                        if not requests:
+                            break
+                        keys, result = requests.popleft()
+                    start(keys, result)
+
+                with source.lock:
+                    if is_sending:
+                        return
+                    is_sending = True
+
+                while True:
+                    with source.lock:
+                        if not outbox:
+                            is_sending = False
+                            return
+                        notification = outbox.popleft()
+                    notification.accept(observer)
+
+            def fail(error: Exception) -> None:
+                with source.lock:
+                    outbox.append(OnError(error))
+                send()
+
+            def drain() -> None:
+                if ordered:
+                    while pending and pending[0][2]:
+                        x, value, _ = pending.popleft()
+                        outbox.append(OnNext((x, value)))
+
+                if is_stopped and not waiters:
+                    outbox.append(OnCompleted())
+
+            def resolve(values: Mapping[_TKey, _TValue], keys: List[_TKey]) -> None:
+                with source.lock:
+                    time = now()
+                    for key in keys:
+                        value = values.get(key)
+                        cache.set(key, value, time)
+                        for entry in waiters.pop(key, []):
+                            entry[1] = value
+                            entry[2] = True
+                            if not ordered:
+                                outbox.append(OnNext((entry[0], value)))
+                    drain()
+
+            def flush() -> None:
+                nonlocal batch, batch_id
+
+                keys, batch = batch, []
+                batch_id += 1
+                timer.disposable = None
+                if not keys:
+                    return
+
+                try:
+                    result = fetch(keys)
+                except Exception as err:  # pylint: disable=broad-except
+                    outbox.append(OnError(err))
+                    return
+
+                if isinstance(result, (Future, concurrent.futures.Future)):
+                    result = reactivex.from_future(result)  # type: ignore
+                if isinstance(result, Observable):
+                    requests.append((keys, result))
+                else:
+                    resolve(result, keys)
+
+            def start(keys: List[_TKey], result: Observable[Any]) -> None:
+                sad = SingleAssignmentDisposable()
+                fetches.add(sad)
+
+                def on_next(values: Mapping[_TKey, _TValue]) -> None:
+                    fetches.remove(sad)
+                    resolve(values, keys)
+                    send()
+
+                sad.disposable = result.pipe(take(1), default_if_empty({})).subscribe(
+                    on_next, fail, scheduler=scheduler_
+                )
+
+            def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+                with source.lock:
+                    if state == batch_id:
+                        flush()
+                send()
+
+            def lookup(x: _T, key: _TKey) -> None:
+                value = cache.get(key, now()) if cache_size else NotSet
+                if value is not NotSet:
+                    if not ordered or not pending:
+                        outbox.append(OnNext((x, value)))
+                    else:
+                        pending.append([x, value, True])
+                    return
+
+                entry = [x, None, False]
+                if ordered:
+                    pending.append(entry)
+                if key in waiters:
+                    waiters[key].append(entry)
+                    return
+
+                waiters[key] = [entry]
+                batch.append(key)
+                if len(batch) >= max_batch:
+                    flush()
+                elif len(batch) == 1:
+                    timer.disposable = _scheduler.schedule_relative(
+                        max_wait, action, batch_id
+                    )
+
+            def on_next(x: _T) -> None:
+                try:
+                    key = key_mapper(x)
+                except Exception as err:  # pylint: disable=broad-except
+                    fail(err)
+                    return
+
+                with source.lock:
+                    lookup(x, key)
+                send()
+
+            def on_completed() -> None:
+                nonlocal is_stopped
+
+                with source.lock:
+                    is_stopped = True
+                    flush()
+                    drain()
+                send()
+
+            subscription = source.subscribe(
+                on_next, fail, on_completed, scheduler=scheduler_
+            )
+            return CompositeDisposable(subscription, timer, fetches)
+
+        return Observable(subscribe)
+
+    return enrich
+
+
+__all__ = ["enrich_"]
@@ -0,0 +1,264 @@
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from reactivex import Observable, abc, typing
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.scheduler.scheduler import Scheduler
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class EventTimeWindow:
+    """A window of elements by event time. Start and end are in
+    seconds, the end is exclusive."""
+
+    start: float
+    end: float
+    items: List[Any] = field(default_factory=list)
+
+
+def event_time_window_(
+    timestamp_mapper: Callable[[_T], typing.AbsoluteTime],
+    size: typing.RelativeTime,
+    slide: Optional[typing.RelativeTime] = None,
+    max_delay: typing.RelativeTime = 0.0,
+    allowed_lateness: typing.RelativeTime = 0.0,
+    late_observer: Optional[abc.ObserverBase[_T]] = None,
+) -> Callable[[Observable[_T]], Observable[EventTimeWindow]]:
+    size_ = Scheduler.to_seconds(size)
+    slide_ = Scheduler.to_seconds(slide) if slide is not None else size_
+    max_delay_ = Scheduler.to_seconds(max_delay)
+    lateness = Scheduler.to_seconds(allowed_lateness)
+    if size_ <= 0 or slide_ <= 0 or max_delay_ < 0 or lateness < 0:
+        raise ArgumentOutOfRangeException()
+
+    def event_time_window(source: Observable[_T]) -> Observable[EventTimeWindow]:
+        """Assigns elements to tumbling or sliding windows by their
+        own timestamps, and emits each window when the watermark passes
+        its end.
+
+        The watermark trails the largest timestamp seen by
+        ``max_delay``, so it only moves with the data and results do
+        not depend on the scheduler. A window whose end has passed is
+        kept for ``allowed_lateness`` more and emitted again, with all
+        its elements, for every late element it receives. Elements
+        arriving after that are sent to the late observer, if any.
+
+        Args:
+            source: Source observable to window.
+
+        Returns:
+            An observable sequence of windows, with their elements in
+            arrival order.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[EventTimeWindow],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            windows: Dict[int, EventTimeWindow] = {}
+            pending: List[Tuple[float, int]] = []
+            retained: List[Tuple[float, int]] = []
+            watermark = -math.inf
+
+            def window(index: int) -> EventTimeWindow:
+                try:
+                    return windows[index]
+                except KeyError:
+                    start = index * slide_
+                    win = windows[index] = EventTimeWindow(start, start + size_)
+                    # A window opened by a late element is emitted as a
+                    # refire, and must not fire again from the heap.
+                    if win.end > watermark:
+                        heapq.heappush(pending, (win.end, index))
+                    heapq.heappush(retained, (win.end + lateness, index))
+                    return win
+
+            def advance(to: float) -> List[EventTimeWindow]:
+                nonlocal watermark
+
+                watermark = max(watermark, to)
+                fired: List[EventTimeWindow] = []
+                while pending and pending[0][0] <= watermark:
+                    fired.append(windows[heapq.heappop(pending)[1]])
+                while retained and retained[0][0] <= watermark:
+                    del windows[heapq.heappop(retained)[1]]
+                return fired
+
+            def on_next(x: _T) -> None:
+                try:
+                    timestamp = Scheduler.to_seconds(timestamp_mapper(x))
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+
+                refired: List[EventTimeWindow] = []
+                with source.lock:
+                    first = math.floor((timestamp - size_) / slide_) + 1
+                    last = math.floor(timestamp / slide_)
+                    is_late = True
+                    for index in range(first, last + 1):
+                        end = index * slide_ + size_
+                        if end + lateness <= watermark:
+                            continue
+                        is_late = False
+                        win = window(index)
+                        win.items.append(x)
+                        if end <= watermark:
+                            refired.append(win)
+
+                    fired = advance(timestamp - max_delay_)
+
+                if is_late:
+                    if late_observer is not None:
+                        late_observer.on_next(x)
+                    return
+
+                for win in refired + fired:
+                    items = list(win.items)
+                    observer.on_next(EventTimeWindow(win.start, win.end, items))
+
+            def on_completed() -> None:
+                with source.lock:
+                    fired = advance(math.inf)
+
+                for win in fired:
+                    observer.on_next(win)
+                observer.on_completed()
+
+            return source.subscribe(
+                on_next, observer.on_error, on_completed, scheduler=scheduler_
+            )
+
+        return Observable(subscribe)
+
+    return event_time_window
+
+
+def event_time_session_window_(
+    timestamp_mapper: Callable[[_T], typing.AbsoluteTime],
+    gap: typing.RelativeTime,
+    max_delay: typing.RelativeTime = 0.0,
+    allowed_lateness: typing.RelativeTime = 0.0,
+    late_observer: Optional[abc.ObserverBase[_T]] = None,
+) -> Callable[[Observable[_T]], Observable[EventTimeWindow]]:
+    gap_ = Scheduler.to_seconds(gap)
+    max_delay_ = Scheduler.to_seconds(max_delay)
+    lateness = Scheduler.to_seconds(allowed_lateness)
+    if gap_ <= 0 or max_delay_ < 0 or lateness < 0:
+        raise ArgumentOutOfRangeException()
+
+    def event_time_session_window(
+        source: Observable[_T],
+    ) -> Observable[EventTimeWindow]:
+        """Groups elements into sessions by their own timestamps. A
+        session ends ``gap`` after its last element, and sessions that
+        come within ``gap`` of each other are merged.
+
+        Sessions are emitted when the watermark passes their end, with
+        the same watermark and lateness rules as
+        :func:`event_time_window <reactivex.operators.event_time_window>`.
+
+        Args:
+            source: Source observable to window.
+
+        Returns:
+            An observable sequence of sessions, with their elements in
+            timestamp order.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[EventTimeWindow],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            # Open sessions ordered by start, each with its (timestamp,
+            # seq, element) entries.
+            sessions: List[Tuple[EventTimeWindow, List[Tuple[float, int, _T]]]] = []
+            watermark = -math.inf
+            seq = 0
+
+            def emit(
+                session: Tuple[EventTimeWindow, List[Tuple[float, int, _T]]]
+            ) -> EventTimeWindow:
+                win, entries = session
+                entries.sort(key=lambda entry: entry[:2])
+                return EventTimeWindow(win.start, win.end, [e[2] for e in entries])
+
+            def advance(to: float) -> List[EventTimeWindow]:
+                nonlocal watermark
+
+                previous, watermark = watermark, max(watermark, to)
+                fired = [
+                    emit(session)
+                    for session in sessions
+                    if previous < session[0].end <= watermark
+                ]
+                sessions[:] = [
+                    session
+                    for session in sessions
+                    if session[0].end + lateness > watermark
+                ]
+                return fired
+
+            def on_next(x: _T) -> None:
+                nonlocal seq
+
+                try:
+                    timestamp = Scheduler.to_seconds(timestamp_mapper(x))
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+
+                refired: List[EventTimeWindow] = []
+                with source.lock:
+                    is_late = timestamp + gap_ + lateness <= watermark
+                    if not is_late:
+                        win = EventTimeWindow(timestamp, timestamp + gap_)
+                        entries = [(timestamp, seq, x)]
+                        seq += 1
+                        keep = []
+                        for session in sessions:
+                            other = session[0]
+                            if other.start <= win.end and win.start <= other.end:
+                                win.start = min(win.start, other.start)
+                                win.end = max(win.end, other.end)
+                                entries.extend(session[1])
+                            else:
+                                keep.append(session)
+                        keep.append((win, entries))
+                        keep.sort(key=lambda session: session[0].start)
+                        sessions[:] = keep
+                        if win.end <= watermark:
+                            refired.append(emit((win, entries)))
+
+                    fired = advance(timestamp - max_delay_)
+
+                if is_late:
+                    if late_observer is not None:
+                        late_observer.on_next(x)
+                    return
+
+                for win in refired + fired:
+                    observer.on_next(win)
+
+            def on_completed() -> None:
+                with source.lock:
+                    fired = advance(math.inf)
+
+                for win in fired:
+                    observer.on_next(win)
+                observer.on_completed()
+
+            return source.subscribe(
+                on_next, observer.on_error, on_completed, scheduler=scheduler_
+            )
+
+        return Observable(subscribe)
+
+    return event_time_session_window
+
+
+__all__ = ["EventTimeWindow", "event_time_session_window_", "event_time_window_"]
@@ -6,6 +6,8 @@ from reactivex import operators as ops
 from reactivex.internal.basic import identity
 from reactivex.typing import Mapper, MapperIndexed
 
+from ._merge import merge_projected
+
 _T1 = TypeVar("_T1")
 _T2 = TypeVar("_T2")
 
@@ -29,10 +31,7 @@ def _flat_map_internal(
             result = from_(mapper_result)
         return result
 
-    return source.pipe(
-        ops.map_indexed(projection),
-        ops.merge_all(),
-    )
+    return merge_projected(source, projection)
 
 
 def flat_map_(
@@ -0,0 +1,91 @@
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from reactivex import Observable, abc, typing
+from reactivex.disposable import CompositeDisposable, SingleAssignmentDisposable
+
+_T = TypeVar("_T")
+
+
+def subscribe_flushing(
+    source: Observable[Any],
+    observer: abc.ObserverBase[_T],
+    on_next: Callable[[Any], None],
+    flush: Callable[[], Iterable[_T]],
+    period: Optional[typing.RelativeTime],
+    scheduler: abc.SchedulerBase,
+    scheduler_: Optional[abc.SchedulerBase] = None,
+) -> abc.DisposableBase:
+    """Subscribes on_next to the source, and emits the elements returned
+    by flush every period, if any, and once more when the source
+    completes.
+
+    Flushes run and emit under the source lock, so they are serialized
+    with the source notifications, and the timer is disposed before the
+    final flush so that nothing is emitted after it. An exception raised
+    by on_next terminates the sequence.
+
+    Args:
+        source: Source observable to subscribe to.
+        observer: Observer to emit the flushed elements to.
+        on_next: Handles a source element. It takes the source lock
+            itself if needed.
+        flush: Returns the elements to emit and resets the state.
+            Called with the source lock held.
+        period: [Optional] Time between two flushes.
+        scheduler: Scheduler to run the periodic flushes on.
+        scheduler_: [Optional] Scheduler to subscribe to the source on.
+
+    Returns:
+        The disposable of the subscription and the timer.
+    """
+
+    timer = SingleAssignmentDisposable()
+    is_stopped = False
+
+    def emit() -> None:
+        for value in flush():
+            observer.on_next(value)
+
+    def action(state: Any = None) -> None:
+        with source.lock:
+            if not is_stopped:
+                emit()
+
+    def on_error(error: Exception) -> None:
+        nonlocal is_stopped
+
+        timer.dispose()
+        with source.lock:
+            if is_stopped:
+                return
+            is_stopped = True
+            observer.on_error(error)
+
+    def on_next_(x: Any) -> None:
+        try:
+            on_next(x)
+        except Exception as err:  # pylint: disable=broad-except
+            on_error(err)
+
+    def on_completed() -> None:
+        nonlocal is_stopped
+
+        timer.dispose()
+        with source.lock:
+            if is_stopped:
+                return
+            is_stopped = True
+            emit()
+            observer.on_completed()
+
+    subscription = source.subscribe(
+        on_next_, on_error, on_completed, scheduler=scheduler_
+    )
+    if period is not None:
+        if not isinstance(scheduler, abc.PeriodicSchedulerBase):
+            raise ValueError("Scheduler must be a PeriodicScheduler")
+        timer.disposable = scheduler.schedule_periodic(period, action)
+    return CompositeDisposable(timer, subscription)
+
+
+__all__ = ["subscribe_flushing"]
@@ -0,0 +1,182 @@
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from reactivex import Observable, abc, typing
+from reactivex.disposable import CompositeDisposable, SerialDisposable
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.scheduler import TimeoutScheduler
+from reactivex.scheduler.scheduler import Scheduler
+
+_T1 = TypeVar("_T1")
+_T2 = TypeVar("_T2")
+
+
+class _JoinSide:
+    """The live elements of one side of a hash join. Elements arrive
+    in time order, so a FIFO of (time, key) gives the expiry order and
+    the per key deques of the index can be trimmed from the left."""
+
+    def __init__(self, key_mapper: typing.Mapper[Any, Any]) -> None:
+        self.key_mapper = key_mapper
+        self.index: Dict[Any, Deque[Tuple[float, Any]]] = {}
+        self.expiry: Deque[Tuple[float, Any]] = deque()
+        self.timer = SerialDisposable()
+        self.done = False
+
+    def __len__(self) -> int:
+        return len(self.expiry)
+
+    def add(self, time: float, key: Any, value: Any) -> None:
+        try:
+            self.index[key].append((time, value))
+        except KeyError:
+            self.index[key] = deque([(time, value)])
+        self.expiry.append((time, key))
+
+    def matches(self, key: Any) -> List[Any]:
+        entries = self.index.get(key)
+        return [value for _, value in entries] if entries else []
+
+    def expire(self, before: float) -> None:
+        expiry, index = self.expiry, self.index
+        while expiry and expiry[0][0] <= before:
+            _, key = expiry.popleft()
+            entries = index[key]
+            entries.popleft()
+            if not entries:
+                del index[key]
+
+    def evict(self) -> None:
+        _, key = self.expiry.popleft()
+        entries = self.index[key]
+        entries.popleft()
+        if not entries:
+            del self.index[key]
+
+
+def hash_join_(
+    right: Observable[_T2],
+    left_key_mapper: typing.Mapper[_T1, Any],
+    right_key_mapper: typing.Mapper[_T2, Any],
+    window: typing.RelativeTime,
+    max_items: Optional[int] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T1]], Observable[Tuple[_T1, _T2]]]:
+    window_ = Scheduler.to_seconds(window)
+    if window_ <= 0 or (max_items is not None and max_items <= 0):
+        raise ArgumentOutOfRangeException()
+
+    def hash_join(source: Observable[_T1]) -> Observable[Tuple[_T1, _T2]]:
+        """Correlates the elements of two sequences with equal keys that
+        arrive within window of each other.
+
+        Each side keeps its live elements in a dict of deques by key,
+        so an element is only compared with the elements that share
+        its key. Expiry is driven by a FIFO and a single timer per
+        side instead of a duration subscription per element.
+
+        Args:
+            source: Source observable, the left side of the join.
+
+        Returns:
+            An observable sequence of (left, right) tuples.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[Tuple[_T1, _T2]],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+            left = _JoinSide(left_key_mapper)
+            right_ = _JoinSide(right_key_mapper)
+            lock = source.lock
+
+            def now() -> float:
+                return _scheduler.to_seconds(_scheduler.now)
+
+            def arm(side: _JoinSide) -> None:
+                def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+                    with lock:
+                        side.expire(now() - window_)
+                        if side:
+                            arm(side)
+                        completed = is_completed()
+
+                    if completed:
+                        observer.on_completed()
+
+                due = side.expiry[0][0] + window_
+                side.timer.disposable = _scheduler.schedule_relative(
+                    max(0.0, due - now()), action
+                )
+
+            def is_completed() -> bool:
+                return (left.done and (right_.done or not left)) or (
+                    right_.done and not right_
+                )
+
+            def on_next(
+                side: _JoinSide, other: _JoinSide, is_left: bool
+            ) -> Callable[[Any], None]:
+                def on_next(value: Any) -> None:
+                    try:
+                        key = side.key_mapper(value)
+                    except Exception as err:  # pylint: disable=broad-except
+                        observer.on_error(err)
+                        return
+
+                    with lock:
+                        time = now()
+                        other.expire(time - window_)
+                        matches = other.matches(key)
+
+                        is_armed = bool(side)
+                        side.add(time, key, value)
+                        if max_items is not None and len(side) > max_items:
+                            side.evict()
+                        if not is_armed:
+                            arm(side)
+
+                    if is_left:
+                        for match in matches:
+                            observer.on_next((value, match))
+                    else:
+                        for match in matches:
+                            observer.on_next((match, value))
+
+                return on_next
+
+            def on_completed(side: _JoinSide) -> Callable[[], None]:
+                def on_completed() -> None:
+                    with lock:
+                        side.done = True
+                        completed = is_completed()
+
+                    if completed:
+                        observer.on_completed()
+
+                return on_completed
+
+            return CompositeDisposable(
+                source.subscribe(
+                    on_next(left, right_, True),
+                    observer.on_error,
+                    on_completed(left),
+                    scheduler=scheduler_,
+                ),
+                right.subscribe(
+                    on_next(right_, left, False),
+                    observer.on_error,
+                    on_completed(right_),
+                    scheduler=scheduler_,
+                ),
+                left.timer,
+                right_.timer,
+            )
+
+        return Observable(subscribe)
+
+    return hash_join
+
+
+__all__ = ["hash_join_"]
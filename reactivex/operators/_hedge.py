@@ -0,0 +1,176 @@
+from asyncio import Future
+from threading import RLock
+from typing import Any, Callable, Dict, Optional, TypeVar, Union, cast
+
+from reactivex import Observable, abc, from_future, typing
+from reactivex.disposable import (
+    CompositeDisposable,
+    Disposable,
+    SerialDisposable,
+    SingleAssignmentDisposable,
+)
+from reactivex.hedgestats import HedgeStats
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.scheduler import TimeoutScheduler
+from reactivex.scheduler.scheduler import Scheduler
+
+from ._merge import merge_projected
+
+_T = TypeVar("_T")
+_TResult = TypeVar("_TResult")
+
+
+def _hedged(
+    request: Callable[[], Union[Observable[_TResult], "Future[_TResult]"]],
+    delay: float,
+    max_hedges: int,
+    stats: Optional[HedgeStats],
+    scheduler: Optional[abc.SchedulerBase],
+) -> Observable[_TResult]:
+    def subscribe(
+        observer: abc.ObserverBase[_TResult],
+        scheduler_: Optional[abc.SchedulerBase] = None,
+    ) -> abc.DisposableBase:
+        _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+        lock = RLock()
+        attempts: Dict[int, SingleAssignmentDisposable] = {}
+        timer = SerialDisposable()
+        started = 0
+        winner: Optional[int] = None
+
+        def win(i: int) -> bool:
+            nonlocal winner
+
+            if winner is None:
+                winner = i
+                timer.dispose()
+                for j, attempt in list(attempts.items()):
+                    if j != i:
+                        attempt.dispose()
+                        del attempts[j]
+                if i and stats is not None:
+                    stats.add_hedge_win()
+            return winner == i
+
+        def on_next(i: int) -> Callable[[_TResult], None]:
+            def on_next(value: _TResult) -> None:
+                with lock:
+                    if win(i):
+                        observer.on_next(value)
+
+            return on_next
+
+        def on_error(i: int) -> Callable[[Exception], None]:
+            def on_error(error: Exception) -> None:
+                with lock:
+                    if winner == i:
+                        observer.on_error(error)
+                        return
+                    if winner is not None:
+                        return
+
+                    attempts.pop(i, None)
+                    if started <= max_hedges:
+                        # Fails fast, without waiting for the hedge delay
+                        start()
+                    elif not attempts:
+                        observer.on_error(error)
+
+            return on_error
+
+        def on_completed(i: int) -> Callable[[], None]:
+            def on_completed() -> None:
+                with lock:
+                    if win(i):
+                        observer.on_completed()
+
+            return on_completed
+
+        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+            with lock:
+                if winner is None and started <= max_hedges:
+                    start()
+
+        def start() -> None:
+            nonlocal started
+
+            i = started
+            started += 1
+            if i and stats is not None:
+                stats.add_hedge()
+
+            sad = SingleAssignmentDisposable()
+            attempts[i] = sad
+            try:
+                result = request()
+                if isinstance(result, Future):
+                    result = from_future(cast("Future[_TResult]", result))
+            except Exception as err:  # pylint: disable=broad-except
+                on_error(i)(err)
+                return
+
+            sad.disposable = result.subscribe(
+                on_next(i), on_error(i), on_completed(i), scheduler=scheduler_
+            )
+            if winner is not None or started > i + 1:
+                return
+            if started <= max_hedges:
+                timer.disposable = _scheduler.schedule_relative(delay, action)
+            else:
+                timer.disposable = None
+
+        if stats is not None:
+            stats.add_request()
+
+        with lock:
+            start()
+
+        def dispose() -> None:
+            with lock:
+                timer.dispose()
+                for attempt in list(attempts.values()):
+                    attempt.dispose()
+                attempts.clear()
+
+        return CompositeDisposable(timer, Disposable(dispose))
+
+    return Observable(subscribe)
+
+
+def hedge_(
+    factory: Callable[[_T], Union[Observable[_TResult], "Future[_TResult]"]],
+    delay: typing.RelativeTime,
+    max_hedges: int = 1,
+    stats: Optional[HedgeStats] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[_TResult]]:
+    delay_ = Scheduler.to_seconds(delay)
+    if delay_ < 0 or max_hedges < 0:
+        raise ArgumentOutOfRangeException()
+
+    def hedge(source: Observable[_T]) -> Observable[_TResult]:
+        """Projects each element to a request and starts extra attempts
+        of the request while it is not answered.
+
+        The first attempt to answer, with an element or by completing,
+        wins and the others are disposed. An attempt that fails starts
+        the next one right away. The request fails when every attempt
+        has failed.
+
+        Args:
+            source: Source observable of requests.
+
+        Returns:
+            An observable sequence merging the answers to the requests.
+        """
+
+        def projection(x: _T, i: int) -> Observable[_TResult]:
+            return _hedged(lambda: factory(x), delay_, max_hedges, stats, scheduler)
+
+        return merge_projected(source, projection)
+
+    return hedge
+
+
+__all__ = ["hedge_"]
@@ -0,0 +1,180 @@
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from reactivex import Observable, abc, typing
+from reactivex.disposable import (
+    CompositeDisposable,
+    Disposable,
+    SingleAssignmentDisposable,
+)
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.scheduler import TimeoutScheduler
+
+_T1 = TypeVar("_T1")
+_T2 = TypeVar("_T2")
+
+
+def map_concurrent_(
+    mapper: typing.Mapper[_T1, _T2],
+    max_concurrency: int,
+    ordered: bool = True,
+    capacity: Optional[int] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T1]], Observable[_T2]]:
+    capacity_ = 2 * max_concurrency if capacity is None else capacity
+    if max_concurrency <= 0 or capacity_ < max_concurrency:
+        raise ArgumentOutOfRangeException()
+
+    def map_concurrent(source: Observable[_T1]) -> Observable[_T2]:
+        """Invokes mapper for each element on the scheduler, with at
+        most max_concurrency invocations running at once.
+
+        Elements are numbered as they arrive. When ordered, results are
+        kept in a reorder buffer by number until the results of all the
+        previous elements are emitted, and no invocation is started
+        more than capacity elements ahead of the next one to emit.
+
+        Args:
+            source: Source observable to map.
+
+        Returns:
+            An observable sequence of the results of mapper.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[_T2],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+            lock = source.lock
+            # Elements waiting for a slot, and results of the elements
+            # that finished before their turn, as (has value, value)
+            waiting: Deque[Tuple[int, _T1]] = deque()
+            results: Dict[int, Tuple[bool, Any]] = {}
+            tasks = CompositeDisposable()
+            index = 0
+            next_emit = 0
+            running = 0
+            is_stopped = False
+            is_done = False
+
+            def can_start() -> bool:
+                return running < max_concurrency and (
+                    not ordered or waiting[0][0] - next_emit < capacity_
+                )
+
+            def start() -> None:
+                nonlocal running
+
+                while waiting and can_start():
+                    running += 1
+                    i, x = waiting.popleft()
+                    sad = SingleAssignmentDisposable()
+                    tasks.add(sad)
+                    sad.disposable = _scheduler.schedule(action, (i, x, sad))
+
+            def action(
+                scheduler: abc.SchedulerBase,
+                state: Tuple[int, _T1, SingleAssignmentDisposable],
+            ) -> None:
+                nonlocal running
+
+                i, x, sad = state
+                try:
+                    result: Tuple[bool, Any] = (True, mapper(x))
+                except Exception as err:  # pylint: disable=broad-except
+                    result = (False, err)
+
+                with lock:
+                    running -= 1
+                    tasks.remove(sad)
+                    if is_done:
+                        return
+
+                    if ordered:
+                        results[i] = result
+                        drain()
+                    else:
+                        emit(result)
+
+                    if not is_done:
+                        start()
+                        if is_stopped and not running and not waiting:
+                            complete()
+
+            def emit(result: Tuple[bool, Any]) -> None:
+                nonlocal is_done
+
+                has_value, value = result
+                if has_value:
+                    observer.on_next(value)
+                else:
+                    is_done = True
+                    waiting.clear()
+                    results.clear()
+                    observer.on_error(value)
+
+            def drain() -> None:
+                nonlocal next_emit
+
+                while not is_done and next_emit in results:
+                    emit(results.pop(next_emit))
+                    next_emit += 1
+
+            def complete() -> None:
+                nonlocal is_done
+
+                is_done = True
+                observer.on_completed()
+
+            def on_next(x: _T1) -> None:
+                nonlocal index
+
+                with lock:
+                    if is_done:
+                        return
+
+                    waiting.append((index, x))
+                    index += 1
+                    start()
+
+            def on_error(error: Exception) -> None:
+                nonlocal is_done
+
+                with lock:
+                    if is_done:
+                        return
+
+                    is_done = True
+                    waiting.clear()
+                    results.clear()
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                nonlocal is_stopped
+
+                with lock:
+                    is_stopped = True
+                    if not is_done and not running and not waiting:
+                        complete()
+
+            def dispose() -> None:
+                nonlocal is_done
+
+                with lock:
+                    is_done = True
+                    waiting.clear()
+                    results.clear()
+
+            subscription = source.subscribe(
+                on_next, on_error, on_completed, scheduler=scheduler_
+            )
+            return CompositeDisposable(subscription, tasks, Disposable(dispose))
+
+        return Observable(subscribe)
+
+    return map_concurrent
+
+
+__all__ = ["map_concurrent_"]
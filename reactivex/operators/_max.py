@@ -6,12 +6,13 @@ from reactivex.internal.basic import identity
 from reactivex.typing import Comparer
 
 from ._min import first_only
+from ._vectorized import batch_max
 
 _T = TypeVar("_T")
 
 
 def max_(
-    comparer: Optional[Comparer[_T]] = None,
+    comparer: Optional[Comparer[_T]] = None, batched: bool = False
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     """Returns the maximum value in an observable sequence according to
     the specified comparer.
@@ -22,12 +23,19 @@ def max_(
 
     Args:
         comparer: [Optional] Comparer used to compare elements.
+        batched: [Optional] Elements are batches of values.
 
     Returns:
         An operator function that takes an observable source and returns
         an observable sequence containing a single element with the
         maximum element in the source sequence.
     """
+    if batched:
+        if comparer:
+            raise ValueError("A comparer cannot be used with batched=True")
+
+        return compose(ops.filter(len), ops.map(batch_max), ops.max())
+
     return compose(
         ops.max_by(cast(Callable[[_T], _T], identity), comparer),
         ops.map(first_only),
@@ -1,10 +1,15 @@
 from asyncio import Future
-from typing import Callable, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
 import reactivex
 from reactivex import Observable, abc, from_future, typing
-from reactivex.disposable import CompositeDisposable, SingleAssignmentDisposable
+from reactivex.disposable import (
+    CompositeDisposable,
+    Disposable,
+    SingleAssignmentDisposable,
+)
 from reactivex.internal import synchronized
+from reactivex.observable.scalarobservable import inline_items
 
 _T = TypeVar("_T")
 
@@ -43,6 +48,23 @@ def merge_(
             queue: List[Observable[_T]] = []
 
             def subscribe(xs: Observable[_T]):
+                items = inline_items(xs, scheduler)
+                while items is not None:
+                    with source.lock:
+                        for item in items:
+                            if group.is_disposed:
+                                return
+                            observer.on_next(item)
+
+                        if not queue:
+                            active_count[0] -= 1
+                            if is_stopped[0] and active_count[0] == 0:
+                                observer.on_completed()
+                            return
+
+                        xs = queue.pop(0)
+                    items = inline_items(xs, scheduler)
+
                 subscription = SingleAssignmentDisposable()
                 group.add(subscription)
 
@@ -88,7 +110,114 @@ def merge_(
     return merge
 
 
+def merge_projected(
+    source: Observable[Any],
+    projection: Callable[[Any, int], Observable[_T]],
+) -> Observable[_T]:
+    """Subscribes to the inner sequence projected from each element of
+    source, and merges their elements into one sequence.
+
+    This is the engine behind merge_all and flat_map. Inner
+    subscriptions are kept in a dict by element index, so registering
+    and releasing an inner sequence is O(1) however many are active.
+
+    Args:
+        source: Source observable.
+        projection: Function returning the inner sequence for an
+            element and its index.
+
+    Returns:
+        The observable sequence that merges the elements of the inner
+        sequences.
+    """
+
+    def subscribe(
+        observer: abc.ObserverBase[_T],
+        scheduler: Optional[abc.SchedulerBase] = None,
+    ) -> abc.DisposableBase:
+        lock = source.lock
+        inners: Dict[int, SingleAssignmentDisposable] = {}
+        is_stopped = False
+        is_disposed = False
+        index = 0
+        m = SingleAssignmentDisposable()
+
+        on_next_inner: typing.OnNext[_T] = synchronized(lock)(observer.on_next)
+        on_error_inner = synchronized(lock)(observer.on_error)
+
+        def on_next(x: Any) -> None:
+            nonlocal index
+
+            i = index
+            index += 1
+            try:
+                inner_source = projection(x, i)
+            except Exception as err:  # pylint: disable=broad-except
+                observer.on_error(err)
+                return
+
+            items = inline_items(inner_source, scheduler)
+            if items is not None:
+                with lock:
+                    for item in items:
+                        if is_disposed:
+                            break
+                        observer.on_next(item)
+                return
+
+            inner_subscription = SingleAssignmentDisposable()
+            with lock:
+                if is_disposed:
+                    return
+                inners[i] = inner_subscription
+
+            def on_completed() -> None:
+                with lock:
+                    inners.pop(i, None)
+                    inner_subscription.dispose()
+                    if is_stopped and not inners:
+                        observer.on_completed()
+
+            inner_subscription.disposable = inner_source.subscribe(
+                on_next_inner, on_error_inner, on_completed, scheduler=scheduler
+            )
+
+        def on_completed() -> None:
+            nonlocal is_stopped
+
+            with lock:
+                is_stopped = True
+                if not inners:
+                    observer.on_completed()
+
+        def dispose() -> None:
+            nonlocal is_disposed
+
+            with lock:
+                is_disposed = True
+                current = list(inners.values())
+                inners.clear()
+
+            m.dispose()
+            for inner_subscription in current:
+                inner_subscription.dispose()
+
+        m.disposable = source.subscribe(
+            on_next, observer.on_error, on_completed, scheduler=scheduler
+        )
+        return Disposable(dispose)
+
+    return Observable(subscribe)
+
+
 def merge_all_() -> Callable[[Observable[Observable[_T]]], Observable[_T]]:
+    def projection(
+        inner_source: Union[Observable[_T], "Future[_T]"], i: int
+    ) -> Observable[_T]:
+        if isinstance(inner_source, Future):
+            return from_future(inner_source)
+        return inner_source
+
     def merge_all(source: Observable[Observable[_T]]) -> Observable[_T]:
         """Partially applied merge_all operator.
 
@@ -103,51 +232,9 @@ def merge_all_() -> Callable[[Observable[Observable[_T]]], Observable[_T]]:
             sequences.
         """
 
-        def subscribe(
-            observer: abc.ObserverBase[_T],
-            scheduler: Optional[abc.SchedulerBase] = None,
-        ):
-            group = CompositeDisposable()
-            is_stopped = [False]
-            m = SingleAssignmentDisposable()
-            group.add(m)
-
-            def on_next(inner_source: Union[Observable[_T], "Future[_T]"]):
-                inner_subscription = SingleAssignmentDisposable()
-                group.add(inner_subscription)
-
-                inner_source = (
-                    from_future(inner_source)
-                    if isinstance(inner_source, Future)
-                    else inner_source
-                )
-
-                @synchronized(source.lock)
-                def on_completed():
-                    group.remove(inner_subscription)
-                    if is_stopped[0] and len(group) == 1:
-                        observer.on_completed()
-
-                on_next: typing.OnNext[_T] = synchronized(source.lock)(observer.on_next)
-                on_error = synchronized(source.lock)(observer.on_error)
-                subscription = inner_source.subscribe(
-                    on_next, on_error, on_completed, scheduler=scheduler
-                )
-                inner_subscription.disposable = subscription
-
-            def on_completed():
-                is_stopped[0] = True
-                if len(group) == 1:
-                    observer.on_completed()
-
-            m.disposable = source.subscribe(
-                on_next, observer.on_error, on_completed, scheduler=scheduler
-            )
-            return group
-
-        return Observable(subscribe)
+        return merge_projected(source, projection)
 
     return merge_all
 
 
-__all__ = ["merge_", "merge_all_"]
+__all__ = ["merge_", "merge_all_", "merge_projected"]
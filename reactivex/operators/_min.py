@@ -6,6 +6,8 @@ from reactivex.internal.basic import identity
 from reactivex.internal.exceptions import SequenceContainsNoElementsError
 from reactivex.typing import Comparer
 
+from ._vectorized import batch_min
+
 _T = TypeVar("_T")
 
 
@@ -17,7 +19,7 @@ def first_only(x: List[_T]) -> _T:
 
 
 def min_(
-    comparer: Optional[Comparer[_T]] = None,
+    comparer: Optional[Comparer[_T]] = None, batched: bool = False
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     """The `min` operator.
 
@@ -30,11 +32,18 @@ def min_(
 
     Args:
         comparer: [Optional] Comparer used to compare elements.
+        batched: [Optional] Elements are batches of values.
 
     Returns:
         An observable sequence containing a single element
         with the minimum element in the source sequence.
     """
+    if batched:
+        if comparer:
+            raise ValueError("A comparer cannot be used with batched=True")
+
+        return compose(ops.filter(len), ops.map(batch_min), ops.min())
+
     return compose(
         ops.min_by(cast(Callable[[_T], _T], identity), comparer),
         ops.map(first_only),
@@ -0,0 +1,170 @@
+import heapq
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from reactivex import Observable, abc, typing
+from reactivex.disposable import CompositeDisposable, SerialDisposable
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.scheduler import TimeoutScheduler
+
+_T = TypeVar("_T")
+
+
+def rate_limit_(
+    rate: float,
+    burst: int = 1,
+    key_mapper: Optional[typing.Mapper[_T, Any]] = None,
+    max_queue: int = 1000,
+    overflow: str = "queue",
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[_T]]:
+    if overflow not in ("queue", "drop"):
+        raise ValueError(f"Unknown overflow strategy: {overflow}")
+    if rate <= 0 or burst < 1 or max_queue < 0:
+        raise ArgumentOutOfRangeException()
+
+    interval = 1.0 / rate
+    tolerance = (burst - 1) * interval
+
+    def rate_limit(source: Observable[_T]) -> Observable[_T]:
+        """Paces the elements of the source with a token bucket per
+        key.
+
+        The bucket is kept as its theoretical arrival time, the time at
+        which it will be full again, so taking a token is a comparison
+        and an addition. Keys with queued elements are kept in a heap
+        by the time of their next token, and a single timer is armed
+        for the earliest one.
+
+        Args:
+            source: Source observable to pace.
+
+        Returns:
+            An observable sequence of the paced elements.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[_T],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+            # Key to [theoretical arrival time, queued elements]
+            buckets: Dict[Any, List[Any]] = {}
+            deadlines: List[Tuple[float, int, Any]] = []
+            seq = 0
+            prune_at = 64
+            timer = SerialDisposable()
+            armed: Optional[float] = None
+            is_stopped = False
+
+            def now() -> float:
+                return _scheduler.to_seconds(_scheduler.now)
+
+            def take(bucket: List[Any], time: float) -> bool:
+                tat = max(bucket[0], time)
+                if tat - tolerance > time:
+                    return False
+
+                bucket[0] = tat + interval
+                return True
+
+            def push(bucket: List[Any], key: Any) -> None:
+                nonlocal seq
+
+                heapq.heappush(deadlines, (bucket[0] - tolerance, seq, key))
+                seq += 1
+
+            def arm() -> None:
+                nonlocal armed
+
+                due = deadlines[0][0]
+                if armed is not None and armed <= due:
+                    return
+
+                armed = due
+                timer.disposable = _scheduler.schedule_relative(
+                    max(0.0, due - now()), action
+                )
+
+            def prune(time: float) -> None:
+                nonlocal prune_at
+
+                for key in [
+                    key
+                    for key, (tat, queue) in buckets.items()
+                    if tat <= time and not queue
+                ]:
+                    del buckets[key]
+                prune_at = max(64, 2 * len(buckets))
+
+            def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+                nonlocal armed
+
+                with source.lock:
+                    armed = None
+                    time = now()
+                    while deadlines and deadlines[0][0] <= time:
+                        _, _, key = heapq.heappop(deadlines)
+                        bucket = buckets[key]
+                        queue = bucket[1]
+                        while queue and take(bucket, time):
+                            observer.on_next(queue.popleft())
+                        if queue:
+                            push(bucket, key)
+
+                    if deadlines:
+                        arm()
+                    elif is_stopped:
+                        observer.on_completed()
+
+            def on_next(x: _T) -> None:
+                try:
+                    key = key_mapper(x) if key_mapper else None
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+
+                with source.lock:
+                    time = now()
+                    bucket = buckets.get(key)
+                    if bucket is None:
+                        if len(buckets) >= prune_at:
+                            prune(time)
+                        bucket = buckets[key] = [time, deque()]
+
+                    queue = bucket[1]
+                    if not queue and take(bucket, time):
+                        observer.on_next(x)
+                    elif overflow == "queue" and (len(queue) < max_queue):
+                        queue.append(x)
+                        if len(queue) == 1:
+                            push(bucket, key)
+                            arm()
+
+            def on_error(error: Exception) -> None:
+                with source.lock:
+                    buckets.clear()
+                    deadlines.clear()
+                    timer.dispose()
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                nonlocal is_stopped
+
+                with source.lock:
+                    is_stopped = True
+                    if not deadlines:
+                        observer.on_completed()
+
+            subscription = source.subscribe(
+                on_next, on_error, on_completed, scheduler=scheduler_
+            )
+            return CompositeDisposable(subscription, timer)
+
+        return Observable(subscribe)
+
+    return rate_limit
+
+
+__all__ = ["rate_limit_"]
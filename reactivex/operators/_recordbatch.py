@@ -0,0 +1,82 @@
+from typing import Any, Callable, Hashable, Mapping, Optional, Sequence, Tuple, Union
+
+from reactivex import GroupedObservable, Observable, abc, compose
+from reactivex import operators as ops
+from reactivex.recordbatch import RecordBatch
+
+
+def pluck_column_(
+    name: str,
+) -> Callable[[Observable[RecordBatch]], Observable[Sequence[Any]]]:
+    def mapper(batch: RecordBatch) -> Sequence[Any]:
+        return batch[name]
+
+    return ops.map(mapper)
+
+
+def filter_batch_(
+    predicate: Callable[[RecordBatch], Sequence[Any]]
+) -> Callable[[Observable[RecordBatch]], Observable[RecordBatch]]:
+    def mapper(batch: RecordBatch) -> RecordBatch:
+        return batch.filter(predicate(batch))
+
+    return compose(ops.map(mapper), ops.filter(len))
+
+
+def map_batch_(
+    mapper: Callable[[RecordBatch], Union[RecordBatch, Mapping[str, Sequence[Any]]]]
+) -> Callable[[Observable[RecordBatch]], Observable[RecordBatch]]:
+    def _mapper(batch: RecordBatch) -> RecordBatch:
+        result = mapper(batch)
+        if isinstance(result, RecordBatch):
+            return result
+
+        return batch.with_columns(result)
+
+    return ops.map(_mapper)
+
+
+def _partition(
+    name: str,
+) -> Callable[[Observable[RecordBatch]], Observable[Tuple[Hashable, RecordBatch]]]:
+    def partition(
+        source: Observable[RecordBatch],
+    ) -> Observable[Tuple[Hashable, RecordBatch]]:
+        def subscribe(
+            observer: abc.ObserverBase[Tuple[Hashable, RecordBatch]],
+            scheduler: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            def on_next(batch: RecordBatch) -> None:
+                try:
+                    parts = batch.partition(name)
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+
+                for part in parts.items():
+                    observer.on_next(part)
+
+            return source.subscribe(
+                on_next, observer.on_error, observer.on_completed, scheduler=scheduler
+            )
+
+        return Observable(subscribe)
+
+    return partition
+
+
+def group_by_column_(
+    name: str,
+) -> Callable[
+    [Observable[RecordBatch]], Observable[GroupedObservable[Hashable, RecordBatch]]
+]:
+    def key_mapper(part: Tuple[Hashable, RecordBatch]) -> Hashable:
+        return part[0]
+
+    def element_mapper(part: Tuple[Hashable, RecordBatch]) -> RecordBatch:
+        return part[1]
+
+    return compose(_partition(name), ops.group_by(key_mapper, element_mapper))
+
+
+__all__ = ["filter_batch_", "group_by_column_", "map_batch_", "pluck_column_"]
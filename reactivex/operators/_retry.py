@@ -1,8 +1,14 @@
-from typing import Callable, Optional, TypeVar
+import random
+from typing import Any, Callable, Optional, Tuple, Type, TypeVar, Union
 
 import reactivex
-from reactivex import Observable
+from reactivex import Observable, abc, typing
+from reactivex.disposable import SerialDisposable, SingleAssignmentDisposable
+from reactivex.internal import ArgumentOutOfRangeException
 from reactivex.internal.utils import infinite
+from reactivex.retrybudget import RetryBudget
+from reactivex.scheduler import TimeoutScheduler
+from reactivex.scheduler.scheduler import Scheduler
 
 _T = TypeVar("_T")
 
@@ -38,4 +44,113 @@ def retry_(
     return retry
 
 
-__all__ = ["retry_"]
+def retry_with_backoff_(
+    max_attempts: Optional[int] = None,
+    base: typing.RelativeTime = 0.1,
+    max_delay: typing.RelativeTime = 30.0,
+    jitter: float = 0.0,
+    retry_on: Optional[
+        Union[
+            Type[Exception],
+            Tuple[Type[Exception], ...],
+            Callable[[Exception], bool],
+        ]
+    ] = None,
+    budget: Optional[RetryBudget] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[_T]]:
+    base_ = Scheduler.to_seconds(base)
+    max_delay_ = Scheduler.to_seconds(max_delay)
+    if (
+        (max_attempts is not None and max_attempts <= 0)
+        or base_ < 0
+        or max_delay_ < 0
+        or not 0.0 <= jitter <= 1.0
+    ):
+        raise ArgumentOutOfRangeException()
+
+    def should_retry(error: Exception) -> bool:
+        if retry_on is None:
+            return True
+        if isinstance(retry_on, (type, tuple)):
+            return isinstance(error, retry_on)
+        return retry_on(error)
+
+    def retry_with_backoff(source: Observable[_T]) -> Observable[_T]:
+        """Resubscribes to the source after an exponentially growing
+        delay each time it fails.
+
+        Like catch_with_iterable, a single serial disposable holds
+        either the current subscription or the pending timer, so an
+        attempt costs one scheduled action and one subscription.
+
+        Args:
+            source: Source observable to retry.
+
+        Returns:
+            An observable sequence producing the elements of the source
+            sequence until it terminates successfully.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[_T],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+            subscription = SerialDisposable()
+            attempts = 0
+            delay = base_
+
+            def on_error(error: Exception) -> None:
+                nonlocal delay
+
+                try:
+                    retry = should_retry(error)
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+
+                if (
+                    not retry
+                    or (max_attempts is not None and attempts >= max_attempts)
+                    or (
+                        budget is not None
+                        and not budget.try_acquire(
+                            _scheduler.to_seconds(_scheduler.now)
+                        )
+                    )
+                ):
+                    observer.on_error(error)
+                    return
+
+                duetime = min(delay, max_delay_)
+                if jitter:
+                    duetime -= duetime * jitter * random.random()
+                delay = min(delay * 2, max_delay_)
+                subscription.disposable = _scheduler.schedule_relative(
+                    duetime, action
+                )
+
+            def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+                nonlocal attempts
+
+                attempts += 1
+                d = SingleAssignmentDisposable()
+                subscription.disposable = d
+                d.disposable = source.subscribe(
+                    observer.on_next,
+                    on_error,
+                    observer.on_completed,
+                    scheduler=scheduler_,
+                )
+
+            action(_scheduler)
+            return subscription
+
+        return Observable(subscribe)
+
+    return retry_with_backoff
+
+
+__all__ = ["retry_", "retry_with_backoff_"]
@@ -0,0 +1,196 @@
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Type, TypeVar, Union
+
+from reactivex import Observable, abc, typing
+from reactivex.internal import ArgumentOutOfRangeException, NotSet, RingBuffer
+from reactivex.internal.basic import identity
+from reactivex.scheduler import TimeoutScheduler
+
+_T = TypeVar("_T")
+
+
+class RollingSum:
+    """Running sum, updated in O(1) as elements enter and leave."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum: Any = 0
+
+    def add(self, seq: int, value: Any) -> None:
+        self.count += 1
+        self.sum += value
+
+    def remove(self, seq: int, value: Any) -> None:
+        self.count -= 1
+        self.sum -= value
+
+    def value(self) -> Any:
+        return self.sum
+
+
+class RollingMean(RollingSum):
+    def value(self) -> float:
+        return self.sum / float(self.count)
+
+
+class RollingVariance:
+    """Population variance using Welford's algorithm, extended with
+    removal of the oldest element."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, seq: int, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, seq: int, value: float) -> None:
+        self.count -= 1
+        if not self.count:
+            self.mean = self.m2 = 0.0
+            return
+
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (value - self.mean)
+
+    def value(self) -> float:
+        return max(0.0, self.m2) / self.count
+
+
+class RollingStd(RollingVariance):
+    def value(self) -> float:
+        return super().value() ** 0.5
+
+
+class RollingMin:
+    """Monotonic deque of (seq, value) pairs. Values that can never be
+    the minimum again are dropped on arrival, so every element is pushed
+    and popped at most once."""
+
+    def __init__(self) -> None:
+        self.queue: Deque[Tuple[int, Any]] = deque()
+
+    def dominates(self, new: Any, old: Any) -> bool:
+        return new <= old
+
+    def add(self, seq: int, value: Any) -> None:
+        queue = self.queue
+        while queue and self.dominates(value, queue[-1][1]):
+            queue.pop()
+        queue.append((seq, value))
+
+    def remove(self, seq: int, value: Any) -> None:
+        if self.queue[0][0] == seq:
+            self.queue.popleft()
+
+    def value(self) -> Any:
+        return self.queue[0][1]
+
+
+class RollingMax(RollingMin):
+    def dominates(self, new: Any, old: Any) -> bool:
+        return new >= old
+
+
+_AGGREGATES: Dict[str, Callable[[], Any]] = {
+    "sum": RollingSum,
+    "mean": RollingMean,
+    "min": RollingMin,
+    "max": RollingMax,
+    "var": RollingVariance,
+    "std": RollingStd,
+}
+
+
+def rolling_(
+    window: Union[int, typing.RelativeTime],
+    agg: str = "mean",
+    key_mapper: Optional[typing.Mapper[_T, Any]] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[Any]]:
+    if agg not in _AGGREGATES:
+        raise ValueError("Unknown rolling aggregate: %r" % agg)
+
+    count: Optional[int] = None
+    if isinstance(window, int):
+        count = window
+        if count <= 0:
+            raise ArgumentOutOfRangeException()
+
+    create_aggregate = _AGGREGATES[agg]
+    key_mapper_: typing.Mapper[_T, Any] = key_mapper or identity
+
+    def rolling(source: Observable[_T]) -> Observable[Any]:
+        """Computes an aggregate over a sliding window that is updated
+        incrementally as elements enter and leave the window.
+
+        Args:
+            source: Source observable to aggregate.
+
+        Returns:
+            An observable sequence with the aggregate of the current
+            window after each element.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[Any],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            aggregate = create_aggregate()
+            seq = 0
+
+            if count is not None:
+                items: RingBuffer[Tuple[int, Any]] = RingBuffer(count)
+
+                def update(value: Any) -> None:
+                    evicted: Union[Tuple[int, Any], Type[NotSet]]
+                    evicted = items.append((seq, value))
+                    if evicted is not NotSet:
+                        aggregate.remove(*evicted)
+                    aggregate.add(seq, value)
+
+            else:
+                _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+                timespan: timedelta = _scheduler.to_timedelta(window)
+                timed: RingBuffer[Tuple[int, datetime, Any]] = RingBuffer()
+
+                def update(value: Any) -> None:
+                    now = _scheduler.now
+                    while timed and now - timed.peek()[1] >= timespan:
+                        seq_, _, value_ = timed.popleft()
+                        aggregate.remove(seq_, value_)
+                    timed.append((seq, now, value))
+                    aggregate.add(seq, value)
+
+            def on_next(x: _T) -> None:
+                nonlocal seq
+
+                try:
+                    value = key_mapper_(x)
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+
+                with source.lock:
+                    update(value)
+                    seq += 1
+                    result = aggregate.value()
+
+                observer.on_next(result)
+
+            return source.subscribe(
+                on_next, observer.on_error, observer.on_completed, scheduler=scheduler_
+            )
+
+        return Observable(subscribe)
+
+    return rolling
+
+
+__all__ = ["rolling_"]
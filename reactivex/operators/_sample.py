@@ -1,11 +1,74 @@
-from typing import Any, Callable, Optional, TypeVar, Union, cast
+from threading import RLock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
+from weakref import WeakKeyDictionary
 
 import reactivex
-from reactivex import Observable, abc, typing
-from reactivex.disposable import CompositeDisposable
+from reactivex import Observable, abc
+from reactivex import operators as ops
+from reactivex import typing
+from reactivex.disposable import CompositeDisposable, Disposable
+from reactivex.scheduler import TimeoutScheduler
 
 _T = TypeVar("_T")
 
+# Scheduler to {period: [shared interval, number of subscribers]}
+_shared_ticks: MutableMapping[abc.SchedulerBase, Dict[float, List[Any]]] = (
+    WeakKeyDictionary()
+)
+_shared_ticks_lock = RLock()
+
+
+def shared_interval(
+    period: typing.RelativeTime, scheduler: Optional[abc.SchedulerBase] = None
+) -> Observable[int]:
+    """Returns an interval sequence that is shared by every subscriber
+    using the same scheduler and period, so that any number of
+    subscriptions cost a single periodic timer. The timer is started by
+    the first subscriber, and stopped and forgotten when the last one
+    unsubscribes.
+    """
+
+    def subscribe(
+        observer: abc.ObserverBase[int], scheduler_: Optional[abc.SchedulerBase] = None
+    ) -> abc.DisposableBase:
+        _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+        seconds = _scheduler.to_seconds(period)
+
+        with _shared_ticks_lock:
+            ticks = _shared_ticks.setdefault(_scheduler, {})
+            entry = ticks.get(seconds)
+            if entry is None:
+                tick = reactivex.interval(seconds).pipe(ops.share())
+                entry = ticks[seconds] = [tick, 0]
+            entry[1] += 1
+
+        subscription = entry[0].subscribe(observer, scheduler=_scheduler)
+
+        def dispose() -> None:
+            subscription.dispose()
+            with _shared_ticks_lock:
+                entry[1] -= 1
+                if entry[1] or ticks.get(seconds) is not entry:
+                    return
+
+                del ticks[seconds]
+                if not ticks and _shared_ticks.get(_scheduler) is ticks:
+                    del _shared_ticks[_scheduler]
+
+        return Disposable(dispose)
+
+    return Observable(subscribe)
+
 
 def sample_observable(
     source: Observable[_T], sampler: Observable[Any]
@@ -53,6 +116,7 @@ def sample_observable(
 def sample_(
     sampler: Union[typing.RelativeTime, Observable[Any]],
     scheduler: Optional[abc.SchedulerBase] = None,
+    shared: bool = False,
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     def sample(source: Observable[_T]) -> Observable[_T]:
         """Samples the observable sequence at each interval.
@@ -69,6 +133,8 @@ def sample_(
 
         if isinstance(sampler, abc.ObservableBase):
             return sample_observable(source, sampler)
+        elif shared:
+            return sample_observable(source, shared_interval(sampler, scheduler))
         else:
             return sample_observable(
                 source, reactivex.interval(sampler, scheduler=scheduler)
@@ -0,0 +1,143 @@
+import heapq
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from reactivex import Observable, abc, typing
+from reactivex.disposable import CompositeDisposable, SerialDisposable
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.scheduler import TimeoutScheduler
+from reactivex.scheduler.scheduler import Scheduler
+
+_T = TypeVar("_T")
+
+
+def session_window_(
+    gap: typing.RelativeTime,
+    key_mapper: Optional[typing.Mapper[_T, Any]] = None,
+    resolution: Optional[typing.RelativeTime] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[List[_T]]]:
+    gap_ = Scheduler.to_seconds(gap)
+    resolution_ = Scheduler.to_seconds(resolution) if resolution else 0.0
+    if gap_ <= 0 or resolution_ < 0:
+        raise ArgumentOutOfRangeException()
+
+    def session_window(source: Observable[_T]) -> Observable[List[_T]]:
+        """Buffers the elements of each key into sessions that are
+        closed after gap of inactivity.
+
+        Sessions are kept in a dict by key and their deadlines in a
+        heap with one entry per open session. Activity only updates the
+        last seen time of the session; stale heap entries are pushed
+        back with the actual deadline when they come up. A single timer
+        is armed for the earliest deadline and closes every session due
+        at that time.
+
+        Args:
+            source: Source observable to split into sessions.
+
+        Returns:
+            An observable sequence of sessions, as lists of elements.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[List[_T]],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+            # Key to [last seen, elements]
+            sessions: Dict[Any, List[Any]] = {}
+            deadlines: List[Tuple[float, int, Any]] = []
+            seq = 0
+            timer = SerialDisposable()
+            armed = False
+
+            def now() -> float:
+                return _scheduler.to_seconds(_scheduler.now)
+
+            def arm() -> None:
+                nonlocal armed
+
+                due = deadlines[0][0]
+                if resolution_:
+                    due = math.ceil(due / resolution_) * resolution_
+
+                armed = True
+                timer.disposable = _scheduler.schedule_relative(
+                    max(0.0, due - now()), action
+                )
+
+            def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+                nonlocal armed
+
+                closed: List[List[_T]] = []
+                with source.lock:
+                    armed = False
+                    time = now()
+                    while deadlines and deadlines[0][0] <= time:
+                        _, id_, key = heapq.heappop(deadlines)
+                        last_seen, items = sessions[key]
+                        deadline = last_seen + gap_
+                        if deadline <= time:
+                            del sessions[key]
+                            closed.append(items)
+                        else:
+                            heapq.heappush(deadlines, (deadline, id_, key))
+
+                    if deadlines:
+                        arm()
+
+                for items in closed:
+                    observer.on_next(items)
+
+            def on_next(x: _T) -> None:
+                nonlocal seq
+
+                try:
+                    key = key_mapper(x) if key_mapper else None
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+
+                with source.lock:
+                    time = now()
+                    session = sessions.get(key)
+                    if session is not None:
+                        session[0] = time
+                        session[1].append(x)
+                        return
+
+                    sessions[key] = [time, [x]]
+                    heapq.heappush(deadlines, (time + gap_, seq, key))
+                    seq += 1
+                    if not armed:
+                        arm()
+
+            def on_error(error: Exception) -> None:
+                with source.lock:
+                    sessions.clear()
+                    timer.dispose()
+                observer.on_error(error)
+
+            def on_completed() -> None:
+                with source.lock:
+                    closed = [items for _, items in sessions.values()]
+                    sessions.clear()
+                    timer.dispose()
+
+                for items in closed:
+                    observer.on_next(items)
+                observer.on_completed()
+
+            subscription = source.subscribe(
+                on_next, on_error, on_completed, scheduler=scheduler_
+            )
+            return CompositeDisposable(subscription, timer)
+
+        return Observable(subscribe)
+
+    return session_window
+
+
+__all__ = ["session_window_"]
@@ -0,0 +1,318 @@
+import heapq
+import math
+import random
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from reactivex import Observable, abc, typing
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.internal.basic import identity
+from reactivex.scheduler import TimeoutScheduler
+
+from ._flush import subscribe_flushing
+
+_T = TypeVar("_T")
+
+_MASK64 = (1 << 64) - 1
+
+
+def _hash64(value: Any) -> int:
+    """Spreads the bits of the builtin hash over 64 bits (splitmix64
+    finalizer). Small ints hash to themselves, which would otherwise
+    leave most register and counter bits unused."""
+
+    h = (hash(value) + 0x9E3779B97F4A7C15) & _MASK64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return h ^ (h >> 31)
+
+
+class TopK:
+    """The k largest elements by key, kept in a min-heap of size k.
+    On equal keys the earliest element wins."""
+
+    def __init__(self, k: int, key_mapper: typing.Mapper[Any, Any]) -> None:
+        self.k = k
+        self.key_mapper = key_mapper
+        self.heap: List[Tuple[Any, int, Any]] = []
+        self.seq = 0
+
+    def add(self, value: Any) -> None:
+        entry = (self.key_mapper(value), -self.seq, value)
+        self.seq += 1
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        elif entry[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, entry)
+
+    def value(self) -> List[Any]:
+        entries = sorted(self.heap, key=lambda entry: entry[:2], reverse=True)
+        return [entry[2] for entry in entries]
+
+
+class QuantileSketch:
+    """KLL quantile sketch. Items are kept in a hierarchy of compactors
+    where an item at level h stands for 2**h input items. When the
+    sketch is full, the first level over capacity is sorted and every
+    other item, starting at a random offset, is promoted to the next
+    level. Memory is O(k) and the rank error is about 1.7 / k."""
+
+    def __init__(self, k: int = 200) -> None:
+        self.k = k
+        self.levels: List[List[Any]] = [[]]
+        self.size = 0
+        self.count = 0
+        self.max_size = 0
+        self.random = random.Random()
+        self._update_max_size()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _update_max_size(self) -> None:
+        self.max_size = sum(self._capacity(h) for h in range(len(self.levels)))
+
+    def add(self, value: Any) -> None:
+        self.levels[0].append(value)
+        self.size += 1
+        self.count += 1
+        if self.size >= self.max_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        for level, items in enumerate(self.levels):
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                    self._update_max_size()
+
+                items.sort()
+                offset = self.random.randint(0, 1)
+                self.levels[level + 1].extend(items[offset::2])
+                self.size -= len(items) - len(items[offset::2])
+                items.clear()
+                return
+
+    def quantiles(self, qs: Sequence[float]) -> List[Any]:
+        weighted = sorted(
+            (value, 1 << level)
+            for level, items in enumerate(self.levels)
+            for value in items
+        )
+        if not weighted:
+            return [None for _ in qs]
+
+        total = sum(weight for _, weight in weighted)
+        results: List[Any] = []
+        for q in qs:
+            target = q * total
+            cumulative = 0
+            result = weighted[-1][0]
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    result = value
+                    break
+            results.append(result)
+        return results
+
+
+class HyperLogLog:
+    """HyperLogLog distinct count estimator with 2**precision registers
+    of one byte each. The standard error is about
+    1.04 / sqrt(2**precision)."""
+
+    def __init__(self, precision: int = 14) -> None:
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+        self.shift = 64 - precision
+        self.mask = (1 << self.shift) - 1
+
+    def add(self, value: Any) -> None:
+        h = _hash64(value)
+        index = h >> self.shift
+        rank = self.shift - (h & self.mask).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def value(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-r for r in self.registers)
+        if estimate <= 2.5 * m:
+            zeros = self.registers.count(0)
+            if zeros:
+                estimate = m * math.log(m / float(zeros))
+        return int(round(estimate))
+
+
+class CountMinSketch:
+    """Count-Min sketch of item frequencies, together with the k items
+    with the highest estimated counts seen so far. Estimates never
+    undercount, and overcount by at most 2n / width with probability
+    1 - 2**-depth.
+
+    The candidates are also kept in a min-heap by estimate. Estimates
+    only grow, so a heap entry may be lower than its candidate's
+    current estimate; such entries are refreshed when they reach the
+    top, before the smallest candidate is compared."""
+
+    def __init__(self, k: int = 10, width: int = 2048, depth: int = 4) -> None:
+        self.k = k
+        self.width = width
+        self.depth = depth
+        self.rows = [[0] * width for _ in range(depth)]
+        self.candidates: Dict[Any, int] = {}
+        self.heap: List[Tuple[int, int, Any]] = []
+        self.seq = 0
+
+    def add(self, value: Any) -> None:
+        h = _hash64(value)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        width = self.width
+        estimate = 0
+        for i, row in enumerate(self.rows):
+            index = (h1 + i * h2) % width
+            count = row[index] + 1
+            row[index] = count
+            if not i or count < estimate:
+                estimate = count
+
+        candidates = self.candidates
+        if value in candidates:
+            candidates[value] = estimate
+            return
+
+        heap = self.heap
+        entry = (estimate, self.seq, value)
+        self.seq += 1
+        if len(candidates) < self.k:
+            candidates[value] = estimate
+            heapq.heappush(heap, entry)
+            return
+
+        while heap[0][0] != candidates[heap[0][2]]:
+            _, seq, top = heap[0]
+            heapq.heapreplace(heap, (candidates[top], seq, top))
+
+        if estimate > heap[0][0]:
+            del candidates[heapq.heapreplace(heap, entry)[2]]
+            candidates[value] = estimate
+
+    def value(self) -> List[Tuple[Any, int]]:
+        return sorted(self.candidates.items(), key=lambda item: item[1], reverse=True)
+
+
+def _sketch(
+    create: Callable[[], Any],
+    snapshot: Callable[[Any], Any],
+    interval: Optional[typing.RelativeTime],
+    scheduler: Optional[abc.SchedulerBase],
+) -> Callable[[Observable[Any]], Observable[Any]]:
+    def sketch(source: Observable[Any]) -> Observable[Any]:
+        """Feeds the source elements into a bounded memory sketch and
+        emits a snapshot of it when the source completes, or at the end
+        of every interval, after which the sketch is reset.
+
+        Args:
+            source: Source observable to summarize.
+
+        Returns:
+            An observable sequence of sketch snapshots.
+        """
+
+        def subscribe(
+            observer: abc.ObserverBase[Any],
+            scheduler_: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+            state = create()
+
+            def flush() -> List[Any]:
+                nonlocal state
+
+                result = snapshot(state)
+                state = create()
+                return [result]
+
+            def on_next(x: Any) -> None:
+                with source.lock:
+                    state.add(x)
+
+            return subscribe_flushing(
+                source, observer, on_next, flush, interval, _scheduler, scheduler_
+            )
+
+        return Observable(subscribe)
+
+    return sketch
+
+
+def top_k_(
+    k: int,
+    key_mapper: Optional[typing.Mapper[_T, Any]] = None,
+    interval: Optional[typing.RelativeTime] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[List[_T]]]:
+    if k <= 0:
+        raise ArgumentOutOfRangeException()
+
+    key_mapper_ = key_mapper or identity
+
+    def create() -> TopK:
+        return TopK(k, key_mapper_)
+
+    return _sketch(create, TopK.value, interval, scheduler)
+
+
+def quantiles_(
+    qs: Sequence[float],
+    k: int = 200,
+    interval: Optional[typing.RelativeTime] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[Any]], Observable[List[Any]]]:
+    if k <= 0 or any(not 0.0 <= q <= 1.0 for q in qs):
+        raise ArgumentOutOfRangeException()
+
+    qs = list(qs)
+
+    def create() -> QuantileSketch:
+        return QuantileSketch(k)
+
+    def snapshot(sketch: QuantileSketch) -> List[Any]:
+        return sketch.quantiles(qs)
+
+    return _sketch(create, snapshot, interval, scheduler)
+
+
+def approx_distinct_count_(
+    precision: int = 14,
+    interval: Optional[typing.RelativeTime] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[Any]], Observable[int]]:
+    if not 4 <= precision <= 18:
+        raise ArgumentOutOfRangeException()
+
+    def create() -> HyperLogLog:
+        return HyperLogLog(precision)
+
+    return _sketch(create, HyperLogLog.value, interval, scheduler)
+
+
+def heavy_hitters_(
+    k: int = 10,
+    width: int = 2048,
+    depth: int = 4,
+    interval: Optional[typing.RelativeTime] = None,
+    scheduler: Optional[abc.SchedulerBase] = None,
+) -> Callable[[Observable[_T]], Observable[List[Tuple[_T, int]]]]:
+    if k <= 0 or width <= 0 or depth <= 0:
+        raise ArgumentOutOfRangeException()
+
+    def create() -> CountMinSketch:
+        return CountMinSketch(k, width, depth)
+
+    return _sketch(create, CountMinSketch.value, interval, scheduler)
+
+
+__all__ = ["approx_distinct_count_", "heavy_hitters_", "quantiles_", "top_k_"]
@@ -1,11 +1,15 @@
-from typing import Callable, List, Optional, TypeVar
+from typing import Callable, Optional, TypeVar
 
 from reactivex import Observable, abc
+from reactivex.internal import ArgumentOutOfRangeException, NotSet, RingBuffer
 
 _T = TypeVar("_T")
 
 
 def skip_last_(count: int) -> Callable[[Observable[_T]], Observable[_T]]:
+    if count < 0:
+        raise ArgumentOutOfRangeException()
+
     def skip_last(source: Observable[_T]) -> Observable[_T]:
         """Bypasses a specified number of elements at the end of an
         observable sequence.
@@ -28,16 +32,13 @@ def skip_last_(count: int) -> Callable[[Observable[_T]], Observable[_T]]:
             observer: abc.ObserverBase[_T],
             scheduler: Optional[abc.SchedulerBase] = None,
         ):
-            q: List[_T] = []
+            q: RingBuffer[_T] = RingBuffer(count)
 
             def on_next(value: _T) -> None:
-                front = None
                 with source.lock:
-                    q.append(value)
-                    if len(q) > count:
-                        front = q.pop(0)
+                    front = q.append(value)
 
-                if front is not None:
+                if front is not NotSet:
                     observer.on_next(front)
 
             return source.subscribe(
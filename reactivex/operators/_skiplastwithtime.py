@@ -1,6 +1,8 @@
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from datetime import datetime
+from typing import Callable, Optional, Tuple, TypeVar
 
 from reactivex import Observable, abc, typing
+from reactivex.internal import RingBuffer
 from reactivex.scheduler import TimeoutScheduler
 
 _T = TypeVar("_T")
@@ -42,18 +44,18 @@ def skip_last_with_time_(
                 scheduler or scheduler_ or TimeoutScheduler.singleton()
             )
             duration = _scheduler.to_timedelta(duration)
-            q: List[Dict[str, Any]] = []
+            q: RingBuffer[Tuple[datetime, _T]] = RingBuffer()
 
             def on_next(x: _T) -> None:
                 now = _scheduler.now
-                q.append({"interval": now, "value": x})
-                while q and now - q[0]["interval"] >= duration:
-                    observer.on_next(q.pop(0)["value"])
+                q.append((now, x))
+                while q and now - q.peek()[0] >= duration:
+                    observer.on_next(q.popleft()[1])
 
             def on_completed() -> None:
                 now = _scheduler.now
-                while q and now - q[0]["interval"] >= duration:
-                    observer.on_next(q.pop(0)["value"])
+                while q and now - q.peek()[0] >= duration:
+                    observer.on_next(q.popleft()[1])
 
                 observer.on_completed()
 
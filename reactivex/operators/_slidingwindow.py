@@ -0,0 +1,65 @@
+from typing import Callable, Optional, Tuple, TypeVar
+
+from reactivex import Observable, abc
+from reactivex.internal import ArgumentOutOfRangeException, RingBuffer
+
+_T = TypeVar("_T")
+
+
+def sliding_window_(
+    count: int, step: int = 1
+) -> Callable[[Observable[_T]], Observable[Tuple[_T, ...]]]:
+    """Emits the last count elements as a tuple every step elements,
+    once count elements have been received.
+
+    Examples:
+        >>> sliding_window(3)
+        >>> sliding_window(1000, 10)
+
+    Args:
+        count: Length of each window.
+        step: [Optional] Number of elements between consecutive
+            windows. Defaults to 1.
+
+    Returns:
+        An observable sequence of windows.
+    """
+
+    if count <= 0:
+        raise ArgumentOutOfRangeException()
+
+    if step <= 0:
+        raise ArgumentOutOfRangeException()
+
+    def sliding_window(source: Observable[_T]) -> Observable[Tuple[_T, ...]]:
+        def subscribe(
+            observer: abc.ObserverBase[Tuple[_T, ...]],
+            scheduler: Optional[abc.SchedulerBase] = None,
+        ) -> abc.DisposableBase:
+            q: RingBuffer[_T] = RingBuffer(count)
+            pending = count
+
+            def on_next(x: _T) -> None:
+                nonlocal pending
+                window = None
+
+                with source.lock:
+                    q.append(x)
+                    pending -= 1
+                    if not pending:
+                        pending = step
+                        window = q.snapshot()
+
+                if window is not None:
+                    observer.on_next(window)
+
+            return source.subscribe(
+                on_next, observer.on_error, observer.on_completed, scheduler=scheduler
+            )
+
+        return Observable(subscribe)
+
+    return sliding_window
+
+
+__all__ = ["sliding_window_"]
@@ -4,12 +4,17 @@ from reactivex import Observable, compose
 from reactivex import operators as ops
 from reactivex.typing import Mapper
 
+from ._vectorized import batch_sum
+
 
 def sum_(
-    key_mapper: Optional[Mapper[Any, float]] = None
+    key_mapper: Optional[Mapper[Any, float]] = None, batched: bool = False
 ) -> Callable[[Observable[Any]], Observable[float]]:
     if key_mapper:
-        return compose(ops.map(key_mapper), ops.sum())
+        return compose(ops.map(key_mapper), ops.sum(batched=batched))
+
+    if batched:
+        return compose(ops.map(batch_sum), ops.sum())
 
     def accumulator(prev: float, cur: float) -> float:
         return prev + cur
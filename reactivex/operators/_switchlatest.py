@@ -1,21 +1,153 @@
 from asyncio import Future
-from typing import Any, Callable, Optional, TypeVar, Union
+from threading import RLock
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union
 
 from reactivex import Observable, abc, from_future
 from reactivex.disposable import (
     CompositeDisposable,
+    Disposable,
     SerialDisposable,
     SingleAssignmentDisposable,
 )
+from reactivex.observable.scalarobservable import inline_items
+from reactivex.typing import Mapper
 
 _T = TypeVar("_T")
+_T1 = TypeVar("_T1")
+_T2 = TypeVar("_T2")
+
+
+class _SwitchObserver(abc.ObserverBase[Any]):
+    """Observer of the outer sequence of switch_latest and exhaust_map.
+
+    Inner sequences are numbered by a generation counter, and an inner
+    observer only forwards its notifications while its number is the
+    latest one. The check and the forwarded notification are made under
+    the same lock as the switch to a new generation, so that an inner
+    sequence running on another thread cannot emit after it has been
+    replaced."""
+
+    def __init__(
+        self,
+        observer: abc.ObserverBase[Any],
+        mapper: Optional[Mapper[Any, Any]],
+        exhaust: bool,
+        scheduler: Optional[abc.SchedulerBase],
+        lock: RLock,
+    ) -> None:
+        self.observer = observer
+        self.mapper = mapper
+        self.exhaust = exhaust
+        self.scheduler = scheduler
+        self.lock = lock
+        self.latest = 0
+        self.has_latest = False
+        self.is_stopped = False
+        self.inner_subscription = SerialDisposable()
+
+    def on_next(self, value: Any) -> None:
+        if self.exhaust and self.has_latest:
+            return
+
+        if self.mapper:
+            try:
+                inner_source = self.mapper(value)
+            except Exception as err:  # pylint: disable=broad-except
+                self.on_error(err)
+                return
+        else:
+            inner_source = value
+
+        items: Optional[Sequence[Any]] = inline_items(inner_source, self.scheduler)
+        with self.lock:
+            if self.exhaust and self.has_latest:
+                return
+            self.latest += 1
+            generation = self.latest
+            # The previous inner sequence is muted from here on, and is
+            # disposed below, before the new one is subscribed to.
+            self.has_latest = items is None
+
+        if items is not None:
+            self.inner_subscription.disposable = Disposable()
+            for item in items:
+                with self.lock:
+                    if self.latest != generation or self.inner_subscription.is_disposed:
+                        break
+                    self.observer.on_next(item)
+            return
+
+        if isinstance(inner_source, Future):
+            inner_source = from_future(inner_source)
+
+        # If a later inner sequence replaces this one while it is being
+        # subscribed to, the subscription is disposed on assignment.
+        sad = SingleAssignmentDisposable()
+        self.inner_subscription.disposable = sad
+        sad.disposable = inner_source.subscribe(
+            _SwitchInnerObserver(self, generation), scheduler=self.scheduler
+        )
+
+    def on_error(self, error: Exception) -> None:
+        with self.lock:
+            self.observer.on_error(error)
+
+    def on_completed(self) -> None:
+        with self.lock:
+            self.is_stopped = True
+            if not self.has_latest:
+                self.observer.on_completed()
+
+
+class _SwitchInnerObserver(abc.ObserverBase[Any]):
+    __slots__ = ("parent", "generation")
+
+    def __init__(self, parent: _SwitchObserver, generation: int) -> None:
+        self.parent = parent
+        self.generation = generation
+
+    def on_next(self, value: Any) -> None:
+        parent = self.parent
+        with parent.lock:
+            if parent.latest == self.generation:
+                parent.observer.on_next(value)
+
+    def on_error(self, error: Exception) -> None:
+        parent = self.parent
+        with parent.lock:
+            if parent.latest == self.generation:
+                parent.observer.on_error(error)
+
+    def on_completed(self) -> None:
+        parent = self.parent
+        with parent.lock:
+            if parent.latest == self.generation:
+                parent.has_latest = False
+                if parent.is_stopped:
+                    parent.observer.on_completed()
+
+
+def _switch(
+    source: Observable[Any], mapper: Optional[Mapper[Any, Any]], exhaust: bool
+) -> Observable[Any]:
+    def subscribe(
+        observer: abc.ObserverBase[Any],
+        scheduler: Optional[abc.SchedulerBase] = None,
+    ) -> abc.DisposableBase:
+        switch_observer = _SwitchObserver(
+            observer, mapper, exhaust, scheduler, source.lock
+        )
+        subscription = source.subscribe(switch_observer, scheduler=scheduler)
+        return CompositeDisposable(subscription, switch_observer.inner_subscription)
+
+    return Observable(subscribe)
 
 
 def switch_latest_() -> (
     Callable[[Observable[Union[Observable[_T], "Future[_T]"]]], Observable[_T]]
 ):
     def switch_latest(
-        source: Observable[Union[Observable[_T], "Future[_T]"]]
+        source: Observable[Union[Observable[_T], "Future[_T]"]],
     ) -> Observable[_T]:
         """Partially applied switch_latest operator.
 
@@ -29,62 +161,44 @@ def switch_latest_() -> (
             that has been received.
         """
 
-        def subscribe(
-            observer: abc.ObserverBase[_T],
-            scheduler: Optional[abc.SchedulerBase] = None,
-        ) -> abc.DisposableBase:
-            inner_subscription = SerialDisposable()
-            has_latest = [False]
-            is_stopped = [False]
-            latest = [0]
-
-            def on_next(inner_source: Union[Observable[_T], "Future[_T]"]) -> None:
-                nonlocal source
-
-                d = SingleAssignmentDisposable()
-                with source.lock:
-                    latest[0] += 1
-                    _id = latest[0]
-                has_latest[0] = True
-                inner_subscription.disposable = d
-
-                # Check if Future or Observable
-                if isinstance(inner_source, Future):
-                    obs = from_future(inner_source)
-                else:
-                    obs = inner_source
-
-                def on_next(x: Any) -> None:
-                    if latest[0] == _id:
-                        observer.on_next(x)
-
-                def on_error(e: Exception) -> None:
-                    if latest[0] == _id:
-                        observer.on_error(e)
-
-                def on_completed() -> None:
-                    if latest[0] == _id:
-                        has_latest[0] = False
-                        if is_stopped[0]:
-                            observer.on_completed()
-
-                d.disposable = obs.subscribe(
-                    on_next, on_error, on_completed, scheduler=scheduler
-                )
-
-            def on_completed() -> None:
-                is_stopped[0] = True
-                if not has_latest[0]:
-                    observer.on_completed()
-
-            subscription = source.subscribe(
-                on_next, observer.on_error, on_completed, scheduler=scheduler
-            )
-            return CompositeDisposable(subscription, inner_subscription)
-
-        return Observable(subscribe)
+        return _switch(source, None, False)
 
     return switch_latest
 
 
-__all__ = ["switch_latest_"]
+def switch_map_(
+    project: Optional[Mapper[_T1, Observable[_T2]]] = None,
+) -> Callable[[Observable[_T1]], Observable[_T2]]:
+    def switch_map(source: Observable[_T1]) -> Observable[_T2]:
+        """Projects each element to an inner sequence and produces the
+        values of the most recent inner sequence only.
+
+        Returns:
+            An observable sequence that at any point in time produces
+            the elements of the most recently projected inner sequence.
+        """
+
+        return _switch(source, project, False)
+
+    return switch_map
+
+
+def exhaust_map_(
+    project: Optional[Mapper[_T1, Observable[_T2]]] = None,
+) -> Callable[[Observable[_T1]], Observable[_T2]]:
+    def exhaust_map(source: Observable[_T1]) -> Observable[_T2]:
+        """Projects each element to an inner sequence, ignoring the
+        elements that arrive while the previous inner sequence is
+        active.
+
+        Returns:
+            An observable sequence producing the elements of the inner
+            sequences that were subscribed to.
+        """
+
+        return _switch(source, project, True)
+
+    return exhaust_map
+
+
+__all__ = ["exhaust_map_", "switch_latest_", "switch_map_"]
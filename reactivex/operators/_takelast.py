@@ -1,11 +1,15 @@
-from typing import Callable, List, Optional, TypeVar
+from typing import Callable, Optional, TypeVar
 
 from reactivex import Observable, abc
+from reactivex.internal import ArgumentOutOfRangeException, RingBuffer
 
 _T = TypeVar("_T")
 
 
 def take_last_(count: int) -> Callable[[Observable[_T]], Observable[_T]]:
+    if count < 0:
+        raise ArgumentOutOfRangeException()
+
     def take_last(source: Observable[_T]) -> Observable[_T]:
         """Returns a specified number of contiguous elements from the end of an
         observable sequence.
@@ -31,16 +35,14 @@ def take_last_(count: int) -> Callable[[Observable[_T]], Observable[_T]]:
             observer: abc.ObserverBase[_T],
             scheduler: Optional[abc.SchedulerBase] = None,
         ) -> abc.DisposableBase:
-            q: List[_T] = []
+            q: RingBuffer[_T] = RingBuffer(count)
 
             def on_next(x: _T) -> None:
                 q.append(x)
-                if len(q) > count:
-                    q.pop(0)
 
             def on_completed():
                 while q:
-                    observer.on_next(q.pop(0))
+                    observer.on_next(q.popleft())
                 observer.on_completed()
 
             return source.subscribe(
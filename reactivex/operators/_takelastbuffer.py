@@ -1,11 +1,15 @@
 from typing import Callable, List, Optional, TypeVar
 
 from reactivex import Observable, abc
+from reactivex.internal import ArgumentOutOfRangeException, RingBuffer
 
 _T = TypeVar("_T")
 
 
 def take_last_buffer_(count: int) -> Callable[[Observable[_T]], Observable[List[_T]]]:
+    if count < 0:
+        raise ArgumentOutOfRangeException()
+
     def take_last_buffer(source: Observable[_T]) -> Observable[List[_T]]:
         """Returns an array with the specified number of contiguous
         elements from the end of an observable sequence.
@@ -31,16 +35,14 @@ def take_last_buffer_(count: int) -> Callable[[Observable[_T]], Observable[List[
             observer: abc.ObserverBase[List[_T]],
             scheduler: Optional[abc.SchedulerBase] = None,
         ) -> abc.DisposableBase:
-            q: List[_T] = []
+            q: RingBuffer[_T] = RingBuffer(count)
 
             def on_next(x: _T) -> None:
                 with source.lock:
                     q.append(x)
-                    if len(q) > count:
-                        q.pop(0)
 
             def on_completed() -> None:
-                observer.on_next(q)
+                observer.on_next(list(q))
                 observer.on_completed()
 
             return source.subscribe(
@@ -1,6 +1,8 @@
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from datetime import datetime
+from typing import Callable, Optional, Tuple, TypeVar
 
 from reactivex import Observable, abc, typing
+from reactivex.internal import RingBuffer
 from reactivex.scheduler import TimeoutScheduler
 
 _T = TypeVar("_T")
@@ -39,20 +41,20 @@ def take_last_with_time_(
 
             _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
             duration = _scheduler.to_timedelta(duration)
-            q: List[Dict[str, Any]] = []
+            q: RingBuffer[Tuple[datetime, _T]] = RingBuffer()
 
             def on_next(x: _T) -> None:
                 now = _scheduler.now
-                q.append({"interval": now, "value": x})
-                while q and now - q[0]["interval"] >= duration:
-                    q.pop(0)
+                q.append((now, x))
+                while q and now - q.peek()[0] >= duration:
+                    q.popleft()
 
             def on_completed():
                 now = _scheduler.now
                 while q:
-                    _next = q.pop(0)
-                    if now - _next["interval"] <= duration:
-                        observer.on_next(_next["value"])
+                    interval, value = q.popleft()
+                    if now - interval <= duration:
+                        observer.on_next(value)
 
                 observer.on_completed()
 
@@ -0,0 +1,45 @@
+import sys
+from typing import Any, List, Sequence
+
+# Reductions over batches of values are vectorized with NumPy when the
+# batches are NumPy arrays. NumPy is optional, and is only imported when
+# array buffers are asked for; without it batches are reduced with the
+# builtins.
+
+
+def to_array(items: List[Any]) -> Any:
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        raise ImportError("NumPy is required for array buffers") from None
+
+    return numpy.asarray(items)
+
+
+def is_array(batch: Any) -> bool:
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(batch, numpy.ndarray)
+
+
+def batch_sum(batch: Sequence[Any]) -> Any:
+    if is_array(batch):
+        return batch.sum().item()  # type: ignore
+
+    return sum(batch)
+
+
+def batch_min(batch: Sequence[Any]) -> Any:
+    if is_array(batch):
+        return batch.min().item()  # type: ignore
+
+    return min(batch)
+
+
+def batch_max(batch: Sequence[Any]) -> Any:
+    if is_array(batch):
+        return batch.max().item()  # type: ignore
+
+    return max(batch)
+
+
+__all__ = ["batch_max", "batch_min", "batch_sum", "to_array"]
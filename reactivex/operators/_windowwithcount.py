@@ -1,5 +1,6 @@
 import logging
-from typing import Callable, List, Optional, TypeVar
+from collections import deque
+from typing import Callable, Deque, Optional, TypeVar
 
 from reactivex import Observable, abc
 from reactivex.disposable import RefCountDisposable, SingleAssignmentDisposable
@@ -47,7 +48,7 @@ def window_with_count_(
             m = SingleAssignmentDisposable()
             refCountDisposable = RefCountDisposable(m)
             n = [0]
-            q: List[Subject[_T]] = []
+            q: Deque[Subject[_T]] = deque()
 
             def create_window():
                 s: Subject[_T] = Subject()
@@ -62,7 +63,7 @@ def window_with_count_(
 
                 c = n[0] - count + 1
                 if c >= 0 and c % skip_ == 0:
-                    s = q.pop(0)
+                    s = q.popleft()
                     s.on_completed()
 
                 n[0] += 1
@@ -71,12 +72,12 @@ def window_with_count_(
 
             def on_error(exception: Exception) -> None:
                 while q:
-                    q.pop(0).on_error(exception)
+                    q.popleft().on_error(exception)
                 observer.on_error(exception)
 
             def on_completed() -> None:
                 while q:
-                    q.pop(0).on_completed()
+                    q.popleft().on_completed()
                 observer.on_completed()
 
             m.disposable = source.subscribe(
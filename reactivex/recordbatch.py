@@ -0,0 +1,160 @@
+import sys
+from array import array
+from itertools import compress
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+
+# NumPy is optional and is never imported here: a column can only be a
+# NumPy array if NumPy was already imported by the caller.
+def _is_ndarray(column: Any) -> bool:
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(column, numpy.ndarray)
+
+
+def _take(column: Sequence[Any], indices: List[int]) -> Sequence[Any]:
+    if _is_ndarray(column):
+        return column[indices]  # type: ignore
+
+    values = [column[i] for i in indices]
+    if isinstance(column, array):
+        return array(column.typecode, values)
+    return values
+
+
+def _compress(column: Sequence[Any], mask: Sequence[Any]) -> Sequence[Any]:
+    if _is_ndarray(column):
+        numpy = sys.modules["numpy"]
+        return column[numpy.asarray(mask, dtype=bool)]  # type: ignore
+
+    values = list(compress(column, mask))
+    if isinstance(column, array):
+        return array(column.typecode, values)
+    return values
+
+
+class RecordBatch:
+    """A batch of records stored column by column (struct of arrays).
+
+    Columns may be lists, ``array.array`` or NumPy arrays, and must all
+    have the same length. Operating on whole columns lets a pipeline
+    handle many records per Python call, see the batch aware operators
+    :func:`pluck_column <reactivex.operators.pluck_column>`,
+    :func:`filter_batch <reactivex.operators.filter_batch>`,
+    :func:`map_batch <reactivex.operators.map_batch>` and
+    :func:`group_by_column <reactivex.operators.group_by_column>`.
+
+    Examples:
+        >>> batch = RecordBatch({"sym": ["A", "B"], "px": array("d", [1, 2])})
+        >>> source.pipe(ops.buffer_with_count(10000), ops.map(RecordBatch.from_rows))
+    """
+
+    __slots__ = ("columns", "length")
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        self.columns: Dict[str, Sequence[Any]] = dict(columns)
+
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+
+        self.length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Mapping[str, Any]], names: Optional[Sequence[str]] = None
+    ) -> "RecordBatch":
+        """Creates a batch from row mappings such as dicts.
+
+        Args:
+            rows: The records to store.
+            names: [Optional] The columns to keep. If not specified,
+                the keys of the first row are used.
+
+        Returns:
+            A batch with one list column per name.
+        """
+
+        rows = list(rows)
+        if names is None:
+            names = list(rows[0]) if rows else []
+
+        return cls({name: [row[name] for row in rows] for name in names})
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, name: str) -> Sequence[Any]:
+        return self.columns[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.columns
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, RecordBatch):
+            return NotImplemented
+
+        return self.columns.keys() == other.columns.keys() and all(
+            list(column) == list(other.columns[name])
+            for name, column in self.columns.items()
+        )
+
+    def __repr__(self) -> str:
+        return "RecordBatch(%d rows, columns=%s)" % (self.length, list(self.columns))
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Returns an iterator of the records as dicts."""
+
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(names, values))
+
+    def filter(self, mask: Sequence[Any]) -> "RecordBatch":
+        """Returns a batch with the records where mask is true."""
+
+        return RecordBatch(
+            {name: _compress(column, mask) for name, column in self.columns.items()}
+        )
+
+    def take(self, indices: List[int]) -> "RecordBatch":
+        """Returns a batch with the records at the given indices."""
+
+        return RecordBatch(
+            {name: _take(column, indices) for name, column in self.columns.items()}
+        )
+
+    def with_columns(self, columns: Mapping[str, Sequence[Any]]) -> "RecordBatch":
+        """Returns a batch with the given columns added or replaced."""
+
+        return RecordBatch({**self.columns, **columns})
+
+    def partition(self, name: str) -> Dict[Hashable, "RecordBatch"]:
+        """Splits the batch into one batch per distinct value of a
+        column, keeping the record order within each batch."""
+
+        column = self.columns[name]
+        keys = column.tolist() if _is_ndarray(column) else column  # type: ignore
+
+        indices: Dict[Hashable, List[int]] = {}
+        for index, key in enumerate(keys):
+            try:
+                indices[key].append(index)
+            except KeyError:
+                indices[key] = [index]
+
+        if len(indices) == 1:
+            return {key: self for key in indices}
+
+        return {key: self.take(value) for key, value in indices.items()}
+
+
+__all__ = ["RecordBatch"]
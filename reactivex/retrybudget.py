@@ -0,0 +1,70 @@
+from threading import Lock
+from typing import Optional
+
+from reactivex.internal import ArgumentOutOfRangeException
+
+
+class RetryBudget:
+    """Token bucket limiting the rate of retries across every
+    subscription it is shared with.
+
+    Each retry takes a token and the bucket is refilled at refill_rate
+    tokens per second up to capacity. When the bucket is empty, retries
+    fail immediately with the original error, so a fleet of failing
+    subscriptions cannot retry faster than the budget allows and does
+    not stampede a recovering service.
+
+    Examples:
+        >>> budget = RetryBudget(10, 1.0)
+        >>> res = source.pipe(ops.retry_with_backoff(5, budget=budget))
+
+    Args:
+        capacity: Maximum number of tokens, and the number of tokens
+            the bucket starts with.
+        refill_rate: Number of tokens added per second.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float) -> None:
+        if capacity <= 0 or refill_rate < 0:
+            raise ArgumentOutOfRangeException()
+
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._last: Optional[float] = None
+        self.lock = Lock()
+
+    def _refill(self, now: float) -> None:
+        if self._last is not None and now > self._last:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.refill_rate
+            )
+        if self._last is None or now > self._last:
+            self._last = now
+
+    def tokens(self, now: float) -> float:
+        """Returns the number of tokens available at time now, given in
+        seconds."""
+
+        with self.lock:
+            self._refill(now)
+            return self._tokens
+
+    def try_acquire(self, now: float) -> bool:
+        """Takes a token if one is available at time now, given in
+        seconds.
+
+        Returns:
+            True if a token was taken; otherwise, False.
+        """
+
+        with self.lock:
+            self._refill(now)
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            return True
+
+
+__all__ = ["RetryBudget"]
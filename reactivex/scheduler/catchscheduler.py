@@ -5,7 +5,7 @@ from reactivex import abc, typing
 from reactivex.abc.scheduler import SchedulerBase
 from reactivex.disposable import Disposable, SingleAssignmentDisposable
 
-from .periodicscheduler import PeriodicScheduler
+from .periodicscheduler import COALESCE, PeriodicScheduler
 
 _TState = TypeVar("_TState")
 
@@ -107,6 +107,7 @@ class CatchScheduler(PeriodicScheduler):
         period: typing.RelativeTime,
         action: typing.ScheduledPeriodicAction[_TState],
         state: Optional[_TState] = None,
+        missed: str = COALESCE,
     ) -> abc.DisposableBase:
         """Schedules a periodic piece of work.
 
@@ -116,6 +117,9 @@ class CatchScheduler(PeriodicScheduler):
             action: Action to be executed.
             state: [Optional] Initial state passed to the action upon
                 the first iteration.
+            missed: [Optional] What to do with ticks that were missed
+                because the wrapped scheduler fell behind: ``"skip"``,
+                ``"catch_up"`` or ``"coalesce"`` (default).
 
         Returns:
             The disposable object used to cancel the scheduled
@@ -143,7 +147,9 @@ class CatchScheduler(PeriodicScheduler):
                 return None
 
         scheduler = cast(PeriodicScheduler, self._scheduler)
-        disp.disposable = scheduler.schedule_periodic(period, periodic, state=state)
+        disp.disposable = scheduler.schedule_periodic(
+            period, periodic, state=state, missed=missed
+        )
         return disp
 
     def _clone(self, scheduler: abc.SchedulerBase) -> "CatchScheduler":
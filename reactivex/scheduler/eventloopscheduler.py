@@ -10,7 +10,7 @@ from reactivex.internal.constants import DELTA_ZERO
 from reactivex.internal.exceptions import DisposedException
 from reactivex.internal.priorityqueue import PriorityQueue
 
-from .periodicscheduler import PeriodicScheduler
+from .periodicscheduler import COALESCE, PeriodicScheduler
 from .scheduleditem import ScheduledItem
 
 log = logging.getLogger("Rx")
@@ -115,6 +115,7 @@ class EventLoopScheduler(PeriodicScheduler, abc.DisposableBase):
         period: typing.RelativeTime,
         action: typing.ScheduledPeriodicAction[_TState],
         state: Optional[_TState] = None,
+        missed: str = COALESCE,
     ) -> abc.DisposableBase:
         """Schedules a periodic piece of work.
 
@@ -124,6 +125,9 @@ class EventLoopScheduler(PeriodicScheduler, abc.DisposableBase):
             action: Action to be executed.
             state: [Optional] Initial state passed to the action upon
                 the first iteration.
+            missed: [Optional] What to do with ticks that were missed
+                because the scheduler fell behind: ``"skip"``,
+                ``"catch_up"`` or ``"coalesce"`` (default).
 
         Returns:
             The disposable object used to cancel the scheduled
@@ -133,7 +137,7 @@ class EventLoopScheduler(PeriodicScheduler, abc.DisposableBase):
         if self._is_disposed:
             raise DisposedException()
 
-        return super().schedule_periodic(period, action, state=state)
+        return super().schedule_periodic(period, action, state=state, missed=missed)
 
     def _has_thread(self) -> bool:
         """Checks if there is an event loop thread running."""
@@ -8,7 +8,7 @@ from reactivex.disposable import (
     SingleAssignmentDisposable,
 )
 
-from ..periodicscheduler import PeriodicScheduler
+from ..periodicscheduler import COALESCE, PeriodicScheduler
 
 _TState = TypeVar("_TState")
 
@@ -161,17 +161,28 @@ class WxScheduler(PeriodicScheduler):
         period: typing.RelativeTime,
         action: typing.ScheduledPeriodicAction[_TState],
         state: Optional[_TState] = None,
+        missed: str = COALESCE,
     ) -> abc.DisposableBase:
         """Schedules a periodic piece of work to be executed in the loop.
 
+        A native timer is used, which folds the ticks missed while the
+        loop was busy into a single late one. Other ``missed`` policies
+        are driven by relative timeouts instead.
+
         Args:
              period: Period in seconds for running the work repeatedly.
              action: Action to be executed.
              state: [Optional] state to be given to the action function.
+             missed: [Optional] What to do with ticks that were missed
+                 because the loop was busy: ``"skip"``, ``"catch_up"``
+                 or ``"coalesce"`` (default).
 
          Returns:
              The disposable object used to cancel the scheduled action
              (best effort).
         """
 
+        if missed != COALESCE:
+            return super().schedule_periodic(period, action, state, missed=missed)
+
         return self._wxtimer_schedule(period, action, state=state, periodic=True)
@@ -1,6 +1,6 @@
 import logging
 import threading
-from datetime import datetime
+from time import monotonic
 from typing import Optional, TypeVar
 
 from reactivex import abc, typing
@@ -8,7 +8,7 @@ from reactivex.disposable import Disposable
 from reactivex.internal.concurrency import default_thread_factory
 
 from .eventloopscheduler import EventLoopScheduler
-from .periodicscheduler import PeriodicScheduler
+from .periodicscheduler import COALESCE, PeriodicScheduler, PeriodicTask
 
 _TState = TypeVar("_TState")
 
@@ -94,6 +94,7 @@ class NewThreadScheduler(PeriodicScheduler):
         period: typing.RelativeTime,
         action: typing.ScheduledPeriodicAction[_TState],
         state: Optional[_TState] = None,
+        missed: str = COALESCE,
     ) -> abc.DisposableBase:
         """Schedules a periodic piece of work.
 
@@ -103,34 +104,33 @@ class NewThreadScheduler(PeriodicScheduler):
             action: Action to be executed.
             state: [Optional] Initial state passed to the action upon
                 the first iteration.
+            missed: [Optional] What to do with ticks that were missed
+                because the action ran late: ``"skip"``, ``"catch_up"``
+                or ``"coalesce"`` (default).
 
         Returns:
             The disposable object used to cancel the scheduled
-            recurring action (best effort).
+            recurring action (best effort). It is a
+            :class:`PeriodicTask` exposing the measured jitter.
         """
 
         seconds: float = self.to_seconds(period)
-        timeout: float = seconds
+        task = PeriodicTask(seconds, action, state, start=monotonic(), missed=missed)
         disposed: threading.Event = threading.Event()
 
         def run() -> None:
-            nonlocal state, timeout
+            timeout = seconds
             while True:
                 if timeout > 0.0:
                     disposed.wait(timeout)
                 if disposed.is_set():
                     return
 
-                time: datetime = self.now
-
-                state = action(state)
-
-                timeout = seconds - (self.now - time).total_seconds()
+                due = task.run(monotonic)
+                timeout = due - monotonic()
 
         thread = self.thread_factory(run)
         thread.start()
 
-        def dispose() -> None:
-            disposed.set()
-
-        return Disposable(dispose)
+        task.disposable = Disposable(disposed.set)
+        return task
@@ -1,5 +1,4 @@
-from datetime import datetime
-from typing import Optional, TypeVar
+from typing import Callable, Generic, Optional, TypeVar
 
 from reactivex import abc, typing
 from reactivex.disposable import Disposable, MultipleAssignmentDisposable
@@ -8,6 +7,111 @@ from .scheduler import Scheduler
 
 _TState = TypeVar("_TState")
 
+SKIP = "skip"
+"""Missed ticks are dropped and the task resumes on the next tick."""
+
+CATCH_UP = "catch_up"
+"""Missed ticks are all run, back to back, until the task is on time."""
+
+COALESCE = "coalesce"
+"""Missed ticks are folded into a single late run of the latest one."""
+
+_MISSED_TICK_POLICIES = (SKIP, CATCH_UP, COALESCE)
+
+
+class PeriodicTask(MultipleAssignmentDisposable, Generic[_TState]):
+    """A periodic piece of work whose ticks are computed from an
+    absolute start time, so that the time spent running the action
+    does not accumulate as drift.
+
+    Tick ``n`` is due at ``start + n * period``. When the task falls
+    behind by one or more ticks, the ``missed`` policy decides what
+    happens: ``"skip"`` resumes at the next future tick,
+    ``"catch_up"`` runs every missed tick and ``"coalesce"`` runs the
+    latest missed tick once.
+
+    The lateness of every tick is recorded and exposed through
+    ``last_jitter``, ``max_jitter`` and ``mean_jitter`` (in seconds).
+    """
+
+    def __init__(
+        self,
+        period: float,
+        action: typing.ScheduledPeriodicAction[_TState],
+        state: Optional[_TState] = None,
+        start: float = 0.0,
+        missed: str = COALESCE,
+    ) -> None:
+        if missed not in _MISSED_TICK_POLICIES:
+            raise ValueError("Unknown missed tick policy: %r" % missed)
+
+        super().__init__()
+
+        self.period = max(0.0, period)
+        self.action = action
+        self.state = state
+        self.start = start
+        self.missed = missed
+
+        self.tick = 1
+        self.ticks = 0
+        self.skipped = 0
+        self.last_jitter = 0.0
+        self.max_jitter = 0.0
+        self._total_jitter = 0.0
+
+    @property
+    def due(self) -> float:
+        """The time at which the next tick is due."""
+
+        return self.start + self.tick * self.period
+
+    @property
+    def mean_jitter(self) -> float:
+        """The mean lateness of the ticks run so far, in seconds."""
+
+        return self._total_jitter / self.ticks if self.ticks else 0.0
+
+    def run(self, clock: Callable[[], float]) -> float:
+        """Runs the action for the current tick.
+
+        Args:
+            clock: Function returning the current time in seconds, on
+                the same time base as ``start``.
+
+        Returns:
+            The time at which the following tick is due.
+        """
+
+        now = clock()
+        jitter = max(0.0, now - self.due)
+        self.last_jitter = jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+        self._total_jitter += jitter
+        self.ticks += 1
+
+        try:
+            self.state = self.action(self.state)
+        except Exception:
+            self.dispose()
+            raise
+
+        return self._advance(clock())
+
+    def _advance(self, now: float) -> float:
+        self.tick += 1
+        due = self.due
+        if due >= now or self.missed == CATCH_UP or not self.period:
+            return due
+
+        behind = int((now - self.start) // self.period)
+        tick = behind + 1 if self.missed == SKIP else behind
+        if tick > self.tick:
+            self.skipped += tick - self.tick
+            self.tick = tick
+
+        return self.due
+
 
 class PeriodicScheduler(Scheduler, abc.PeriodicSchedulerBase):
     """Base class for the various periodic scheduler implementations in this
@@ -19,42 +123,52 @@ class PeriodicScheduler(Scheduler, abc.PeriodicSchedulerBase):
         period: typing.RelativeTime,
         action: typing.ScheduledPeriodicAction[_TState],
         state: Optional[_TState] = None,
+        missed: str = COALESCE,
     ) -> abc.DisposableBase:
         """Schedules a periodic piece of work.
 
+        Ticks are computed from the time of this call rather than from
+        the end of the previous tick, so they do not drift.
+
         Args:
             period: Period in seconds or timedelta for running the
                 work periodically.
             action: Action to be executed.
             state: [Optional] Initial state passed to the action upon
                 the first iteration.
+            missed: [Optional] What to do with ticks that were missed
+                because the scheduler fell behind: ``"skip"``,
+                ``"catch_up"`` or ``"coalesce"`` (default).
 
         Returns:
             The disposable object used to cancel the scheduled
-            recurring action (best effort).
+            recurring action (best effort). It is a
+            :class:`PeriodicTask` exposing the measured jitter.
         """
 
-        disp: MultipleAssignmentDisposable = MultipleAssignmentDisposable()
         seconds: float = self.to_seconds(period)
+        task = PeriodicTask(
+            seconds, action, state, start=self.to_seconds(self.now), missed=missed
+        )
 
         def periodic(
             scheduler: abc.SchedulerBase, state: Optional[_TState] = None
         ) -> Optional[Disposable]:
-            if disp.is_disposed:
+            if task.is_disposed:
                 return None
 
-            now: datetime = scheduler.now
-
-            try:
-                state = action(state)
-            except Exception:
-                disp.dispose()
-                raise
+            def clock() -> float:
+                return scheduler.to_seconds(scheduler.now)
 
-            time = seconds - (scheduler.now - now).total_seconds()
-            disp.disposable = scheduler.schedule_relative(time, periodic, state=state)
+            due = task.run(clock)
+            task.disposable = scheduler.schedule_relative(
+                max(0.0, due - clock()), periodic
+            )
 
             return None
 
-        disp.disposable = self.schedule_relative(period, periodic, state=state)
-        return disp
+        task.disposable = self.schedule_relative(period, periodic)
+        return task
+
+
+__all__ = ["CATCH_UP", "COALESCE", "PeriodicScheduler", "PeriodicTask", "SKIP"]
@@ -1,5 +1,10 @@
-from threading import Lock, Timer
-from typing import MutableMapping, Optional, TypeVar
+import heapq
+import itertools
+import logging
+from functools import partial
+from threading import Condition, Lock, Timer
+from time import monotonic
+from typing import Any, List, MutableMapping, Optional, Tuple, TypeVar
 from weakref import WeakKeyDictionary
 
 from reactivex import abc, typing
@@ -8,17 +13,92 @@ from reactivex.disposable import (
     Disposable,
     SingleAssignmentDisposable,
 )
+from reactivex.internal.concurrency import default_thread_factory
 
-from .periodicscheduler import PeriodicScheduler
+from .periodicscheduler import COALESCE, PeriodicScheduler, PeriodicTask
 
 _TState = TypeVar("_TState")
 
+log = logging.getLogger("Rx")
+
+
+class _PeriodicDriver:
+    """Times all periodic tasks of a scheduler from one daemon thread,
+    which is started on demand and exits when no tasks are left. Each
+    due tick is run on a thread of its own, so that a slow action does
+    not hold up the other tasks, and the task is queued again when the
+    tick is done.
+
+    Disposed tasks are counted as they are disposed, and the queue is
+    rebuilt without them once they make up more than half of it."""
+
+    def __init__(self) -> None:
+        self._condition = Condition(Lock())
+        self._queue: List[Tuple[float, int, PeriodicTask[Any]]] = []
+        self._counter = itertools.count()
+        self._disposed = 0
+        self._running = False
+
+    def add(self, task: PeriodicTask[Any], due: Optional[float] = None) -> None:
+        due = task.due if due is None else due
+        with self._condition:
+            heapq.heappush(self._queue, (due, next(self._counter), task))
+            if not self._running:
+                self._running = True
+                default_thread_factory(self._run).start()
+            self._condition.notify()
+
+    def remove(self, task: PeriodicTask[Any]) -> None:
+        with self._condition:
+            self._disposed += 1
+            if 2 * self._disposed <= len(self._queue):
+                return
+
+            self._queue = [item for item in self._queue if not item[2].is_disposed]
+            heapq.heapify(self._queue)
+            self._disposed = 0
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if not self._queue:
+                        self._running = False
+                        return
+
+                    due, _, task = self._queue[0]
+                    if task.is_disposed:
+                        heapq.heappop(self._queue)
+                        self._disposed = max(0, self._disposed - 1)
+                        continue
+
+                    timeout = due - monotonic()
+                    if timeout <= 0.0:
+                        heapq.heappop(self._queue)
+                        break
+
+                    self._condition.wait(timeout)
+
+            default_thread_factory(partial(self._tick, task)).start()
+
+    def _tick(self, task: PeriodicTask[Any]) -> None:
+        try:
+            due = task.run(monotonic)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Periodic action failed")
+            return
+
+        if not task.is_disposed:
+            self.add(task, due)
+
 
 class TimeoutScheduler(PeriodicScheduler):
     """A scheduler that schedules work via a timed callback."""
 
     _lock = Lock()
     _global: MutableMapping[type, "TimeoutScheduler"] = WeakKeyDictionary()
+    _driver: Optional[_PeriodicDriver] = None
 
     @classmethod
     def singleton(cls) -> "TimeoutScheduler":
@@ -118,5 +198,47 @@ class TimeoutScheduler(PeriodicScheduler):
         duetime = self.to_datetime(duetime)
         return self.schedule_relative(duetime - self.now, action, state)
 
+    def schedule_periodic(
+        self,
+        period: typing.RelativeTime,
+        action: typing.ScheduledPeriodicAction[_TState],
+        state: Optional[_TState] = None,
+        missed: str = COALESCE,
+    ) -> abc.DisposableBase:
+        """Schedules a periodic piece of work.
+
+        All periodic work of the scheduler shares a single driver
+        thread, and ticks are computed from a monotonic start time so
+        they do not drift.
+
+        Args:
+            period: Period in seconds or timedelta for running the
+                work periodically.
+            action: Action to be executed.
+            state: [Optional] Initial state passed to the action upon
+                the first iteration.
+            missed: [Optional] What to do with ticks that were missed
+                because the driver fell behind: ``"skip"``,
+                ``"catch_up"`` or ``"coalesce"`` (default).
+
+        Returns:
+            The disposable object used to cancel the scheduled
+            recurring action (best effort). It is a
+            :class:`PeriodicTask` exposing the measured jitter.
+        """
+
+        task = PeriodicTask(
+            self.to_seconds(period), action, state, start=monotonic(), missed=missed
+        )
+
+        with TimeoutScheduler._lock:
+            driver = TimeoutScheduler._driver
+            if driver is None:
+                driver = TimeoutScheduler._driver = _PeriodicDriver()
+
+        task.disposable = Disposable(lambda: driver.remove(task))
+        driver.add(task)
+        return task
+
 
 __all__ = ["TimeoutScheduler"]
@@ -11,6 +11,7 @@ class Trampoline:
     def __init__(self) -> None:
         self._idle: bool = True
         self._queue: PriorityQueue[ScheduledItem] = PriorityQueue()
+        self._ready: Deque[ScheduledItem] = deque()
         self._lock: Lock = Lock()
         self._condition: Condition = Condition(self._lock)
 
@@ -18,6 +19,13 @@ class Trampoline:
         with self._lock:
             return self._idle
 
+    def has_pending(self) -> bool:
+        """Returns True if work is waiting to run on the trampoline,
+        not counting the item being invoked."""
+
+        with self._lock:
+            return len(self._queue) > 0 or len(self._ready) > 0
+
     def run(self, item: ScheduledItem) -> None:
         with self._lock:
             self._queue.enqueue(item)
@@ -32,9 +40,10 @@ class Trampoline:
             with self._lock:
                 self._idle = True
                 self._queue.clear()
+                self._ready.clear()
 
     def _run(self) -> None:
-        ready: Deque[ScheduledItem] = deque()
+        ready = self._ready
         while True:
             with self._lock:
                 while len(self._queue) > 0:
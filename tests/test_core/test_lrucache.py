@@ -0,0 +1,32 @@
+import unittest
+
+from reactivex.internal import LRUCache, NotSet
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_lrucache_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is NotSet
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_lrucache_ttl(self):
+        cache = LRUCache(10, ttl=5.0)
+
+        cache.set("a", 1, now=100.0)
+        assert cache.get("a", now=104.0) == 1
+        assert cache.get("a", now=105.0) is NotSet
+        assert len(cache) == 0
+
+    def test_lrucache_zero_size(self):
+        cache = LRUCache(0)
+
+        cache.set("a", 1)
+        assert cache.get("a") is NotSet
@@ -0,0 +1,36 @@
+import unittest
+
+from reactivex.internal import NotSet, RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_ringbuffer_evicts_oldest(self):
+        q = RingBuffer(2)
+
+        assert q.append(1) is NotSet
+        assert q.append(2) is NotSet
+        assert q.is_full
+        assert q.append(3) == 1
+        assert q.snapshot() == (2, 3)
+        assert len(q) == 2
+
+    def test_ringbuffer_zero_capacity(self):
+        q = RingBuffer(0)
+
+        assert q.append(1) == 1
+        assert len(q) == 0
+
+    def test_ringbuffer_unbounded(self):
+        q = RingBuffer()
+
+        for i in range(100):
+            assert q.append(i) is NotSet
+
+        assert not q.is_full
+        assert q.peek() == 0
+        assert q.popleft() == 0
+        assert q[0] == 1
+        assert list(q) == list(range(1, 100))
+
+        q.clear()
+        assert not q
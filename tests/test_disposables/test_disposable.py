@@ -206,6 +206,31 @@ def test_groupdisposable_clear():
     assert g.length == 1
 
 
+def test_groupdisposable_dispose_order():
+    disposed = []
+    items = [Disposable(lambda i=i: disposed.append(i)) for i in range(5)]
+
+    g = CompositeDisposable(items[:3])
+    g.add(items[3])
+    g.add(items[4])
+    assert g.remove(items[1])
+    assert g.to_list() == [items[0], items[2], items[3], items[4]]
+
+    g.dispose()
+    assert disposed == [1, 0, 2, 3, 4]
+
+
+def test_groupdisposable_add_twice():
+    d1 = Disposable()
+
+    g = CompositeDisposable(d1)
+    g.add(d1)
+    assert g.length == 2
+    assert g.remove(d1)
+    assert g.length == 1
+    assert g.contains(d1)
+
+
 def test_mutabledisposable_ctor_prop():
     m = SerialDisposable()
     assert not m.disposable
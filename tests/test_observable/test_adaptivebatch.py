@@ -0,0 +1,99 @@
+import unittest
+
+import pytest
+
+from reactivex import Observer
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestAdaptiveBatch(unittest.TestCase):
+    def test_adaptive_batch_follows_rate(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            *[on_next(210 + i, 210 + i) for i in range(60)], on_completed(300)
+        )
+        sizes = []
+
+        def create():
+            return xs.pipe(
+                ops.adaptive_batch(10.0, size_observer=Observer(sizes.append))
+            )
+
+        results = scheduler.start(create)
+        batches = results.messages[:-1]
+        assert [x for m in batches for x in m.value.value] == list(range(210, 270))
+        for m in batches:
+            assert m.time - m.value.value[0] <= 10
+        assert sizes[:4] == [1, 3, 5, 6]
+        assert 8 <= sizes[-2] <= 10
+        assert results.messages[-1] == on_completed(300)
+
+    def test_adaptive_batch_flushes_on_latency(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(212, 2), on_next(250, 3), on_completed(300)
+        )
+
+        results = scheduler.start(
+            lambda: xs.pipe(ops.adaptive_batch(10.0, min_size=5))
+        )
+        assert results.messages == [
+            on_next(220, [1, 2]),
+            on_next(260, [3]),
+            on_completed(300),
+        ]
+
+    def test_adaptive_batch_grows_on_burst(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            *[on_next(210, i) for i in range(10)], on_completed(220)
+        )
+        sizes = []
+
+        def create():
+            return xs.pipe(
+                ops.adaptive_batch(
+                    10.0, max_size=4, size_observer=Observer(sizes.append)
+                )
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, [0]),
+            on_next(210, [1]),
+            on_next(210, [2, 3]),
+            on_next(210, [4, 5, 6, 7]),
+            on_next(220, [8, 9]),
+            on_completed(220),
+        ]
+        assert sizes[:4] == [1, 2, 4, 4]
+
+    def test_adaptive_batch_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_error(215, ex))
+
+        results = scheduler.start(lambda: xs.pipe(ops.adaptive_batch(10.0, 5)))
+        assert results.messages == [on_error(215, ex)]
+
+    def test_adaptive_batch_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.adaptive_batch(0.0)
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.adaptive_batch(1.0, min_size=0)
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.adaptive_batch(1.0, min_size=10, max_size=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
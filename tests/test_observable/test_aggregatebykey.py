@@ -0,0 +1,94 @@
+import unittest
+
+import pytest
+
+from reactivex import operators as ops
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestAggregateByKey(unittest.TestCase):
+    def create_source(self, scheduler):
+        return scheduler.create_hot_observable(
+            on_next(210, ("a", 1)),
+            on_next(220, ("b", 2)),
+            on_next(230, ("a", 3)),
+            on_next(260, ("b", 4)),
+            on_next(270, ("b", 6)),
+            on_completed(320),
+        )
+
+    def test_aggregate_by_key_count(self):
+        scheduler = TestScheduler()
+        xs = self.create_source(scheduler)
+
+        def create():
+            return xs.pipe(ops.aggregate_by_key(lambda x: x[0], 50.0))
+
+        results = scheduler.start(create)
+        assert [(m.time, m.value.value) for m in results.messages[:-1]] == [
+            (250, ("a", scheduler.to_datetime(200), 2)),
+            (250, ("b", scheduler.to_datetime(200), 1)),
+            (300, ("b", scheduler.to_datetime(250), 2)),
+        ]
+        assert results.messages[-1] == on_completed(320)
+
+    def test_aggregate_by_key_mean(self):
+        scheduler = TestScheduler()
+        xs = self.create_source(scheduler)
+
+        def create():
+            return xs.pipe(
+                ops.aggregate_by_key(lambda x: x[0], 50.0, "mean", lambda x: x[1]),
+                ops.map(lambda r: (r[0], r[2])),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(250, ("a", 2.0)),
+            on_next(250, ("b", 2.0)),
+            on_next(300, ("b", 5.0)),
+            on_completed(320),
+        ]
+
+    def test_aggregate_by_key_flush_on_completed(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, ("a", 5)),
+            on_next(220, ("a", 3)),
+            on_completed(230),
+        )
+
+        def create():
+            return xs.pipe(
+                ops.aggregate_by_key(lambda x: x[0], 50.0, "min", lambda x: x[1]),
+                ops.map(lambda r: (r[0], r[2])),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(230, ("a", 3)), on_completed(230)]
+
+    def test_aggregate_by_key_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, ("a", 1)))
+
+        def key_mapper(x):
+            raise Exception(ex)
+
+        def create():
+            return xs.pipe(ops.aggregate_by_key(key_mapper, 50.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(210, ex)]
+
+    def test_aggregate_by_key_unknown(self):
+        with pytest.raises(ValueError):
+            ops.aggregate_by_key(lambda x: x, 50.0, "median")
@@ -1,5 +1,7 @@
 import unittest
 
+import pytest
+
 from reactivex import operators as _
 from reactivex.testing import ReactiveTest, TestScheduler
 
@@ -90,3 +92,25 @@ class TestAverage(unittest.TestCase):
 
         assert res.messages == [on_next(240, 2.0), on_completed(240)]
         assert xs.subscriptions == [subscribe(200, 240)]
+
+    def test_average_batched(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, [2, 3]),
+            on_next(220, []),
+            on_next(230, [4, 5, 6]),
+            on_completed(250),
+        )
+        res = scheduler.start(create=lambda: xs.pipe(_.average(batched=True)))
+        assert res.messages == [on_next(250, 4.0), on_completed(250)]
+
+    def test_average_batched_array(self):
+        numpy = pytest.importorskip("numpy")
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, numpy.array([2.0, 3.0])),
+            on_next(230, numpy.array([4.0, 5.0, 6.0])),
+            on_completed(250),
+        )
+        res = scheduler.start(create=lambda: xs.pipe(_.average(batched=True)))
+        assert res.messages == [on_next(250, 4.0), on_completed(250)]
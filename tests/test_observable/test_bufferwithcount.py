@@ -1,5 +1,7 @@
 import unittest
 
+import pytest
+
 from reactivex import operators as ops
 from reactivex.testing import ReactiveTest, TestScheduler
 
@@ -214,3 +216,23 @@ class TestBufferWithCount(unittest.TestCase):
         assert sequence_equal(results[0].value.value, [2, 3]) and results[0].time == 220
         assert sequence_equal(results[1].value.value, [5]) and results[1].time == 250
         assert results[2].value.kind == "C" and results[2].time == 250
+
+    def test_buffer_count_as_array(self):
+        numpy = pytest.importorskip("numpy")
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 2),
+            on_next(220, 3),
+            on_next(230, 4),
+            on_next(240, 5),
+            on_next(250, 6),
+            on_completed(260),
+        )
+
+        def create():
+            return xs.pipe(ops.buffer_with_count(2, as_array=True))
+
+        results = scheduler.start(create).messages
+        assert [m.time for m in results] == [220, 240, 260, 260]
+        assert all(isinstance(m.value.value, numpy.ndarray) for m in results[:3])
+        assert [m.value.value.tolist() for m in results[:3]] == [[2, 3], [4, 5], [6]]
@@ -110,3 +110,28 @@ class TestBufferWithCount(unittest.TestCase):
             on_next(370, "5,6,7"),
         ]
         assert xs.subscriptions == [subscribe(200, 370)]
+
+    def test_buffer_with_time_or_count_timer_only(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(205, 1),
+            on_next(210, 2),
+            on_next(280, 3),
+            on_next(420, 4),
+            on_completed(450),
+        )
+
+        def create():
+            return xs.pipe(
+                ops.buffer_with_time_or_count(100, 10),
+                ops.map(lambda x: ",".join([str(a) for a in x])),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(300, "1,2,3"),
+            on_next(400, ""),
+            on_next(450, "4"),
+            on_completed(450),
+        ]
+        assert xs.subscriptions == [subscribe(200, 450)]
@@ -1,7 +1,9 @@
+import threading
 import unittest
 
 import reactivex
 from reactivex import operators as ops
+from reactivex.scheduler import EventLoopScheduler, NewThreadScheduler
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -278,3 +280,27 @@ class TestCatch(unittest.TestCase):
         ]
         assert first_handler_called[0]
         assert second_handler_called[0]
+
+    def test_catch_async_error_uses_scheduler(self):
+        loop = EventLoopScheduler()
+        loop_threads = []
+        threads = []
+        done = threading.Event()
+
+        def fail(_):
+            raise Exception("ex")
+
+        def second(scheduler):
+            threads.append(threading.current_thread())
+            return reactivex.empty()
+
+        loop.schedule(lambda *_: loop_threads.append(threading.current_thread()))
+        first = reactivex.timer(0.01, scheduler=NewThreadScheduler()).pipe(
+            ops.map(fail)
+        )
+        reactivex.catch(first, reactivex.defer(second)).subscribe(
+            on_completed=done.set, scheduler=loop
+        )
+        done.wait(5)
+        loop.dispose()
+        assert threads == loop_threads
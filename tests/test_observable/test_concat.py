@@ -1,7 +1,9 @@
+import threading
 import unittest
 
 import reactivex
 from reactivex import operators as ops
+from reactivex.scheduler import EventLoopScheduler, NewThreadScheduler
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -262,3 +264,34 @@ class TestConcat(unittest.TestCase):
         stream.subscribe()
         assert subscribe_schedulers["e1"] is None
         assert subscribe_schedulers["e2"] is None
+
+    def test_concat_many_synchronous_sources(self):
+        sources = [reactivex.return_value(i) for i in range(5000)]
+        sources.append(reactivex.from_iterable(range(5000, 10000)))
+        results = []
+        completed = []
+
+        reactivex.concat(*sources).subscribe(
+            results.append, on_completed=lambda: completed.append(True)
+        )
+        assert results == list(range(10000))
+        assert completed == [True]
+
+    def test_concat_async_completion_uses_scheduler(self):
+        loop = EventLoopScheduler()
+        loop_threads = []
+        threads = []
+        done = threading.Event()
+
+        def second(scheduler):
+            threads.append(threading.current_thread())
+            return reactivex.empty()
+
+        loop.schedule(lambda *_: loop_threads.append(threading.current_thread()))
+        first = reactivex.timer(0.01, scheduler=NewThreadScheduler())
+        reactivex.concat(first, reactivex.defer(second)).subscribe(
+            on_completed=done.set, scheduler=loop
+        )
+        done.wait(5)
+        loop.dispose()
+        assert threads == loop_threads
@@ -1,6 +1,8 @@
 import unittest
 
+import reactivex
 from reactivex import Observable, operators
+from reactivex.subject import Subject
 from reactivex.testing import ReactiveTest
 from reactivex.testing.subscription import Subscription
 from reactivex.testing.testscheduler import TestScheduler
@@ -188,3 +190,19 @@ class TestConcatMap(unittest.TestCase):
         assert e2.subscriptions == [
             Subscription(210, 230)
         ]  # should not be any further sub and should unsub from e2 on outer error
+
+    def test_concat_map_scalar_inline(self):
+        results = []
+        subject = Subject()
+
+        def mapper(x):
+            return subject if x == 2 else reactivex.return_value(x)
+
+        reactivex.from_iterable([1, 2, 3]).pipe(operators.concat_map(mapper)).subscribe(
+            results.append, on_completed=lambda: results.append("done")
+        )
+        assert results == [1]
+
+        subject.on_next(2)
+        subject.on_completed()
+        assert results == [1, 2, 3, "done"]
@@ -1,5 +1,7 @@
 import unittest
 
+import pytest
+
 from reactivex import operators as _
 from reactivex.testing import ReactiveTest, TestScheduler
 
@@ -220,3 +222,18 @@ class TestCount(unittest.TestCase):
 
         assert res.messages == [on_error(230, ex)]
         assert xs.subscriptions == [subscribe(200, 230)]
+
+    def test_count_batched(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, [5, 3]),
+            on_next(220, []),
+            on_next(230, [4, 2, 6]),
+            on_completed(250),
+        )
+        res = scheduler.start(create=lambda: xs.pipe(_.count(batched=True)))
+        assert res.messages == [on_next(250, 5), on_completed(250)]
+
+    def test_count_batched_predicate(self):
+        with pytest.raises(ValueError):
+            _.count(lambda x: x > 3, batched=True)
@@ -149,6 +149,28 @@ class TestDebounce(unittest.TestCase):
             on_completed(600),
         ]
 
+    def test_debounce_timespan_rearm(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_next(250, 5),
+            on_next(330, 6),
+            on_completed(400),
+        )
+
+        def create():
+            return xs.pipe(_.debounce(25))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(275, 5),
+            on_next(355, 6),
+            on_completed(400),
+        ]
+
     def test_debounce_empty(self):
         scheduler = TestScheduler()
 
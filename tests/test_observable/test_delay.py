@@ -1,8 +1,11 @@
 import logging
+import threading
+import time
 import unittest
 from datetime import datetime, timezone
 
 from reactivex.operators import delay
+from reactivex.subject import Subject
 from reactivex.testing import ReactiveTest, TestScheduler
 
 FORMAT = "%(asctime)-15s %(threadName)s %(message)s"
@@ -287,3 +290,49 @@ class TestDelay(unittest.TestCase):
 
         assert results.messages == []
         assert xs.subscriptions == [subscribe(200, 1000)]
+
+    def test_delay_burst(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(250, 1),
+            on_next(250, 2),
+            on_next(250, 3),
+            on_next(260, 4),
+            on_completed(260),
+        )
+
+        def create():
+            return xs.pipe(delay(100))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [
+            on_next(350, 1),
+            on_next(350, 2),
+            on_next(350, 3),
+            on_next(360, 4),
+            on_completed(360),
+        ]
+        assert xs.subscriptions == [subscribe(200, 260)]
+
+    def test_delay_error_during_emission(self):
+        subject = Subject()
+        results = []
+        done = threading.Event()
+        ex = RxException("ex")
+
+        def on_next(x):
+            results.append(x)
+            time.sleep(0.2)
+
+        def on_error(error):
+            results.append(("err", error))
+            done.set()
+
+        subject.pipe(delay(0.05)).subscribe(on_next, on_error)
+        subject.on_next(1)
+        time.sleep(0.1)
+        subject.on_error(ex)
+
+        assert done.wait(5)
+        assert results == [1, ("err", ex)]
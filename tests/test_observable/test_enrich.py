@@ -0,0 +1,196 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.subject import Subject
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class StubService:
+    """Local stand-in for a remote lookup service."""
+
+    def __init__(self, delays=None, scheduler=None):
+        self.calls = []
+        self.delays = delays or {}
+        self.scheduler = scheduler
+
+    def fetch(self, keys):
+        self.calls.append(list(keys))
+        values = {key: key.upper() for key in keys if key != "missing"}
+        if self.scheduler is None:
+            return values
+
+        delay = max(self.delays.get(key, 0) for key in keys)
+        return reactivex.timer(delay, scheduler=self.scheduler).pipe(
+            ops.map(lambda _: values)
+        )
+
+
+class TestEnrich(unittest.TestCase):
+    def test_enrich_batches_on_count_and_timer(self):
+        scheduler = TestScheduler()
+        service = StubService()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"),
+            on_next(211, "b"),
+            on_next(212, "missing"),
+            on_completed(300),
+        )
+
+        def create():
+            return xs.pipe(ops.enrich(lambda x: x, service.fetch, 2, 10.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(211, ("a", "A")),
+            on_next(211, ("b", "B")),
+            on_next(222, ("missing", None)),
+            on_completed(300),
+        ]
+        assert service.calls == [["a", "b"], ["missing"]]
+
+    def test_enrich_coalesces_and_caches(self):
+        scheduler = TestScheduler()
+        service = StubService()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"),
+            on_next(215, "a"),
+            on_next(230, "a"),
+            on_next(300, "a"),
+            on_completed(400),
+        )
+
+        def create():
+            return xs.pipe(
+                ops.enrich(lambda x: x, service.fetch, 10, 10.0, 100, cache_ttl=50.0)
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(220, ("a", "A")),
+            on_next(220, ("a", "A")),
+            on_next(230, ("a", "A")),
+            on_next(310, ("a", "A")),
+            on_completed(400),
+        ]
+        assert service.calls == [["a"], ["a"]]
+
+    def test_enrich_ordered(self):
+        scheduler = TestScheduler()
+        service = StubService({"a": 50, "b": 10}, scheduler)
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"), on_next(220, "b"), on_completed(300)
+        )
+
+        def create():
+            return xs.pipe(ops.enrich(lambda x: x, service.fetch, 1, 10.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(260, ("a", "A")),
+            on_next(260, ("b", "B")),
+            on_completed(300),
+        ]
+
+    def test_enrich_unordered(self):
+        scheduler = TestScheduler()
+        service = StubService({"a": 50, "b": 10}, scheduler)
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"), on_next(220, "b"), on_completed(240)
+        )
+
+        def create():
+            return xs.pipe(
+                ops.enrich(lambda x: x, service.fetch, 1, 10.0, ordered=False)
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(230, ("b", "B")),
+            on_next(260, ("a", "A")),
+            on_completed(260),
+        ]
+
+    def test_enrich_thread_pool(self):
+        service = StubService()
+
+        with ThreadPoolExecutor(2) as executor:
+
+            def fetch(keys):
+                return executor.submit(service.fetch, keys)
+
+            results = (
+                reactivex.from_iterable("abcab")
+                .pipe(
+                    ops.enrich(lambda x: x, fetch, 2),
+                    ops.to_list(),
+                )
+                .run()
+            )
+
+        assert results == [(x, x.upper()) for x in "abcab"]
+
+    def test_enrich_emits_outside_lock(self):
+        service = StubService()
+        source = Subject()
+        acquired = []
+        done = threading.Event()
+
+        def try_lock():
+            if source.lock.acquire(timeout=1):
+                source.lock.release()
+                acquired.append(True)
+            else:
+                acquired.append(False)
+
+        def on_next(value):
+            # Another thread must be able to take the source lock while
+            # the observer runs.
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+
+        with ThreadPoolExecutor(1) as executor:
+
+            def fetch(keys):
+                return executor.submit(service.fetch, keys)
+
+            source.pipe(ops.enrich(lambda x: x, fetch, 1)).subscribe(
+                on_next, on_completed=done.set
+            )
+            source.on_next("a")
+            source.on_completed()
+            done.wait(5)
+
+        assert acquired == [True]
+
+    def test_enrich_fetch_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, "a"))
+
+        def fetch(keys):
+            raise Exception(ex)
+
+        def create():
+            return xs.pipe(ops.enrich(lambda x: x, fetch, 1))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(210, ex)]
+
+    def test_enrich_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.enrich(lambda x: x, None, max_batch=0)
@@ -0,0 +1,129 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.scheduler import HistoricalScheduler
+from reactivex.subject import Subject
+
+
+def run(items, op):
+    results = []
+    reactivex.from_iterable(items).pipe(op).subscribe(results.append)
+    return [(w.start, w.end, w.items) for w in results]
+
+
+def timestamp(x):
+    return x[0]
+
+
+class TestEventTimeWindow(unittest.TestCase):
+    def test_tumbling(self):
+        items = [(1, "a"), (4, "b"), (11, "c"), (25, "d")]
+        assert run(items, ops.event_time_window(timestamp, 10)) == [
+            (0, 10, [(1, "a"), (4, "b")]),
+            (10, 20, [(11, "c")]),
+            (20, 30, [(25, "d")]),
+        ]
+
+    def test_sliding(self):
+        items = [(1, "a"), (6, "b"), (12, "c")]
+        assert run(items, ops.event_time_window(timestamp, 10, 5)) == [
+            (-5, 5, [(1, "a")]),
+            (0, 10, [(1, "a"), (6, "b")]),
+            (5, 15, [(6, "b"), (12, "c")]),
+            (10, 20, [(12, "c")]),
+        ]
+
+    def test_out_of_order_within_max_delay(self):
+        items = [(1, "a"), (11, "b"), (8, "c"), (16, "d")]
+        assert run(items, ops.event_time_window(timestamp, 10, max_delay=5)) == [
+            (0, 10, [(1, "a"), (8, "c")]),
+            (10, 20, [(11, "b"), (16, "d")]),
+        ]
+
+    def test_allowed_lateness_and_late_observer(self):
+        late = []
+        late_observer = Subject()
+        late_observer.subscribe(late.append)
+
+        items = [(1, "a"), (12, "b"), (3, "c"), (25, "d"), (4, "e")]
+        op = ops.event_time_window(
+            timestamp, 10, allowed_lateness=5, late_observer=late_observer
+        )
+        assert run(items, op) == [
+            (0, 10, [(1, "a")]),
+            (0, 10, [(1, "a"), (3, "c")]),
+            (10, 20, [(12, "b")]),
+            (20, 30, [(25, "d")]),
+        ]
+        assert late == [(4, "e")]
+
+    def test_allowed_lateness_opens_window_once(self):
+        op = ops.event_time_window(timestamp, 10, allowed_lateness=20)
+        assert run([(100, "a"), (85, "b")], op) == [
+            (80, 90, [(85, "b")]),
+            (100, 110, [(100, "a")]),
+        ]
+
+    def test_datetime_timestamps(self):
+        t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        items = [t0, t0 + timedelta(seconds=30), t0 + timedelta(seconds=90)]
+        results = run(items, ops.event_time_window(lambda x: x, timedelta(minutes=1)))
+        assert [len(items) for _, _, items in results] == [2, 1]
+
+    def test_timestamp_mapper_error(self):
+        error = []
+
+        def mapper(x):
+            raise Exception("ex")
+
+        reactivex.of(1).pipe(ops.event_time_window(mapper, 10)).subscribe(
+            on_error=error.append
+        )
+        assert str(error[0]) == "ex"
+
+    def test_replay_on_historical_scheduler(self):
+        scheduler = HistoricalScheduler()
+        source = reactivex.from_iterable([(1, "a"), (4, "b"), (11, "c")])
+        results = []
+        source.pipe(ops.event_time_window(timestamp, 10)).subscribe(
+            lambda w: results.append((w.start, len(w.items))),
+            scheduler=scheduler,
+        )
+        scheduler.start()
+        assert results == [(0, 2), (10, 1)]
+
+    def test_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.event_time_window(timestamp, 0)
+
+
+class TestEventTimeSessionWindow(unittest.TestCase):
+    def test_sessions(self):
+        items = [(1, "a"), (3, "b"), (10, "c"), (12, "d")]
+        assert run(items, ops.event_time_session_window(timestamp, 5)) == [
+            (1, 8, [(1, "a"), (3, "b")]),
+            (10, 17, [(10, "c"), (12, "d")]),
+        ]
+
+    def test_out_of_order_merge(self):
+        items = [(1, "a"), (12, "b"), (7, "c"), (20, "d")]
+        op = ops.event_time_session_window(timestamp, 6, max_delay=6)
+        assert run(items, op) == [
+            (1, 18, [(1, "a"), (7, "c"), (12, "b")]),
+            (20, 26, [(20, "d")]),
+        ]
+
+    def test_late_elements(self):
+        late = []
+        late_observer = Subject()
+        late_observer.subscribe(late.append)
+
+        items = [(1, "a"), (20, "b"), (2, "c")]
+        op = ops.event_time_session_window(timestamp, 5, late_observer=late_observer)
+        assert run(items, op) == [(1, 6, [(1, "a")]), (20, 25, [(20, "b")])]
+        assert late == [(2, "c")]
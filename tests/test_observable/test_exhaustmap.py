@@ -0,0 +1,79 @@
+import unittest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestExhaustMap(unittest.TestCase):
+    def test_exhaust_map(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(300, "a"),
+            on_next(320, "b"),
+            on_next(400, "c"),
+            on_completed(500),
+        )
+        ys = scheduler.create_cold_observable(
+            on_next(10, 1), on_next(50, 2), on_completed(60)
+        )
+
+        def create():
+            return xs.pipe(ops.exhaust_map(lambda x: ys.pipe(ops.map(lambda y: x))))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(310, "a"),
+            on_next(350, "a"),
+            on_next(410, "c"),
+            on_next(450, "c"),
+            on_completed(500),
+        ]
+        assert ys.subscriptions == [subscribe(300, 360), subscribe(400, 460)]
+
+    def test_exhaust_map_waits_for_inner(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(300, 1), on_completed(320))
+        ys = scheduler.create_cold_observable(on_next(10, "a"), on_completed(60))
+
+        results = scheduler.start(lambda: xs.pipe(ops.exhaust_map(lambda x: ys)))
+        assert results.messages == [on_next(310, "a"), on_completed(360)]
+
+    def test_exhaust_map_scalar(self):
+        results = []
+        reactivex.of(1, 2, 3).pipe(
+            ops.exhaust_map(lambda x: reactivex.return_value(x * 10))
+        ).subscribe(results.append)
+        assert results == [10, 20, 30]
+
+    def test_exhaust_map_inner_throws(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(300, 1), on_next(400, 2))
+        ys = scheduler.create_cold_observable(on_next(10, "a"), on_error(20, ex))
+
+        results = scheduler.start(lambda: xs.pipe(ops.exhaust_map(lambda x: ys)))
+        assert results.messages == [on_next(310, "a"), on_error(320, ex)]
+
+    def test_exhaust_map_project_throws(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(300, 1))
+
+        def project(x):
+            raise Exception(ex)
+
+        results = scheduler.start(lambda: xs.pipe(ops.exhaust_map(project)))
+        assert results.messages == [on_error(300, ex)]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -887,6 +887,129 @@ class TestFlatMap(unittest.TestCase):
         assert xs.subscriptions == [subscribe(200, 600)]
         assert 4 == len(inners)
 
+    def test_flat_map_scalar_inline(self):
+        results = []
+
+        def mapper(x):
+            if x == 1:
+                return reactivex.empty()
+            if x == 2:
+                return [x, x]
+            return reactivex.return_value(x)
+
+        reactivex.from_iterable([1, 2, 3]).pipe(ops.flat_map(mapper)).subscribe(
+            results.append, on_completed=lambda: results.append("done")
+        )
+        assert results == [2, 2, 3, "done"]
+
+    def test_flat_map_scalar_inline_waits_for_inners(self):
+        results = []
+        subject = reactivex.subject.Subject()
+
+        def mapper(x):
+            return subject if x == 1 else reactivex.of(x, x)
+
+        reactivex.from_iterable([1, 2]).pipe(ops.flat_map(mapper)).subscribe(
+            results.append, on_completed=lambda: results.append("done")
+        )
+        assert results == [2, 2]
+
+        subject.on_next(1)
+        subject.on_completed()
+        assert results == [2, 2, 1, "done"]
+
+    def test_flat_map_scalar_inline_keeps_trampoline_order(self):
+        results = []
+
+        def mapper(x):
+            if x == 1:
+                return reactivex.from_iterable(iter([x, x * 10]))
+            return reactivex.of(x, x * 10)
+
+        reactivex.of(1, 2, 3).pipe(ops.flat_map(mapper)).subscribe(results.append)
+        assert results == [1, 10, 2, 20, 3, 30]
+
+    def test_flat_map_scalar_inline_keeps_merge_order(self):
+        results = []
+
+        reactivex.merge(
+            reactivex.of(1, 2).pipe(ops.flat_map(reactivex.of)),
+            reactivex.from_iterable(iter(["a", "b"])),
+        ).subscribe(results.append)
+        assert results == ["a", "b", 1, 2]
+
+    def test_flat_map_inline_synchronous_inners(self):
+        results = []
+        source = reactivex.subject.Subject()
+        source.pipe(ops.flat_map(lambda x: reactivex.of(x, -x))).subscribe(
+            results.append, on_completed=lambda: results.append("done")
+        )
+
+        source.on_next(1)
+        assert results == [1, -1]
+        source.on_next(2)
+        assert results == [1, -1, 2, -2]
+        source.on_completed()
+        assert results == [1, -1, 2, -2, "done"]
+
+    def test_flat_map_dispose_with_active_inners(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(500)
+        )
+        inners = []
+
+        def mapper(x):
+            ys = scheduler.create_cold_observable(
+                on_next(5, x), on_next(100, x * 10), on_completed(200)
+            )
+            inners.append(ys)
+            return ys
+
+        results = scheduler.start(lambda: xs.pipe(ops.flat_map(mapper)), disposed=250)
+        assert results.messages == [on_next(215, 1), on_next(225, 2), on_next(235, 3)]
+        assert xs.subscriptions == [subscribe(200, 250)]
+        assert [ys.subscriptions for ys in inners] == [
+            [subscribe(210, 250)],
+            [subscribe(220, 250)],
+            [subscribe(230, 250)],
+        ]
+
+    def test_flat_map_outer_completes_before_inners(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_completed(230)
+        )
+
+        def mapper(x):
+            return scheduler.create_cold_observable(
+                on_next(10 * x, x), on_completed(40 * x)
+            )
+
+        results = scheduler.start(lambda: xs.pipe(ops.flat_map(mapper)))
+        assert results.messages == [
+            on_next(220, 1),
+            on_next(240, 2),
+            on_completed(300),
+        ]
+
+    def test_flat_map_indexed_passes_index(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"), on_next(220, "b"), on_next(230, "c"), on_completed(240)
+        )
+
+        def mapper(x, i):
+            return reactivex.return_value((x, i), scheduler)
+
+        results = scheduler.start(lambda: xs.pipe(ops.flat_map_indexed(mapper)))
+        assert results.messages == [
+            on_next(210, ("a", 0)),
+            on_next(220, ("b", 1)),
+            on_next(230, ("c", 2)),
+            on_completed(240),
+        ]
+
 
 if __name__ == "__main__":
     unittest.main()
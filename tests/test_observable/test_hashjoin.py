@@ -0,0 +1,104 @@
+import unittest
+
+import pytest
+
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+def key(x):
+    return x[0]
+
+
+class TestHashJoin(unittest.TestCase):
+    def test_hash_join(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, ("a", 1)),
+            on_next(220, ("b", 1)),
+            on_next(280, ("a", 2)),
+            on_completed(400),
+        )
+        ys = scheduler.create_hot_observable(
+            on_next(230, ("a", "x")),
+            on_next(240, ("c", "y")),
+            on_next(250, ("b", "z")),
+            on_next(300, ("a", "w")),
+            on_completed(400),
+        )
+
+        def create():
+            return xs.pipe(ops.hash_join(ys, key, key, 50.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(230, (("a", 1), ("a", "x"))),
+            on_next(250, (("b", 1), ("b", "z"))),
+            on_next(300, (("a", 2), ("a", "w"))),
+            on_completed(400),
+        ]
+
+    def test_hash_join_window_expiry(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, ("a", 1)))
+        ys = scheduler.create_hot_observable(
+            on_next(250, ("a", "x")), on_next(270, ("a", "y"))
+        )
+
+        def create():
+            return xs.pipe(ops.hash_join(ys, key, key, 50.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(250, (("a", 1), ("a", "x")))]
+
+    def test_hash_join_completes_when_left_expires(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, ("a", 1)), on_completed(220))
+        ys = scheduler.create_hot_observable(on_next(230, ("a", "x")))
+
+        def create():
+            return xs.pipe(ops.hash_join(ys, key, key, 50.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(230, (("a", 1), ("a", "x"))),
+            on_completed(260),
+        ]
+
+    def test_hash_join_max_items(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, ("a", 1)), on_next(220, ("a", 2))
+        )
+        ys = scheduler.create_hot_observable(on_next(230, ("a", "x")))
+
+        def create():
+            return xs.pipe(ops.hash_join(ys, key, key, 50.0, max_items=1))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(230, (("a", 2), ("a", "x")))]
+
+    def test_hash_join_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, ("a", 1)))
+        ys = scheduler.create_hot_observable(on_error(230, ex))
+
+        def create():
+            return xs.pipe(ops.hash_join(ys, key, key, 50.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(230, ex)]
+
+    def test_hash_join_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.hash_join(None, key, key, 0)
@@ -0,0 +1,145 @@
+import unittest
+
+import pytest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestHedge(unittest.TestCase):
+    def test_hedge_wins(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_completed(300))
+        attempts = [
+            scheduler.create_cold_observable(on_next(100, "slow"), on_completed(100)),
+            scheduler.create_cold_observable(on_next(20, "fast"), on_completed(20)),
+        ]
+        stats = reactivex.HedgeStats()
+
+        def create():
+            return xs.pipe(ops.hedge(lambda x: attempts.pop(0), 30.0, stats=stats))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(260, "fast"), on_completed(300)]
+        assert stats.requests == 1
+        assert stats.hedges == 1
+        assert stats.hedge_wins == 1
+        assert stats.hedge_win_rate == 1.0
+
+    def test_hedge_primary_wins(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_completed(300)
+        )
+        stats = reactivex.HedgeStats()
+
+        def factory(x):
+            return reactivex.timer(20.0).pipe(ops.map(lambda _: x * 10))
+
+        def create():
+            return xs.pipe(ops.hedge(factory, 30.0, stats=stats))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(230, 10),
+            on_next(240, 20),
+            on_completed(300),
+        ]
+        assert stats.requests == 2
+        assert stats.hedges == 0
+        assert stats.hedge_win_rate == 0.0
+
+    def test_hedge_disposes_losers(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_completed(400))
+        attempts = [
+            scheduler.create_cold_observable(on_next(100, "a"), on_completed(100)),
+            scheduler.create_cold_observable(on_next(100, "b"), on_completed(100)),
+            scheduler.create_cold_observable(on_next(20, "c"), on_completed(20)),
+        ]
+        observables = list(attempts)
+
+        def create():
+            return xs.pipe(ops.hedge(lambda x: attempts.pop(0), 30.0, max_hedges=2))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(290, "c"), on_completed(400)]
+        assert observables[0].subscriptions == [subscribe(210, 290)]
+        assert observables[1].subscriptions == [subscribe(240, 290)]
+        assert observables[2].subscriptions == [subscribe(270, 290)]
+
+    def test_hedge_max_hedges(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_completed(500))
+        subscriptions = []
+
+        def factory(x):
+            subscriptions.append(scheduler.clock)
+            return reactivex.timer(100.0)
+
+        def create():
+            return xs.pipe(ops.hedge(factory, 30.0, max_hedges=2))
+
+        results = scheduler.start(create)
+        assert subscriptions == [210, 240, 270]
+        assert results.messages == [on_next(310, 0), on_completed(500)]
+
+    def test_hedge_fails_fast(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_completed(300))
+        attempts = [
+            scheduler.create_cold_observable(on_error(10, ex)),
+            scheduler.create_cold_observable(on_next(10, "b"), on_completed(10)),
+        ]
+
+        def create():
+            return xs.pipe(ops.hedge(lambda x: attempts.pop(0), 30.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(230, "b"), on_completed(300)]
+
+    def test_hedge_all_fail(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_completed(300))
+        attempts = [
+            scheduler.create_cold_observable(on_error(50, "ex1")),
+            scheduler.create_cold_observable(on_error(10, "ex2")),
+        ]
+
+        def create():
+            return xs.pipe(ops.hedge(lambda x: attempts.pop(0), 30.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(260, "ex1")]
+
+    def test_hedge_factory_throws(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_completed(300))
+
+        def factory(x):
+            raise Exception(ex)
+
+        results = scheduler.start(lambda: xs.pipe(ops.hedge(factory, 30.0)))
+        assert results.messages == [on_error(210, ex)]
+
+    def test_hedge_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.hedge(lambda x: reactivex.empty(), -1.0)
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.hedge(lambda x: reactivex.empty(), 1.0, max_hedges=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import threading
+import time
+import unittest
+
+import pytest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.scheduler import ThreadPoolScheduler
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestMapConcurrent(unittest.TestCase):
+    def test_map_concurrent(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(240)
+        )
+
+        def create():
+            return xs.pipe(ops.map_concurrent(lambda x: x * 10, 2))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, 10),
+            on_next(220, 20),
+            on_next(230, 30),
+            on_completed(240),
+        ]
+
+    def test_map_concurrent_mapper_throws(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(240)
+        )
+
+        def mapper(x):
+            if x == 2:
+                raise Exception(ex)
+            return x
+
+        results = scheduler.start(lambda: xs.pipe(ops.map_concurrent(mapper, 2)))
+        assert results.messages == [on_next(210, 1), on_error(220, ex)]
+
+    def test_map_concurrent_ordered_on_thread_pool(self):
+        pool = ThreadPoolScheduler(4)
+        lock = threading.Lock()
+        running = [0]
+        max_running = [0]
+
+        def mapper(x):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.001 * (x % 5))
+            with lock:
+                running[0] -= 1
+            return x * 10
+
+        results = (
+            reactivex.from_iterable(range(40))
+            .pipe(ops.map_concurrent(mapper, 3, scheduler=pool), ops.to_list())
+            .run()
+        )
+        assert results == [x * 10 for x in range(40)]
+        assert max_running[0] <= 3
+
+    def test_map_concurrent_unordered_on_thread_pool(self):
+        pool = ThreadPoolScheduler(4)
+        release = threading.Event()
+
+        def mapper(x):
+            if x == 0:
+                release.wait(5)
+                time.sleep(0.05)
+            elif x == 3:
+                release.set()
+            return x
+
+        results = (
+            reactivex.from_iterable(range(4))
+            .pipe(
+                ops.map_concurrent(mapper, 2, ordered=False, scheduler=pool),
+                ops.to_list(),
+            )
+            .run()
+        )
+        assert results[-1] == 0
+        assert sorted(results) == [0, 1, 2, 3]
+
+    def test_map_concurrent_capacity(self):
+        pool = ThreadPoolScheduler(4)
+        release = threading.Event()
+        started = []
+
+        def mapper(x):
+            started.append(x)
+            if x == 0:
+                release.wait(5)
+            return x
+
+        values = []
+        done = threading.Event()
+        reactivex.from_iterable(range(10)).pipe(
+            ops.map_concurrent(mapper, 2, capacity=3, scheduler=pool)
+        ).subscribe(values.append, on_completed=done.set)
+
+        time.sleep(0.1)
+        assert sorted(started) == [0, 1, 2]
+        release.set()
+        done.wait(5)
+        assert values == list(range(10))
+
+    def test_map_concurrent_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.map_concurrent(lambda x: x, 0)
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.map_concurrent(lambda x: x, 4, capacity=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
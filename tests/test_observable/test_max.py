@@ -1,5 +1,7 @@
 import unittest
 
+import pytest
+
 from reactivex import operators as ops
 from reactivex.testing import ReactiveTest, TestScheduler
 
@@ -213,3 +215,15 @@ class TestMax(unittest.TestCase):
         res = scheduler.start(create=create).messages
 
         assert res == [on_error(220, ex)]
+
+    def test_max_batched_array(self):
+        numpy = pytest.importorskip("numpy")
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, numpy.array([5, 3])),
+            on_next(220, numpy.array([], dtype=int)),
+            on_next(230, numpy.array([4, 2, 6])),
+            on_completed(250),
+        )
+        res = scheduler.start(create=lambda: xs.pipe(ops.max(batched=True)))
+        assert res.messages == [on_next(250, 6), on_completed(250)]
@@ -1,5 +1,7 @@
 import unittest
 
+import pytest
+
 from reactivex import operators as ops
 from reactivex.testing import ReactiveTest, TestScheduler
 
@@ -167,3 +169,18 @@ class TestMin(unittest.TestCase):
 
         res = scheduler.start(create=create).messages
         assert res == [on_error(220, ex)]
+
+    def test_min_batched(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, [5, 3]),
+            on_next(220, []),
+            on_next(230, [4, 2, 6]),
+            on_completed(250),
+        )
+        res = scheduler.start(create=lambda: xs.pipe(ops.min(batched=True)))
+        assert res.messages == [on_next(250, 2), on_completed(250)]
+
+    def test_min_batched_comparer(self):
+        with pytest.raises(ValueError):
+            ops.min(lambda x, y: x - y, batched=True)
@@ -0,0 +1,170 @@
+import unittest
+
+import pytest
+
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestRateLimit(unittest.TestCase):
+    def test_rate_limit(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(211, 2), on_next(212, 3), on_completed(215)
+        )
+
+        results = scheduler.start(lambda: xs.pipe(ops.rate_limit(0.1)))
+        assert results.messages == [
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_completed(230),
+        ]
+
+    def test_rate_limit_burst(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(211, 2),
+            on_next(212, 3),
+            on_next(300, 4),
+            on_next(301, 5),
+            on_completed(350),
+        )
+
+        results = scheduler.start(lambda: xs.pipe(ops.rate_limit(0.1, burst=2)))
+        assert results.messages == [
+            on_next(210, 1),
+            on_next(211, 2),
+            on_next(220, 3),
+            on_next(300, 4),
+            on_next(301, 5),
+            on_completed(350),
+        ]
+
+    def test_rate_limit_drop(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(211, 2),
+            on_next(222, 3),
+            on_next(225, 4),
+            on_completed(240),
+        )
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.1, overflow="drop"))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 1), on_next(222, 3), on_completed(240)]
+
+    def test_rate_limit_max_queue(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(211, 2),
+            on_next(212, 3),
+            on_next(221, 4),
+            on_completed(222),
+        )
+
+        results = scheduler.start(lambda: xs.pipe(ops.rate_limit(0.1, max_queue=1)))
+        assert results.messages == [
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 4),
+            on_completed(230),
+        ]
+
+    def test_rate_limit_default_max_queue(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            *[on_next(210, i) for i in range(1500)], on_completed(220)
+        )
+
+        results = scheduler.start(lambda: xs.pipe(ops.rate_limit(200.0)))
+        values = [m.value.value for m in results.messages[:-1]]
+        assert values == list(range(1001))
+        assert results.messages[-1].value.kind == "C"
+
+    def test_rate_limit_keyed(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(211, "b1"),
+            on_next(212, "a2"),
+            on_next(213, "b2"),
+            on_next(214, "a3"),
+            on_completed(215),
+        )
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.1, key_mapper=lambda x: x[0]))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, "a1"),
+            on_next(211, "b1"),
+            on_next(220, "a2"),
+            on_next(221, "b2"),
+            on_next(230, "a3"),
+            on_completed(230),
+        ]
+
+    def test_rate_limit_prunes_idle_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            *[on_next(210 + i, i) for i in range(200)], on_completed(500)
+        )
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.5, key_mapper=lambda x: x))
+
+        results = scheduler.start(create)
+        assert [m.value.value for m in results.messages[:-1]] == list(range(200))
+        assert results.messages[-1] == on_completed(500)
+
+    def test_rate_limit_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(211, 2), on_error(212, ex)
+        )
+
+        results = scheduler.start(lambda: xs.pipe(ops.rate_limit(0.1)))
+        assert results.messages == [on_next(210, 1), on_error(212, ex)]
+
+    def test_rate_limit_key_mapper_throws(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_completed(220))
+
+        def key_mapper(x):
+            raise Exception(ex)
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.1, key_mapper=key_mapper))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(210, ex)]
+
+    def test_rate_limit_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.rate_limit(0.0)
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.rate_limit(1.0, burst=0)
+        with pytest.raises(ValueError):
+            ops.rate_limit(1.0, overflow="block")
+
+
+if __name__ == "__main__":
+    unittest.main()
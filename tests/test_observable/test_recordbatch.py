@@ -0,0 +1,129 @@
+import subprocess
+import sys
+import unittest
+from array import array
+
+import pytest
+
+import reactivex
+from reactivex import RecordBatch
+from reactivex import operators as ops
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+def make_batch():
+    return RecordBatch(
+        {"sym": ["A", "B", "A", "C"], "px": array("d", [1.0, 2.0, 3.0, 4.0])}
+    )
+
+
+class TestRecordBatch(unittest.TestCase):
+    def test_recordbatch_columns(self):
+        batch = make_batch()
+        assert len(batch) == 4
+        assert "px" in batch
+        assert list(batch["px"]) == [1.0, 2.0, 3.0, 4.0]
+
+    def test_recordbatch_length_mismatch(self):
+        with pytest.raises(ValueError):
+            RecordBatch({"a": [1, 2], "b": [1]})
+
+    def test_recordbatch_from_rows(self):
+        rows = [{"sym": "A", "px": 1.0}, {"sym": "B", "px": 2.0}]
+        batch = RecordBatch.from_rows(rows)
+        assert batch == RecordBatch({"sym": ["A", "B"], "px": [1.0, 2.0]})
+        assert list(batch.rows()) == rows
+
+    def test_recordbatch_filter_keeps_column_type(self):
+        batch = make_batch().filter([True, False, True, False])
+        assert batch["sym"] == ["A", "A"]
+        assert batch["px"] == array("d", [1.0, 3.0])
+
+    def test_recordbatch_partition(self):
+        parts = make_batch().partition("sym")
+        assert list(parts) == ["A", "B", "C"]
+        assert parts["A"] == RecordBatch({"sym": ["A", "A"], "px": [1.0, 3.0]})
+
+    def test_import_does_not_load_numpy(self):
+        code = "import sys, reactivex; print('numpy' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        assert output.strip() == "False"
+
+    def test_pluck_column(self):
+        scheduler = TestScheduler()
+        batch = make_batch()
+        xs = scheduler.create_hot_observable(on_next(210, batch), on_completed(250))
+
+        results = scheduler.start(lambda: xs.pipe(ops.pluck_column("sym")))
+        assert results.messages == [
+            on_next(210, ["A", "B", "A", "C"]),
+            on_completed(250),
+        ]
+
+    def test_filter_batch(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, make_batch()),
+            on_next(220, RecordBatch({"sym": ["D"], "px": [0.5]})),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(
+                ops.filter_batch(lambda b: [px > 2 for px in b["px"]]),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, RecordBatch({"sym": ["A", "C"], "px": [3.0, 4.0]})),
+            on_completed(250),
+        ]
+
+    def test_filter_batch_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, make_batch()))
+
+        def predicate(batch):
+            raise Exception(ex)
+
+        results = scheduler.start(lambda: xs.pipe(ops.filter_batch(predicate)))
+        assert results.messages == [on_error(210, ex)]
+
+    def test_map_batch(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, make_batch()))
+
+        def create():
+            return xs.pipe(
+                ops.map_batch(lambda b: {"px2": [px * 2 for px in b["px"]]}),
+                ops.pluck_column("px2"),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, [2.0, 4.0, 6.0, 8.0])]
+
+    def test_group_by_column(self):
+        batches = [
+            make_batch(),
+            RecordBatch({"sym": ["B", "B"], "px": [5.0, 6.0]}),
+        ]
+        result = {}
+
+        def on_group(group):
+            result[group.key] = []
+            group.pipe(ops.map(len)).subscribe(result[group.key].append)
+
+        reactivex.from_iterable(batches).pipe(
+            ops.group_by_column("sym"),
+        ).subscribe(on_group)
+
+        assert result == {"A": [2], "B": [1, 2], "C": [1]}
@@ -193,6 +193,20 @@ class TestRetry(unittest.TestCase):
         with pytest.raises(Exception):
             xss.subscribe()
 
+    def test_retry_observable_retry_count_many_synchronous(self):
+        subscriptions = []
+
+        def subscribe(observer, scheduler=None):
+            subscriptions.append(True)
+            observer.on_error(RxException("ex"))
+
+        errors = []
+        reactivex.create(subscribe).pipe(ops.retry(5000)).subscribe(
+            on_error=errors.append
+        )
+        assert len(subscriptions) == 5000
+        assert len(errors) == 1
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,160 @@
+import unittest
+
+import pytest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestRetryWithBackoff(unittest.TestCase):
+    def test_retry_with_backoff_max_attempts(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_cold_observable(on_next(10, 1), on_error(20, ex))
+
+        def create():
+            return xs.pipe(ops.retry_with_backoff(3, 10.0, 100.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, 1),
+            on_next(240, 1),
+            on_next(280, 1),
+            on_error(290, ex),
+        ]
+        assert xs.subscriptions == [
+            subscribe(200, 220),
+            subscribe(230, 250),
+            subscribe(270, 290),
+        ]
+
+    def test_retry_with_backoff_max_delay(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_cold_observable(on_error(10, ex))
+
+        def create():
+            return xs.pipe(ops.retry_with_backoff(5, 10.0, 15.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(305, ex)]
+        assert xs.subscriptions == [
+            subscribe(200, 210),
+            subscribe(220, 230),
+            subscribe(245, 255),
+            subscribe(270, 280),
+            subscribe(295, 305),
+        ]
+
+    def test_retry_with_backoff_completes(self):
+        scheduler = TestScheduler()
+        attempts = [0]
+
+        def factory(scheduler_):
+            attempts[0] += 1
+            if attempts[0] < 3:
+                return reactivex.throw(Exception("ex"))
+            return reactivex.of(1, 2)
+
+        def create():
+            return reactivex.defer(factory).pipe(ops.retry_with_backoff(base=10.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(230, 1),
+            on_next(230, 2),
+            on_completed(230),
+        ]
+
+    def test_retry_with_backoff_retry_on(self):
+        scheduler = TestScheduler()
+        ex = ValueError("ex")
+        xs = scheduler.create_cold_observable(on_error(10, ex))
+
+        def create():
+            return xs.pipe(ops.retry_with_backoff(5, 10.0, retry_on=KeyError))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(210, ex)]
+        assert xs.subscriptions == [subscribe(200, 210)]
+
+    def test_retry_with_backoff_retry_on_predicate(self):
+        scheduler = TestScheduler()
+        ex = ValueError("ex")
+        xs = scheduler.create_cold_observable(on_error(10, ex))
+
+        def create():
+            return xs.pipe(
+                ops.retry_with_backoff(2, 10.0, retry_on=lambda e: e is ex)
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(230, ex)]
+
+    def test_retry_with_backoff_jitter(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_cold_observable(on_error(10, "ex"))
+
+        def create():
+            return xs.pipe(ops.retry_with_backoff(2, 100.0, 1000.0, jitter=0.5))
+
+        scheduler.start(create)
+        start = xs.subscriptions[1].subscribe
+        assert 260 <= start <= 310
+
+    def test_retry_with_backoff_dispose(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_cold_observable(on_next(10, 1), on_error(20, "ex"))
+
+        def create():
+            return xs.pipe(ops.retry_with_backoff(base=100.0, max_delay=1000.0))
+
+        results = scheduler.start(create, disposed=400)
+        assert results.messages == [on_next(210, 1), on_next(330, 1)]
+        assert xs.subscriptions == [subscribe(200, 220), subscribe(320, 340)]
+
+    def test_retry_with_backoff_budget(self):
+        scheduler = TestScheduler()
+        budget = reactivex.RetryBudget(2, 0.01)
+        xs = scheduler.create_cold_observable(on_error(10, "ex"))
+
+        def create():
+            return reactivex.merge(
+                xs.pipe(ops.retry_with_backoff(3, 10.0, budget=budget)),
+                xs.pipe(ops.retry_with_backoff(3, 10.0, budget=budget)),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(230, "ex")]
+        # Two retries in total before the budget is exhausted
+        assert len(xs.subscriptions) == 4
+
+    def test_retry_budget_refill(self):
+        budget = reactivex.RetryBudget(2, 0.5)
+        assert budget.try_acquire(0.0)
+        assert budget.try_acquire(0.0)
+        assert not budget.try_acquire(1.0)
+        assert budget.try_acquire(2.0)
+        assert budget.tokens(100.0) == 2
+
+    def test_retry_with_backoff_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.retry_with_backoff(0)
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.retry_with_backoff(jitter=2.0)
+        with pytest.raises(ArgumentOutOfRangeException):
+            reactivex.RetryBudget(0, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import random
+import statistics
+import unittest
+from itertools import islice
+
+import pytest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+def rolling_list(values, *args, **kw):
+    result = []
+    reactivex.from_iterable(values).pipe(ops.rolling(*args, **kw)).subscribe(
+        result.append
+    )
+    return result
+
+
+class TestRolling(unittest.TestCase):
+    def test_rolling_mean_count(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(220, 4),
+            on_next(230, 6),
+            on_next(240, 8),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(ops.rolling(2))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, 2.0),
+            on_next(220, 3.0),
+            on_next(230, 5.0),
+            on_next(240, 7.0),
+            on_completed(250),
+        ]
+        assert xs.subscriptions == [subscribe(200, 250)]
+
+    def test_rolling_sum_time(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(240, 3),
+            on_next(300, 4),
+            on_completed(350),
+        )
+
+        def create():
+            return xs.pipe(ops.rolling(30.0, "sum", scheduler=scheduler))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, 1),
+            on_next(220, 3),
+            on_next(240, 5),
+            on_next(300, 4),
+            on_completed(350),
+        ]
+
+    def test_rolling_min_max(self):
+        values = [random.randint(0, 100) for _ in range(500)]
+        expected_min = [min(islice(values, max(0, i - 9), i + 1)) for i in range(500)]
+        expected_max = [max(islice(values, max(0, i - 9), i + 1)) for i in range(500)]
+
+        assert rolling_list(values, 10, "min") == expected_min
+        assert rolling_list(values, 10, "max") == expected_max
+
+    def test_rolling_variance(self):
+        values = [random.random() for _ in range(200)]
+        expected = [
+            statistics.pvariance(islice(values, max(0, i - 19), i + 1))
+            for i in range(200)
+        ]
+
+        results = rolling_list(values, 20, "var")
+        assert results == pytest.approx(expected)
+        results = rolling_list(values, 20, "std")
+        assert results == pytest.approx([v**0.5 for v in expected])
+
+    def test_rolling_key_mapper(self):
+        values = [{"price": 1}, {"price": 3}, {"price": 5}]
+
+        assert rolling_list(values, 2, "sum", lambda x: x["price"]) == [1, 4, 8]
+
+    def test_rolling_key_mapper_throws(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_completed(250))
+
+        def mapper(x):
+            raise Exception(ex)
+
+        def create():
+            return xs.pipe(ops.rolling(2, key_mapper=mapper))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(210, ex)]
+
+    def test_rolling_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.rolling(0)
+
+        with pytest.raises(ValueError):
+            ops.rolling(2, "median")
@@ -2,6 +2,7 @@ import unittest
 
 import reactivex
 from reactivex import operators as ops
+from reactivex.operators._sample import _shared_ticks
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -95,3 +96,70 @@ class TestSample(unittest.TestCase):
 
         results = scheduler.start(create)
         assert results.messages == []
+
+    def test_sample_shared_regular(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(230, 3),
+            on_next(260, 4),
+            on_next(300, 5),
+            on_next(350, 6),
+            on_next(380, 7),
+            on_completed(390),
+        )
+
+        def create():
+            return xs.pipe(ops.sample(50, shared=True))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(250, 3),
+            on_next(300, 5),
+            on_next(350, 6),
+            on_next(400, 7),
+            on_completed(400),
+        ]
+
+    def test_sample_shared_aligned(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(270, 2),
+            on_next(330, 3),
+            on_completed(360),
+        )
+        first = scheduler.create_observer()
+        second = scheduler.create_observer()
+        sampled = xs.pipe(ops.sample(50, scheduler, shared=True))
+
+        scheduler.schedule_absolute(200, lambda sc, st: sampled.subscribe(first))
+        scheduler.schedule_absolute(220, lambda sc, st: sampled.subscribe(second))
+        scheduler.start()
+
+        assert first.messages == [
+            on_next(250, 1),
+            on_next(300, 2),
+            on_next(350, 3),
+            on_completed(400),
+        ]
+        assert second.messages == [
+            on_next(300, 2),
+            on_next(350, 3),
+            on_completed(400),
+        ]
+
+    def test_sample_shared_forgets_unused_period(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1))
+        sampled = xs.pipe(ops.sample(50, scheduler, shared=True))
+
+        first = sampled.subscribe(scheduler.create_observer())
+        second = sampled.subscribe(scheduler.create_observer())
+        assert list(_shared_ticks[scheduler]) == [50.0]
+
+        first.dispose()
+        assert list(_shared_ticks[scheduler]) == [50.0]
+        second.dispose()
+        assert scheduler not in _shared_ticks
@@ -0,0 +1,97 @@
+import unittest
+
+import pytest
+
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestSessionWindow(unittest.TestCase):
+    def test_session_window(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(230, 2),
+            on_next(300, 3),
+            on_next(340, 4),
+            on_completed(400),
+        )
+
+        results = scheduler.start(lambda: xs.pipe(ops.session_window(50.0)))
+        assert results.messages == [
+            on_next(280, [1, 2]),
+            on_next(390, [3, 4]),
+            on_completed(400),
+        ]
+
+    def test_session_window_keyed(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(250, "a2"),
+            on_next(280, "b2"),
+            on_next(290, "a3"),
+            on_completed(500),
+        )
+
+        def create():
+            return xs.pipe(ops.session_window(50.0, lambda x: x[0]))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(270, ["b1"]),
+            on_next(330, ["b2"]),
+            on_next(340, ["a1", "a2", "a3"]),
+            on_completed(500),
+        ]
+
+    def test_session_window_resolution(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"),
+            on_next(215, "b"),
+            on_next(225, "c"),
+            on_completed(500),
+        )
+
+        def create():
+            return xs.pipe(ops.session_window(20.0, lambda x: x, resolution=50.0))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(250, ["a"]),
+            on_next(250, ["b"]),
+            on_next(250, ["c"]),
+            on_completed(500),
+        ]
+
+    def test_session_window_flush_on_completed(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_completed(230)
+        )
+
+        results = scheduler.start(lambda: xs.pipe(ops.session_window(50.0)))
+        assert results.messages == [on_next(230, [1, 2]), on_completed(230)]
+
+    def test_session_window_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_error(220, ex))
+
+        results = scheduler.start(lambda: xs.pipe(ops.session_window(50.0)))
+        assert results.messages == [on_error(220, ex)]
+
+    def test_session_window_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.session_window(0)
@@ -0,0 +1,132 @@
+import random
+import unittest
+
+import pytest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+def run(source, op):
+    results = []
+    source.pipe(op).subscribe(results.append)
+    return results
+
+
+class TestTopK(unittest.TestCase):
+    def test_top_k(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 3),
+            on_next(220, 7),
+            on_next(230, 1),
+            on_next(240, 9),
+            on_next(250, 5),
+            on_completed(300),
+        )
+
+        results = scheduler.start(lambda: xs.pipe(ops.top_k(3)))
+        assert results.messages == [on_next(300, [9, 7, 5]), on_completed(300)]
+
+    def test_top_k_key_mapper_ties(self):
+        items = [("a", 1), ("b", 2), ("c", 2), ("d", 2)]
+        results = run(reactivex.from_iterable(items), ops.top_k(2, lambda x: x[1]))
+        assert results == [[("b", 2), ("c", 2)]]
+
+    def test_top_k_interval(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 3),
+            on_next(220, 7),
+            on_next(260, 1),
+            on_next(270, 2),
+            on_completed(320),
+        )
+
+        results = scheduler.start(lambda: xs.pipe(ops.top_k(1, interval=50)))
+        assert results.messages == [
+            on_next(250, [7]),
+            on_next(300, [2]),
+            on_next(320, []),
+            on_completed(320),
+        ]
+
+    def test_top_k_key_mapper_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_completed(300))
+
+        def key_mapper(x):
+            raise Exception(ex)
+
+        results = scheduler.start(lambda: xs.pipe(ops.top_k(1, key_mapper)))
+        assert results.messages == [on_error(210, ex)]
+
+    def test_top_k_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.top_k(0)
+
+
+class TestQuantiles(unittest.TestCase):
+    def test_quantiles_exact(self):
+        results = run(reactivex.range(1, 101), ops.quantiles([0.0, 0.5, 0.9, 1.0]))
+        assert results == [[1, 50, 90, 100]]
+
+    def test_quantiles_empty(self):
+        assert run(reactivex.empty(), ops.quantiles([0.5])) == [[None]]
+
+    def test_quantiles_approx(self):
+        values = list(range(100000))
+        random.Random(1).shuffle(values)
+
+        [[median, p99]] = run(
+            reactivex.from_iterable(values), ops.quantiles([0.5, 0.99])
+        )
+        assert abs(median - 50000) < 2000
+        assert abs(p99 - 99000) < 2000
+
+    def test_quantiles_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.quantiles([1.5])
+
+
+class TestApproxDistinctCount(unittest.TestCase):
+    def test_approx_distinct_count_small(self):
+        source = reactivex.from_iterable([1, 2, 2, 3, 3, 3])
+        assert run(source, ops.approx_distinct_count()) == [3]
+
+    def test_approx_distinct_count_large(self):
+        source = reactivex.range(100000).pipe(ops.map(str))
+        [estimate] = run(source, ops.approx_distinct_count())
+        assert abs(estimate - 100000) < 3000
+
+    def test_approx_distinct_count_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.approx_distinct_count(precision=2)
+
+
+class TestHeavyHitters(unittest.TestCase):
+    def test_heavy_hitters(self):
+        rnd = random.Random(1)
+        items = ["hot"] * 2000 + ["warm"] * 1000 + [rnd.random() for _ in range(5000)]
+        rnd.shuffle(items)
+
+        [result] = run(reactivex.from_iterable(items), ops.heavy_hitters(2))
+        assert [item for item, _ in result] == ["hot", "warm"]
+        assert result[0][1] >= 2000
+        assert result[1][1] >= 1000
+
+    def test_heavy_hitters_late_riser(self):
+        items = ["a"] * 5 + ["b"] * 3 + ["a"] * 5 + ["c"] * 20
+        [result] = run(reactivex.from_iterable(items), ops.heavy_hitters(2))
+        assert result == [("c", 20), ("a", 10)]
@@ -1,6 +1,9 @@
 import unittest
 
+import pytest
+
 from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -294,3 +297,7 @@ class TestSkipLast(unittest.TestCase):
             on_next(590, 6),
         ]
         assert xs.subscriptions == [subscribe(200, 1000)]
+
+    def test_skip_last_negative_count(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.skip_last(-1)
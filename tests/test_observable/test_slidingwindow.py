@@ -0,0 +1,100 @@
+import unittest
+
+import pytest
+
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestSlidingWindow(unittest.TestCase):
+    def test_sliding_window_basic(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 0),
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_next(250, 5),
+            on_completed(300),
+        )
+
+        def create():
+            return xs.pipe(ops.sliding_window(3))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(230, (1, 2, 3)),
+            on_next(240, (2, 3, 4)),
+            on_next(250, (3, 4, 5)),
+            on_completed(300),
+        ]
+        assert xs.subscriptions == [subscribe(200, 300)]
+
+    def test_sliding_window_step(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_next(250, 5),
+            on_next(260, 6),
+            on_completed(300),
+        )
+
+        def create():
+            return xs.pipe(ops.sliding_window(2, 2))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(220, (1, 2)),
+            on_next(240, (3, 4)),
+            on_next(260, (5, 6)),
+            on_completed(300),
+        ]
+
+    def test_sliding_window_too_short(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_completed(300),
+        )
+
+        def create():
+            return xs.pipe(ops.sliding_window(3))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_completed(300)]
+
+    def test_sliding_window_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_error(230, ex),
+        )
+
+        def create():
+            return xs.pipe(ops.sliding_window(2))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(220, (1, 2)), on_error(230, ex)]
+
+    def test_sliding_window_invalid(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.sliding_window(0)
+
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.sliding_window(3, 0)
@@ -1,5 +1,7 @@
 import unittest
 
+import pytest
+
 from reactivex import operators as ops
 from reactivex.testing import ReactiveTest, TestScheduler
 
@@ -88,3 +90,34 @@ class TestSum(unittest.TestCase):
 
         assert res.messages == [on_next(240, 6), on_completed(240)]
         assert xs.subscriptions == [subscribe(200, 240)]
+
+    def test_sum_batched(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, [1]),
+            on_next(210, [2, 3]),
+            on_next(220, []),
+            on_next(230, [4, 5, 6]),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(ops.sum(batched=True))
+
+        res = scheduler.start(create=create).messages
+        assert res == [on_next(250, 20), on_completed(250)]
+
+    def test_sum_batched_array(self):
+        numpy = pytest.importorskip("numpy")
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, numpy.array([2, 3])),
+            on_next(230, numpy.array([4, 5, 6])),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(ops.sum(batched=True))
+
+        res = scheduler.start(create=create).messages
+        assert res == [on_next(250, 20), on_completed(250)]
@@ -1,6 +1,10 @@
+import threading
 import unittest
 
+import reactivex
 from reactivex import operators as ops
+from reactivex.disposable import Disposable
+from reactivex.subject import Subject
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -206,3 +210,43 @@ class TestSwitch(unittest.TestCase):
             on_next(520, 106),
             on_completed(540),
         ]
+
+    def test_switch_latest_disposes_before_subscribing(self):
+        log = []
+
+        def inner(name):
+            def subscribe(observer, scheduler=None):
+                log.append(("subscribe", name))
+                return Disposable(lambda: log.append(("dispose", name)))
+
+            return reactivex.create(subscribe)
+
+        outer = Subject()
+        outer.pipe(ops.switch_latest()).subscribe()
+        outer.on_next(inner("a"))
+        outer.on_next(inner("b"))
+        assert log == [("subscribe", "a"), ("dispose", "a"), ("subscribe", "b")]
+
+    def test_switch_latest_mutes_inner_on_other_thread(self):
+        outer = Subject()
+        first = Subject()
+        results = []
+        started = threading.Event()
+        stop = threading.Event()
+
+        def produce():
+            while not stop.is_set():
+                first.on_next("a")
+                started.set()
+
+        outer.pipe(ops.switch_latest()).subscribe(results.append)
+        outer.on_next(first)
+        thread = threading.Thread(target=produce)
+        thread.start()
+        started.wait(5)
+        outer.on_next(reactivex.never())
+        results.append("switched")
+        stop.set()
+        thread.join()
+
+        assert results[-1] == "switched"
@@ -1,7 +1,9 @@
 import unittest
 
+import reactivex
 from reactivex import interval
 from reactivex import operators as ops
+from reactivex.subject import Subject
 from reactivex.testing import ReactiveTest, TestScheduler
 from reactivex.testing.marbles import marbles_testing
 from reactivex.testing.subscription import Subscription
@@ -183,3 +185,17 @@ class TestSwitchMap(unittest.TestCase):
             expected = exp("    -----1---1-2-3--1--2", None, None)
             result = start(xs.pipe(ops.switch_map()))
             assert result == expected
+
+    def test_switch_map_scalar_inline(self):
+        results = []
+        subject = Subject()
+
+        def mapper(x):
+            return subject if x == 1 else reactivex.of(x, x)
+
+        reactivex.from_iterable([1, 2]).pipe(ops.switch_map(mapper)).subscribe(
+            results.append, on_completed=lambda: results.append("done")
+        )
+        subject.on_next(1)
+        assert results == [2, 2, "done"]
+        assert not subject.observers
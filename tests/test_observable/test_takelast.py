@@ -1,6 +1,9 @@
 import unittest
 
+import pytest
+
 from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -223,3 +226,7 @@ class TestTakeLast(unittest.TestCase):
 
         assert results.messages == []
         assert xs.subscriptions == [subscribe(200, 1000)]
+
+    def test_take_last_negative_count(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.take_last(-1)
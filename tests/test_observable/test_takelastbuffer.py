@@ -1,6 +1,9 @@
 import unittest
 
+import pytest
+
 from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -184,6 +187,10 @@ class TestTakeLastBuffer(unittest.TestCase):
         assert [on_next(650, predicate), on_completed(650)] == res.messages
         assert xs.subscriptions == [subscribe(200, 650)]
 
+    def test_take_last_buffer_negative_count(self):
+        with pytest.raises(ArgumentOutOfRangeException):
+            ops.take_last_buffer(-1)
+
 
 # def test_Take_last_buffer_Three_Error():
 #     var ex, res, scheduler, xs
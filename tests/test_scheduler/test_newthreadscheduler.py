@@ -102,3 +102,21 @@ class TestNewThreadScheduler(unittest.TestCase):
         sleep(0.4)
         disp.dispose()
         assert 0 <= counter < 4
+
+    def test_new_thread_schedule_periodic_skip(self):
+        scheduler = NewThreadScheduler()
+        gate = threading.Event()
+        period = 0.05
+        ticks = []
+
+        def action(state):
+            ticks.append(state)
+            if len(ticks) == 1:
+                sleep(period * 3.5)
+            elif len(ticks) == 3:
+                gate.set()
+
+        task = scheduler.schedule_periodic(period, action, missed="skip")
+        gate.wait(5)
+        task.dispose()
+        assert task.skipped >= 2
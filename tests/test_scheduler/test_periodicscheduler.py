@@ -0,0 +1,76 @@
+import unittest
+
+import pytest
+
+from reactivex.scheduler.periodicscheduler import (
+    CATCH_UP,
+    COALESCE,
+    SKIP,
+    PeriodicTask,
+)
+from reactivex.testing import TestScheduler
+
+
+class TestPeriodicTask(unittest.TestCase):
+    def test_periodic_task_on_time(self):
+        task = PeriodicTask(10.0, lambda state: state + 1, 0)
+
+        assert task.due == 10.0
+        assert task.run(lambda: 10.0) == 20.0
+        assert task.run(lambda: 21.0) == 30.0
+        assert task.state == 2
+        assert task.ticks == 2
+        assert task.last_jitter == 1.0
+        assert task.max_jitter == 1.0
+        assert task.mean_jitter == 0.5
+
+    def test_periodic_task_skip(self):
+        task = PeriodicTask(10.0, lambda _: None, missed=SKIP)
+
+        assert task.run(lambda: 35.0) == 40.0
+        assert task.skipped == 2
+
+    def test_periodic_task_catch_up(self):
+        task = PeriodicTask(10.0, lambda _: None, missed=CATCH_UP)
+
+        assert task.run(lambda: 35.0) == 20.0
+        assert task.run(lambda: 35.0) == 30.0
+        assert task.run(lambda: 35.0) == 40.0
+        assert task.skipped == 0
+
+    def test_periodic_task_coalesce(self):
+        task = PeriodicTask(10.0, lambda _: None, missed=COALESCE)
+
+        assert task.run(lambda: 35.0) == 30.0
+        assert task.run(lambda: 35.0) == 40.0
+        assert task.skipped == 1
+
+    def test_periodic_task_unknown_policy(self):
+        with pytest.raises(ValueError):
+            PeriodicTask(10.0, lambda _: None, missed="later")
+
+    def test_periodic_task_error_disposes(self):
+        def action(_):
+            raise ValueError()
+
+        task = PeriodicTask(10.0, action)
+        with pytest.raises(ValueError):
+            task.run(lambda: 10.0)
+        assert task.is_disposed
+
+
+class TestPeriodicScheduler(unittest.TestCase):
+    def test_schedule_periodic_no_drift(self):
+        scheduler = TestScheduler()
+        times = []
+
+        def action(state):
+            times.append(scheduler.clock)
+            scheduler.sleep(30)
+
+        disp = scheduler.schedule_periodic(100, action)
+        scheduler.schedule_absolute(450, lambda sc, st: disp.dispose())
+        scheduler.start()
+
+        assert times == [100.0, 200.0, 300.0, 400.0]
+        assert disp.max_jitter == 0.0
@@ -100,3 +100,69 @@ class TestTimeoutScheduler(unittest.TestCase):
 
         sleep(0.1)
         assert ran is False
+
+    def test_timeout_schedule_periodic(self):
+        scheduler = TimeoutScheduler()
+        gate = threading.Semaphore(0)
+        period = 0.05
+        counter = 3
+
+        def action(state):
+            nonlocal counter
+            if state:
+                counter -= 1
+                if not counter:
+                    gate.release()
+                return state - 1
+
+        disp = scheduler.schedule_periodic(period, action, counter)
+        gate.acquire()
+        disp.dispose()
+        assert counter == 0
+        assert disp.ticks == 3
+        assert disp.max_jitter >= disp.mean_jitter >= 0.0
+
+    def test_timeout_schedule_periodic_slow_action(self):
+        scheduler = TimeoutScheduler()
+        ticks = []
+
+        def slow(state):
+            sleep(0.5)
+
+        def fast(state):
+            ticks.append(state)
+
+        disposables = [
+            scheduler.schedule_periodic(0.05, slow),
+            scheduler.schedule_periodic(0.05, fast),
+        ]
+        sleep(0.6)
+        for disp in disposables:
+            disp.dispose()
+
+        assert len(ticks) >= 5
+
+    def test_timeout_schedule_periodic_dispose_removes_tasks(self):
+        scheduler = TimeoutScheduler()
+        tasks = [
+            scheduler.schedule_periodic(60.0, lambda state: None) for _ in range(20)
+        ]
+        for task in tasks:
+            task.dispose()
+
+        queued = [item[2] for item in TimeoutScheduler._driver._queue]
+        assert not any(task in queued for task in tasks)
+
+    def test_timeout_schedule_periodic_cancel(self):
+        scheduler = TimeoutScheduler()
+        ran = False
+
+        def action(state):
+            nonlocal ran
+            ran = True
+
+        disp = scheduler.schedule_periodic(0.1, action)
+        disp.dispose()
+
+        sleep(0.2)
+        assert ran is False